@@ -0,0 +1,43 @@
+"""
+Support vector count, prediction latency and accuracy before and after reduced-set compression.
+
+Fits an RBF `SVM` on --train-rows noisy synthetic rows with the same number of features as the
+preprocessed Titanic matrix, then runs `SupportVectorCompressor` against --rows held-out rows
+for the --ratios candidate sizes and the accuracy --tolerance.
+
+Usage:
+    python -m benchmarks.bench_compression --train-rows 10000 --rows 20000 --ratios 0.02 0.05 0.1 0.25
+"""
+
+import argparse
+import json
+from sklearn.datasets import make_classification
+from sklearn.preprocessing import StandardScaler
+from ml.models.svm import SVM
+from ml.models.compression import SupportVectorCompressor
+
+N_FEATURES = 7
+
+
+def bench(train_rows, n_rows, ratios, tolerance, random_state=0):
+    x, y = make_classification(n_samples=train_rows + n_rows, n_features=N_FEATURES, n_informative=5, flip_y=0.1,
+                               random_state=random_state)
+    x = StandardScaler().fit_transform(x)
+    svm = SVM().fit(x[:train_rows], y[:train_rows])
+    _, report = SupportVectorCompressor(ratios, tolerance).compress(svm, x[train_rows:], y[train_rows:])
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark reduced-set support vector compression.")
+    parser.add_argument("--train-rows", type=int, default=10000)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--ratios", type=float, nargs="+", default=[0.02, 0.05, 0.1, 0.25])
+    parser.add_argument("--tolerance", type=float, default=0.005)
+    args = parser.parse_args()
+
+    print(json.dumps(bench(args.train_rows, args.rows, args.ratios, args.tolerance), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Accuracy and fit-time tradeoff of warm-started incremental retraining versus full retraining.
+
+Synthesizes a noisy binary problem with the same number of features as the preprocessed Titanic
+matrix, fits an initial `SVM` on --initial-rows rows, then simulates --days daily appends of
+--daily-rows labeled rows. Each day the full model is refit on every row seen so far while the
+incremental model is refit with `SVM.fit_incremental` (its support vectors plus the new rows only),
+with a full refit every --full-refit-every days. Both are scored on the same holdout set.
+
+Usage:
+    python -m benchmarks.bench_incremental --initial-rows 20000 --daily-rows 2000 --days 7
+"""
+
+import argparse
+import json
+import time
+from sklearn.datasets import make_classification
+from sklearn.preprocessing import StandardScaler
+from ml.models.svm import SVM
+
+N_FEATURES = 7
+
+
+def timed_fit(fit, *args):
+    start = time.perf_counter()
+    fit(*args)
+    return time.perf_counter() - start
+
+
+def bench(initial_rows, daily_rows, days, full_refit_every, holdout_rows=5000, random_state=0):
+    n_rows = initial_rows + days * daily_rows + holdout_rows
+    x, y = make_classification(n_samples=n_rows, n_features=N_FEATURES, n_informative=5, flip_y=0.1,
+                               random_state=random_state)
+    scaler = StandardScaler().fit(x[:initial_rows])
+    x = scaler.transform(x)
+    x_holdout, y_holdout = x[-holdout_rows:], y[-holdout_rows:]
+
+    full, incremental = SVM(), SVM()
+    full.fit(x[:initial_rows], y[:initial_rows])
+    incremental.fit(x[:initial_rows], y[:initial_rows])
+    results = []
+    for day in range(1, days + 1):
+        seen = initial_rows + day * daily_rows
+        x_new, y_new = x[seen - daily_rows:seen], y[seen - daily_rows:seen]
+        full_seconds = timed_fit(full.fit, x[:seen], y[:seen])
+        if day % full_refit_every == 0:
+            incremental_seconds = timed_fit(incremental.fit, x[:seen], y[:seen])
+        else:
+            incremental_seconds = timed_fit(incremental.fit_incremental, x_new, y_new)
+        results.append({
+            "day": day,
+            "rows_seen": seen,
+            "full_refit": day % full_refit_every == 0,
+            "full_fit_seconds": round(full_seconds, 4),
+            "full_accuracy": round(float(full.model.score(x_holdout, y_holdout)), 4),
+            "incremental_fit_seconds": round(incremental_seconds, 4),
+            "incremental_accuracy": round(float(incremental.model.score(x_holdout, y_holdout)), 4),
+            "incremental_support_vectors": int(incremental.model.support_.shape[0]),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark incremental vs full SVM retraining.")
+    parser.add_argument("--initial-rows", type=int, default=20000)
+    parser.add_argument("--daily-rows", type=int, default=2000)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--full-refit-every", type=int, default=7)
+    args = parser.parse_args()
+
+    results = bench(args.initial_rows, args.daily_rows, args.days, args.full_refit_every)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Accuracy and fit-time benchmark of the exact RBF `SVM` versus `KernelApproxSVM`.
+
+Synthesizes a noisy binary problem with the same number of features as the preprocessed
+Titanic matrix at several row counts, then reports holdout accuracy and fit time for each engine.
+The exact kernel is skipped above --max-exact-rows since its cost grows quadratically-to-cubically.
+
+Usage:
+    python -m benchmarks.bench_kernel_approx --sizes 1000 10000 100000 --max-exact-rows 20000
+"""
+
+import argparse
+import json
+import time
+from sklearn.datasets import make_classification
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+from ml.models.svm import SVM
+from ml.models.kernel_approx import KernelApproxSVM
+
+N_FEATURES = 7
+
+
+def engines():
+    return {
+        "svc": lambda: SVM(),
+        "nystroem+linear-svc": lambda: KernelApproxSVM(approximation="nystroem", solver="linear-svc"),
+        "nystroem+sgd": lambda: KernelApproxSVM(approximation="nystroem", solver="sgd"),
+        "rff+sgd": lambda: KernelApproxSVM(approximation="rff", solver="sgd"),
+    }
+
+
+def bench(n_rows, max_exact_rows, random_state=0):
+    x, y = make_classification(n_samples=n_rows, n_features=N_FEATURES, n_informative=5, flip_y=0.1,
+                               random_state=random_state)
+    x_train, x_test, y_train, y_test = train_test_split(x, y, test_size=0.2, random_state=random_state)
+    scaler = StandardScaler()
+    x_train, x_test = scaler.fit_transform(x_train), scaler.transform(x_test)
+
+    results = []
+    for name, build in engines().items():
+        if name == "svc" and n_rows > max_exact_rows:
+            continue
+        svm = build()
+        start = time.perf_counter()
+        svm.fit(x_train, y_train)
+        fit_seconds = time.perf_counter() - start
+        results.append({
+            "rows": n_rows,
+            "engine": name,
+            "fit_seconds": round(fit_seconds, 4),
+            "accuracy": round(float(svm.model.score(x_test, y_test)), 4),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark exact vs approximate RBF SVM engines.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--max-exact-rows", type=int, default=50000)
+    args = parser.parse_args()
+
+    results = [row for n_rows in args.sizes for row in bench(n_rows, args.max_exact_rows)]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Throughput of the blocked NumPy decision function (`NumpyPredictor`) against `SVC.predict`.
+
+Fits an RBF `SVM` on --train-rows synthetic rows with the same number of features as the
+preprocessed Titanic matrix, then scores --rows rows with libsvm and with `NumpyPredictor` in
+float64 and float32 for each --block-sizes value, counting the labels that differ from libsvm.
+
+Usage:
+    python -m benchmarks.bench_numpy_predict --train-rows 20000 --rows 200000 --block-sizes 256 1024 4096
+"""
+
+import argparse
+import json
+import time
+import numpy as np
+from sklearn.datasets import make_classification
+from ml.models.svm import SVM
+from ml.models.numpy_predictor import NumpyPredictor
+
+N_FEATURES = 7
+
+
+def timed(predict, x):
+    start = time.perf_counter()
+    y_pred = predict(x)
+    return y_pred, time.perf_counter() - start
+
+
+def bench(train_rows, n_rows, block_sizes, kernel="rbf", random_state=0):
+    x, y = make_classification(n_samples=train_rows + n_rows, n_features=N_FEATURES, n_informative=5, flip_y=0.1,
+                               random_state=random_state)
+    svm = SVM(kernel=kernel).fit(x[:train_rows], y[:train_rows])
+    x_test = x[train_rows:]
+
+    expected, svc_seconds = timed(svm.predict, x_test)
+    results = [{"engine": "svc", "rows": n_rows, "support_vectors": int(svm.model.support_.shape[0]),
+                "seconds": round(svc_seconds, 4), "rows_per_second": round(n_rows / svc_seconds)}]
+    for dtype in ("float64", "float32"):
+        for block_size in block_sizes:
+            predictor = NumpyPredictor.from_svm(svm, dtype=dtype, block_size=block_size)
+            y_pred, seconds = timed(predictor.predict, x_test)
+            results.append({
+                "engine": "numpy",
+                "dtype": dtype,
+                "block_size": block_size,
+                "seconds": round(seconds, 4),
+                "rows_per_second": round(n_rows / seconds),
+                "speedup": round(svc_seconds / seconds, 2),
+                "label_mismatches": int(np.sum(y_pred != expected)),
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the NumPy SVC decision function against libsvm.")
+    parser.add_argument("--train-rows", type=int, default=20000)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--block-sizes", type=int, nargs="+", default=[256, 1024, 4096])
+    args = parser.parse_args()
+
+    print(json.dumps(bench(args.train_rows, args.rows, args.block_sizes), indent=2))
+
+
+if __name__ == "__main__":
+    main()
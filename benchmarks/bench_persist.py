@@ -0,0 +1,68 @@
+"""
+Wall time and file size of streamed prediction persistence, synchronous against asynchronous.
+
+Scores --rows synthetic rows in --chunk-size chunks with a fitted RBF `SVM`, writing the
+PassengerId / Survived / Decision frame of each chunk through `PredictionWriter` in every
+format and compression, once with synchronous writes and once with writes overlapping the next
+chunk's prediction on the background thread.
+
+Usage:
+    python -m benchmarks.bench_persist --rows 2000000 --chunk-size 100000
+"""
+
+import argparse
+import json
+import os
+import shutil
+import time
+import numpy as np
+import pandas as pd
+from sklearn.datasets import make_classification
+from ml.models.svm import SVM
+from ml.models.numpy_predictor import NumpyPredictor
+from pipeline.writer import PredictionWriter
+
+N_FEATURES = 7
+OUTPUT_PATH = "benchmarks/results/persist"
+OUTPUTS = [("csv", None), ("csv", "gzip"), ("parquet", "snappy"), ("parquet", "zstd")]
+
+
+def bench(n_rows, chunk_size, train_rows=2000, random_state=0):
+    x, y = make_classification(n_samples=train_rows + n_rows, n_features=N_FEATURES, n_informative=5, flip_y=0.1,
+                               random_state=random_state)
+    predictor = NumpyPredictor.from_svm(SVM().fit(x[:train_rows], y[:train_rows]), dtype=np.float32)
+    x_test = x[train_rows:]
+
+    results = []
+    for fmt, compression in OUTPUTS:
+        for asynchronous in (False, True):
+            shutil.rmtree(OUTPUT_PATH, ignore_errors=True)
+            os.makedirs(OUTPUT_PATH)
+            start = time.perf_counter()
+            with PredictionWriter(OUTPUT_PATH, fmt=fmt, compression=compression, buffer_rows=chunk_size,
+                                  asynchronous=asynchronous) as writer:
+                for offset in range(0, n_rows, chunk_size):
+                    y_pred, decision = predictor.predict_scores(x_test[offset:offset + chunk_size])
+                    writer.write(pd.DataFrame({"PassengerId": np.arange(offset, offset + len(y_pred)),
+                                               "Survived": y_pred, "Decision": decision}))
+            results.append({
+                "format": fmt,
+                "compression": compression,
+                "asynchronous": asynchronous,
+                "seconds": round(time.perf_counter() - start, 4),
+                "size_mb": round(os.path.getsize(writer.path) / 2 ** 20, 2),
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streamed prediction persistence.")
+    parser.add_argument("--rows", type=int, default=2000000)
+    parser.add_argument("--chunk-size", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(json.dumps(bench(args.rows, args.chunk_size), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Reproducible stage benchmark of TitanicKernelSVMPipeline at scaled data sizes.
+
+Synthesizes Titanic-schema train/test CSV files of --sizes rows (a seeded bootstrap of the bundled
+files with jittered Age/Fare and fresh PassengerIds, so null rates and signal match the real data),
+then times the `load`, `preprocess` (`preprocess_dataset`), `scale` (`SetSplit` + `Scalers.fit_transform`),
+`feature_matrix` (the fused `transform_dataset`), `fit_predict` (`SVM.fit_predict`) and `persist` stages,
+reporting the median of --repeats runs. The exact SVC is quadratic-to-cubic in the training rows, so
+above --max-exact-rows the `fit_predict` stage uses the kernel-approximation engine instead.
+
+Results are written as JSON to --output. With --baseline, every (rows, stage) median is compared to
+the stored baseline and the run fails when one is slower by more than --threshold (relative) and
+--min-delta seconds (absolute, to ignore timer noise on tiny stages). Baselines are machine specific,
+refresh them with --update-baseline (`make bench-pipeline-baseline`) on the reference machine.
+
+Usage:
+    python -m benchmarks.bench_pipeline --sizes 1000 100000 1000000 --baseline benchmarks/baselines/pipeline.json
+    python -m benchmarks.bench_pipeline --sizes 10000000 --repeats 1
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import statistics
+import numpy as np
+import pandas as pd
+import sklearn
+from ml.functions import SetSplit
+from ml.load.datasets import DatasetLoader
+from ml.models.svm import SVM
+from ml.models.kernel_approx import KernelApproxSVM
+from pipeline.pipeline import TitanicKernelSVMPipeline
+from pipeline.constants import PASSENGER_ID, SURVIVED, AGE, FARE, TRAIN_COLUMNS, TEST_COLUMNS, UNUSED_COLUMNS, \
+    SCHEMA_DTYPES
+
+TRAIN_DS_PATH = "pipeline/data/input/train.csv"
+TEST_DS_PATH = "pipeline/data/input/test.csv"
+STAGES = ["load", "preprocess", "scale", "feature_matrix", "fit_predict", "persist"]
+SYNTHESIS_CHUNK_ROWS = 1000000
+
+
+def synthesize(source_path, target_path, n_rows, random_state=0):
+    """Write a seeded bootstrap of `source_path` with n_rows rows to `target_path`, in bounded-memory chunks."""
+    source_df = pd.read_csv(source_path)
+    rng = np.random.default_rng(random_state)
+    tmp_path = f"{target_path}.tmp"
+    for start in range(0, n_rows, SYNTHESIS_CHUNK_ROWS):
+        size = min(SYNTHESIS_CHUNK_ROWS, n_rows - start)
+        chunk_df = source_df.iloc[rng.integers(0, len(source_df), size=size)].reset_index(drop=True)
+        chunk_df[PASSENGER_ID] = np.arange(start + 1, start + size + 1)
+        chunk_df[AGE] = (chunk_df[AGE] + rng.normal(0, 2, size=size)).clip(lower=0.4).round(1)
+        chunk_df[FARE] = (chunk_df[FARE] * rng.lognormal(0, 0.1, size=size)).round(4)
+        chunk_df.to_csv(tmp_path, index=False, mode="w" if start == 0 else "a", header=start == 0)
+    os.replace(tmp_path, target_path)
+    return target_path
+
+
+def dataset_paths(data_dir, n_rows, random_state=0):
+    os.makedirs(data_dir, exist_ok=True)
+    paths = []
+    for source_path, name in ((TRAIN_DS_PATH, "train"), (TEST_DS_PATH, "test")):
+        target_path = os.path.join(data_dir, f"{name}-{n_rows}-seed{random_state}.csv")
+        if not os.path.exists(target_path):
+            synthesize(source_path, target_path, n_rows, random_state)
+        paths.append(target_path)
+    return paths
+
+
+def loader(ds_path, schema_columns):
+    columns = [c for c in schema_columns if c not in UNUSED_COLUMNS]
+    return DatasetLoader(ds_path, columns=columns, dtypes={c: SCHEMA_DTYPES[c] for c in columns})
+
+
+def build_model(n_rows, max_exact_rows):
+    if n_rows <= max_exact_rows:
+        return "svc", SVM()
+    return "kernel-approximation", KernelApproxSVM()
+
+
+def run_once(train_path, test_path, n_rows, output_path, max_exact_rows):
+    timings = {}
+
+    def timed(stage, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        timings[stage] = time.perf_counter() - start
+        return result
+
+    train_df, test_df = timed("load", lambda: (loader(train_path, TRAIN_COLUMNS).load(),
+                                               loader(test_path, TEST_COLUMNS).load()))
+
+    pipeline = TitanicKernelSVMPipeline(None, None, output_path, profiling={"enabled": False})
+    train_copy, test_copy = train_df.copy(), test_df.copy()
+    train_copy, test_copy = timed("preprocess", pipeline.preprocess_dataset, train_copy, test_copy)
+
+    def scale():
+        s = SetSplit(train_copy, test_copy)
+        s.split(train_col=SURVIVED, test_col=PASSENGER_ID)
+        return pipeline._slrs.fit_transform(s.X_train, s.X_test)
+
+    timed("scale", scale)
+
+    pipeline = TitanicKernelSVMPipeline(None, None, output_path, profiling={"enabled": False})
+    x_train, x_test = timed("feature_matrix", pipeline.transform_dataset, train_df, test_df)
+
+    engine, svm = build_model(n_rows, max_exact_rows)
+    pipeline._y_pred = timed("fit_predict", svm.fit_predict, x_train, x_test, train_df[SURVIVED].to_numpy())
+
+    timed("persist", pipeline.persist, test_df, output_path)
+    return engine, timings
+
+
+def bench(n_rows, repeats, data_dir, max_exact_rows, random_state=0):
+    train_path, test_path = dataset_paths(data_dir, n_rows, random_state)
+    output_path = os.path.join(data_dir, f"output-{n_rows}")
+    runs = []
+    engine = None
+    for _ in range(repeats):
+        engine, timings = run_once(train_path, test_path, n_rows, output_path, max_exact_rows)
+        runs.append(timings)
+    return [
+        {
+            "rows": n_rows,
+            "stage": stage,
+            "engine": engine if stage == "fit_predict" else None,
+            "median_seconds": round(statistics.median(run[stage] for run in runs), 6),
+            "min_seconds": round(min(run[stage] for run in runs), 6),
+        }
+        for stage in STAGES
+    ]
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "sklearn": sklearn.__version__,
+    }
+
+
+def regressions(results, baseline, threshold=0.25, min_delta=0.05):
+    """List the (rows, stage) medians slower than the baseline by more than threshold and min_delta seconds."""
+    stored = {(row["rows"], row["stage"]): row["median_seconds"] for row in baseline["results"]}
+    found = []
+    for row in results:
+        key = (row["rows"], row["stage"])
+        if key not in stored:
+            continue
+        delta = row["median_seconds"] - stored[key]
+        if delta > min_delta and row["median_seconds"] > stored[key] * (1 + threshold):
+            found.append(f"{row['stage']} @ {row['rows']} rows: {row['median_seconds']:.4f}s "
+                         f"vs baseline {stored[key]:.4f}s (+{delta / stored[key]:.0%})")
+    return found
+
+
+def write_json(payload, path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as json_file:
+        json.dump(payload, json_file, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the pipeline stages at scaled data sizes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 1000000])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--data-dir", default="benchmarks/data")
+    parser.add_argument("--output", default="benchmarks/results/pipeline.json")
+    parser.add_argument("--baseline", default=None, help="Fail when a stage regresses against this baseline.")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the --baseline.")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--min-delta", type=float, default=0.05)
+    parser.add_argument("--max-exact-rows", type=int, default=20000)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    report = {
+        "environment": environment(),
+        "repeats": args.repeats,
+        "results": [row for n_rows in args.sizes
+                    for row in bench(n_rows, args.repeats, args.data_dir, args.max_exact_rows)],
+    }
+    write_json(report, args.output)
+    print(json.dumps(report, indent=2))
+
+    if args.baseline and args.update_baseline:
+        write_json(report, args.baseline)
+        print(f"Stored baseline: {args.baseline}")
+    elif args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            found = regressions(report["results"], json.load(baseline_file), args.threshold, args.min_delta)
+        for regression in found:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if found:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Peak-memory benchmark of the preprocessing step of `TitanicKernelSVMPipeline.process()`.
+
+Resamples train.csv / test.csv to --rows rows (loaded with the pipeline schema dtypes), then
+measures with tracemalloc the peak allocation of the DataFrame chain (`preprocess_dataset` ->
+`SetSplit` -> `Scalers.fit_transform`) against the fused `transform_dataset` feature matrix and
+the streamed `FeatureMatrix.fit_chunks` / `transform_chunks` path over --chunk-size row chunks.
+
+Usage:
+    python -m benchmarks.bench_preprocess_memory --rows 100000 1000000 --chunk-size 50000
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from ml.functions import SetSplit
+from pipeline.pipeline import TitanicKernelSVMPipeline
+from pipeline.constants import PASSENGER_ID, SURVIVED, TRAIN_COLUMNS, TEST_COLUMNS
+
+TRAIN_DS_PATH = "pipeline/data/input/train.csv"
+TEST_DS_PATH = "pipeline/data/input/test.csv"
+
+
+def dataframe_chain(pipeline, train_df, test_df):
+    train_df, test_df = pipeline.preprocess_dataset(train_df, test_df)
+    s = SetSplit(train_df, test_df)
+    s.split(train_col=SURVIVED, test_col=PASSENGER_ID)
+    return pipeline._slrs.fit_transform(s.X_train, s.X_test)
+
+
+def fused_matrix(pipeline, train_df, test_df):
+    return pipeline.transform_dataset(train_df, test_df)
+
+
+def streamed_matrix(pipeline, train_df, test_df, chunk_size):
+    def chunks(df):
+        return (df[start:start + chunk_size] for start in range(0, len(df), chunk_size))
+
+    matrix = pipeline._build_matrix()
+    matrix.fit_chunks(lambda: chunks(train_df))
+    for _ in matrix.transform_chunks(chunks(train_df)):
+        pass
+    for _ in matrix.transform_chunks(chunks(test_df)):
+        pass
+
+
+def trace(step, train_df, test_df):
+    pipeline = TitanicKernelSVMPipeline(None, None, None, profiling={"enabled": False})
+    train_df, test_df = train_df.copy(), test_df.copy()
+    tracemalloc.start()
+    start = time.perf_counter()
+    step(pipeline, train_df, test_df)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, seconds
+
+
+def bench(n_rows, chunk_size, random_state=0):
+    loader = TitanicKernelSVMPipeline(None, None, None)
+    train_df = loader._dataset_loader(TRAIN_DS_PATH, TRAIN_COLUMNS).load()
+    test_df = loader._dataset_loader(TEST_DS_PATH, TEST_COLUMNS).load()
+    train_df = train_df.sample(n_rows, replace=True, random_state=random_state).reset_index(drop=True)
+    test_df = test_df.sample(n_rows, replace=True, random_state=random_state).reset_index(drop=True)
+
+    results = []
+    steps = (
+        ("dataframe-chain", dataframe_chain),
+        ("fused-matrix", fused_matrix),
+        ("streamed-matrix", lambda pipeline, train, test: streamed_matrix(pipeline, train, test, chunk_size)),
+    )
+    for name, step in steps:
+        peak, seconds = trace(step, train_df, test_df)
+        results.append({
+            "rows": n_rows,
+            "path": name,
+            "peak_mb": round(peak / 2 ** 20, 2),
+            "seconds": round(seconds, 4),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark preprocessing peak memory (tracemalloc).")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--chunk-size", type=int, default=50000)
+    args = parser.parse_args()
+
+    results = [row for n_rows in args.rows for row in bench(n_rows, args.chunk_size)]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Local load test of the micro-batching HTTP scoring service.
+
+Trains a model artifact on the bundled Titanic files (profiling disabled) unless --model-path
+points to an existing one, starts the service on an ephemeral port and fires single-record
+POST /predict requests from concurrent clients, reporting p50/p99 latency and throughput with
+micro-batching enabled versus disabled (max_batch_size=1).
+
+Usage:
+    python -m benchmarks.bench_server --clients 32 --requests 2000
+"""
+
+import argparse
+import json
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from pipeline.pipeline import TitanicKernelSVMPipeline
+from pipeline.server import TitanicScoringService, make_server
+
+TRAIN_DS_PATH = "pipeline/data/input/train.csv"
+TEST_DS_PATH = "pipeline/data/input/test.csv"
+
+
+def train_artifact():
+    output_path = tempfile.mkdtemp()
+    TitanicKernelSVMPipeline(TRAIN_DS_PATH, TEST_DS_PATH, output_path, profiling={"enabled": False}).process()
+    return output_path
+
+
+def load_test(model_path, records, clients, n_requests, max_batch_size, max_wait_ms):
+    service = TitanicScoringService(model_path, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms).start()
+    server = make_server(service, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/predict"
+
+    def call(i):
+        body = json.dumps(records[i % len(records)]).encode("utf-8")
+        start = time.perf_counter()
+        with urllib.request.urlopen(urllib.request.Request(url, data=body, method="POST")) as response:
+            response.read()
+        return time.perf_counter() - start
+
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clients) as pool:
+            latencies = np.array(list(pool.map(call, range(n_requests))))
+        elapsed = time.perf_counter() - start
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.stop()
+    return {
+        "max_batch_size": max_batch_size,
+        "clients": clients,
+        "requests": n_requests,
+        "p50_ms": round(float(np.percentile(latencies, 50)) * 1000, 2),
+        "p99_ms": round(float(np.percentile(latencies, 99)) * 1000, 2),
+        "throughput_rps": round(n_requests / elapsed, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the micro-batching scoring service.")
+    parser.add_argument("--model-path", default=None)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    model_path = args.model_path or train_artifact()
+    test_df = pd.read_csv(TEST_DS_PATH)
+    records = json.loads(test_df.to_json(orient="records"))
+    results = [
+        load_test(model_path, records, args.clients, args.requests, batch_size, args.max_wait_ms)
+        for batch_size in (1, args.max_batch_size)
+    ]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
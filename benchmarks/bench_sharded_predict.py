@@ -0,0 +1,62 @@
+"""
+Batch prediction throughput of `ShardedPredictor` across worker counts.
+
+Fits an RBF `SVM` on --train-rows synthetic rows with the same number of features as the
+preprocessed Titanic matrix, then predicts --rows rows inline and sharded over each of --n-jobs
+worker processes, checking that every run returns the inline labels.
+
+Usage:
+    python -m benchmarks.bench_sharded_predict --train-rows 20000 --rows 200000 --n-jobs 1 2 4
+"""
+
+import argparse
+import json
+import os
+import time
+import numpy as np
+from sklearn.datasets import make_classification
+from ml.models.svm import SVM
+from ml.models.sharded import ShardedPredictor
+
+N_FEATURES = 7
+
+
+def bench(train_rows, n_rows, n_jobs, shard_size, random_state=0):
+    x, y = make_classification(n_samples=train_rows + n_rows, n_features=N_FEATURES, n_informative=5, flip_y=0.1,
+                               random_state=random_state)
+    svm = SVM().fit(x[:train_rows], y[:train_rows])
+    x_test = x[train_rows:]
+
+    results, expected, inline_seconds = [], None, None
+    for workers in n_jobs:
+        start = time.perf_counter()
+        with ShardedPredictor(workers, shard_size) as predictor:
+            y_pred = predictor.predict(svm, x_test)
+        seconds = time.perf_counter() - start
+        if expected is None:
+            expected, inline_seconds = y_pred, seconds
+        results.append({
+            "rows": n_rows,
+            "support_vectors": int(svm.model.support_.shape[0]),
+            "n_jobs": workers,
+            "seconds": round(seconds, 4),
+            "speedup": round(inline_seconds / seconds, 2),
+            "matches_inline": bool(np.array_equal(y_pred, expected)),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sharded multi-process batch prediction.")
+    parser.add_argument("--train-rows", type=int, default=20000)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--n-jobs", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--shard-size", type=int, default=25000)
+    args = parser.parse_args()
+
+    results = bench(args.train_rows, args.rows, args.n_jobs, args.shard_size)
+    print(json.dumps({"cpu_count": os.cpu_count(), "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
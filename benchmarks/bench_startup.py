@@ -0,0 +1,62 @@
+"""
+Startup-time benchmark for the `main` entry point.
+
+Measures the wall time of `python -c "import main"` in fresh interpreters, so import-time
+regressions (e.g. a heavy library such as ydata_profiling or shap imported at module level)
+are caught before they reach our short scoring jobs.
+
+Usage:
+    python -m benchmarks.bench_startup --runs 5 --max-seconds 3.0
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ("ydata_profiling", "shap")
+
+
+def time_import(module="main", runs=5):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def loaded_heavy_modules(module="main"):
+    probe = f"import sys, {module}; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    output = subprocess.run([sys.executable, "-c", probe], check=True, capture_output=True, text=True)
+    return [m for m in output.stdout.strip().split(",") if m]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark `import main` startup time.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-seconds", type=float, default=None,
+                        help="Fail when the median import time exceeds this many seconds.")
+    args = parser.parse_args()
+
+    timings = time_import(runs=args.runs)
+    report = {
+        "module": "main",
+        "runs": args.runs,
+        "median_seconds": round(statistics.median(timings), 4),
+        "min_seconds": round(min(timings), 4),
+        "max_seconds": round(max(timings), 4),
+        "heavy_modules_loaded": loaded_heavy_modules(),
+    }
+    print(json.dumps(report, indent=2))
+
+    if report["heavy_modules_loaded"]:
+        sys.exit(f"Heavy modules imported at startup: {report['heavy_modules_loaded']}")
+    if args.max_seconds is not None and report["median_seconds"] > args.max_seconds:
+        sys.exit(f"Median import time {report['median_seconds']}s exceeds {args.max_seconds}s")
+
+
+if __name__ == "__main__":
+    main()
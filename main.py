@@ -11,10 +11,16 @@ The program also generates various visualizations of the data and model results.
 
 The main entry point for the program is the `TitanicKernelSVMMain` class in this module. This class
 provides methods for loading the data, training the model, and generating visualizations.
+
+Run with `--mode predict` to skip training and score the test dataset with the model artifact
+persisted by a previous `train` run, or with `--mode serve` to expose that artifact through a
+local micro-batching HTTP scoring service (see `pipeline.server`).
 """
 
+import argparse
 import yaml
 from pipeline.pipeline import TitanicKernelSVMPipeline
+from pipeline.server import serve
 
 
 class TitanicKernelSVMMain:
@@ -25,18 +31,52 @@ class TitanicKernelSVMMain:
         train_ds_path (str): The path to the training dataset.
         test_ds_path (str): The path to the test dataset.
         output_path (str): The path to the output directory.
+        model_path (str): The path to the persisted model artifact, defaults to the output directory.
+        chunk_size (int): When set, 'predict' mode streams the test dataset in chunks of this many rows.
+        columnar_cache (str): When set, CSV inputs are cached there as Parquet and read with column projection.
+        profiling (dict): The profiler report options (enabled, minimal, sample_size, background).
+        model (dict): The model engine and its arguments.
+        search (dict): The C/gamma hyperparameter search options.
+        mode (str): 'train' (fit and predict), 'predict' (score with a persisted artifact) or 'serve'.
+        server (dict): The HTTP scoring service options (host, port, max_batch_size, max_wait_ms).
+        instrumentation (dict): The per-stage run report options (enabled, prometheus).
+        cache (dict): The stage output cache options (enabled, path, max_size_mb).
+        training (dict): The training options (incremental, full_refit_every, chunk_size).
+        selection (dict): The concurrent multi-model selection options (enabled, candidates, strategy, ...).
+        explain (dict): The SHAP explanation options (enabled, background, background_size, n_jobs, ...).
+        scores (dict): The decision score and calibrated probability output options (decision, calibration, holdout).
+        prediction (dict): The sharded multi-process prediction options (n_jobs, shard_size, engine, ...).
+        compression (dict): The support vector compression options (enabled, ratios, tolerance).
+        output (dict): The predictions file options (format, compression, buffer_rows, asynchronous).
 
     Methods:
         yaml_loader: Loads a YAML configuration file and extracts the dataset and output paths.
         start: Starts the TitanicKernelSVMPipeline with the loaded dataset and output paths.
     """
-    def __init__(self, output_path=None):
+    def __init__(self, output_path=None, mode=None):
         """
         Initializes a new instance of the TitanicKernelSVMMain class with default attribute values.
         """
         self.train_ds_path = None
         self.test_ds_path = None
         self.output_path = output_path
+        self.model_path = None
+        self.chunk_size = None
+        self.columnar_cache = None
+        self.profiling = None
+        self.model = None
+        self.search = None
+        self.server = None
+        self.instrumentation = None
+        self.cache = None
+        self.training = None
+        self.selection = None
+        self.explain = None
+        self.scores = None
+        self.prediction = None
+        self.compression = None
+        self.output = None
+        self.mode = mode
 
     def yaml_loader(self):
         """
@@ -61,6 +101,24 @@ class TitanicKernelSVMMain:
         self.test_ds_path = str(model_args['test_ds_path'])
         if not self.output_path:
             self.output_path = str(model_args['output_path'])
+        self.model_path = model_args.get('model_path') or self.output_path
+        self.chunk_size = model_args.get('chunk_size')
+        self.columnar_cache = model_args.get('columnar_cache')
+        if not self.mode:
+            self.mode = str(model_args.get('mode', 'train'))
+        self.profiling = config['environment'].get('profiling')
+        self.model = config['environment'].get('model')
+        self.search = config['environment'].get('search')
+        self.server = config['environment'].get('server') or {}
+        self.instrumentation = config['environment'].get('instrumentation')
+        self.cache = config['environment'].get('cache')
+        self.training = config['environment'].get('training') or {}
+        self.selection = config['environment'].get('selection')
+        self.explain = config['environment'].get('explain')
+        self.scores = config['environment'].get('scores')
+        self.prediction = config['environment'].get('prediction')
+        self.compression = config['environment'].get('compression')
+        self.output = config['environment'].get('output')
 
     def start(self):
         """
@@ -78,12 +136,39 @@ class TitanicKernelSVMMain:
             Any exceptions raised by the TitanicKernelSVMPipeline.process method.
         """
         self.yaml_loader()
-        TitanicKernelSVMPipeline(
+        if self.mode == 'serve':
+            serve(self.model_path, scores=self.scores, prediction=self.prediction, compression=self.compression,
+                  **self.server)
+            return
+        pipeline = TitanicKernelSVMPipeline(
             train_ds_path=self.train_ds_path,
             test_ds_path=self.test_ds_path,
-            output_path=self.output_path
-        ).process()
+            output_path=self.output_path,
+            model_path=self.model_path,
+            profiling=self.profiling,
+            model=self.model,
+            search=self.search,
+            columnar_cache=self.columnar_cache,
+            instrumentation=self.instrumentation,
+            cache=self.cache,
+            training=self.training,
+            selection=self.selection,
+            explain=self.explain,
+            scores=self.scores,
+            prediction=self.prediction,
+            compression=self.compression,
+            output=self.output
+        )
+        if self.mode == 'predict':
+            pipeline.predict(chunk_size=self.chunk_size)
+        elif self.training.get('incremental'):
+            pipeline.retrain()
+        else:
+            pipeline.process()
 
 
 if __name__ == '__main__':
-    TitanicKernelSVMMain().start()
+    parser = argparse.ArgumentParser(description='Titanic Kernel SVM pipeline.')
+    parser.add_argument('--mode', choices=['train', 'predict', 'serve'], default=None)
+    args = parser.parse_args()
+    TitanicKernelSVMMain(mode=args.mode).start()
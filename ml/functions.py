@@ -5,6 +5,7 @@ using pandas, numpy, and other data science libraries.
 Classes:
     PandasProfiler: A class for generating a pandas-profiling report for a pandas DataFrame.
     DropPdColumns: A class for dropping columns from a pandas DataFrame.
+    NullSummary: A class for counting the null values of every column of a dataset.
     FeatureEngine: A class for performing various feature engineering tasks on a pandas DataFrame.
     SetSplit: A class for splitting a dataset into training and test sets.
 
@@ -52,7 +53,7 @@ Example:
 import logging
 import numpy as np
 import pandas as pd
-import ydata_profiling as yp
+from ml.preprocess.feature import RandomImputer
 
 
 class PandasProfiler:
@@ -62,6 +63,9 @@ class PandasProfiler:
     Attributes:
     df (pd.DataFrame): The DataFrame to profile.
     title (str): The title to display in the report.
+    minimal (bool): Whether to build the cheaper minimal report (no correlations, interactions...).
+    sample_size (int): When set, profile a seeded random sample of at most this many rows. The sample is drawn
+        when the profiler is created, so a profiler sent to another process only carries the sampled rows.
 
     Methods:
     profiler(): Generate a pandas-profiling report for the DataFrame.
@@ -86,9 +90,18 @@ class PandasProfiler:
     including statistics, distributions, and correlations. The report is also
     saved to a file in HTML format.
     """
-    def __init__(self, pandas_df, title):
-        self.pandas_df = pandas_df
+    def __init__(self, pandas_df, title, minimal=False, sample_size=None, random_state=0):
         self.title = title
+        self.minimal = minimal
+        self.sample_size = sample_size
+        self._random_state = random_state
+        self.pandas_df = pandas_df
+        self.pandas_df = self._sample()
+
+    def _sample(self):
+        if self.sample_size and len(self.pandas_df) > self.sample_size:
+            return self.pandas_df.sample(n=self.sample_size, random_state=self._random_state)
+        return self.pandas_df
 
     def profiler(self):
         """Generate a profile report for the Pandas dataframe.
@@ -103,8 +116,11 @@ class PandasProfiler:
             >> profiler = PandasProfiler(pandas_df=my_df, title="My Data")
             >> profile_report = profiler.profiler()
         """
+        # ydata_profiling is a heavy import, only pay for it when a report is actually built
+        import ydata_profiling as yp
+
         try:
-            return yp.ProfileReport(self.pandas_df, title=self.title)
+            return yp.ProfileReport(self._sample(), title=self.title, minimal=self.minimal)
         except NameError as name_error:
             raise NameError(f"name '{self.pandas_df}' is not defined. {name_error}") from name_error
 
@@ -115,7 +131,7 @@ class PandasProfiler:
             file_path (str): The file path to save the report.
 
         Returns:
-            None. The report is saved to the specified file path.
+            str: The file path the report was saved to.
 
         Example:
             >> profiler = PandasProfiler(pandas_df=my_df, title="My Data")
@@ -124,6 +140,7 @@ class PandasProfiler:
         """
         profile_report = self.profiler()
         profile_report.to_file(file_path)
+        return file_path
 
 
 class DropPdColumns:
@@ -135,6 +152,7 @@ class DropPdColumns:
     columns_to_drop (list): A list of column names to drop from the DataFrame.
     axis (int): The axis along which to drop columns (0 for rows, 1 for columns).
     inplace (bool): Whether to modify the DataFrame in-place or return a copy.
+    errors (str): 'raise' on columns missing from the DataFrame, or 'ignore' them (e.g. projected away at load).
 
     Methods:
     drop(): Drop the specified columns from the DataFrame.
@@ -161,11 +179,12 @@ class DropPdColumns:
     2  3
     """
 
-    def __init__(self, pandas_df, columns_to_drop, axis=1, inplace=True):
+    def __init__(self, pandas_df, columns_to_drop, axis=1, inplace=True, errors="raise"):
         self.pandas_df = pandas_df
         self.columns_to_drop = columns_to_drop
         self._axis = axis
         self._inplace = inplace
+        self._errors = errors
         self._logger = logging.getLogger(__name__)
 
     def drop(self):
@@ -188,12 +207,54 @@ class DropPdColumns:
             1  2
         """
         try:
-            self.pandas_df.drop(self.columns_to_drop, axis=self._axis, inplace=self._inplace)
+            self.pandas_df.drop(self.columns_to_drop, axis=self._axis, inplace=self._inplace, errors=self._errors)
             self._logger.info("Cols dropped: %s", self.columns_to_drop)
         except NameError as name_error:
             raise NameError(f"name '{self.pandas_df}' is not defined. {name_error}") from name_error
 
 
+class NullSummary:
+    """
+    A per-column null count of a dataset, computed with a single vectorized `isna().sum()`
+    per frame and accumulated across chunks when the dataset is streamed.
+
+    Attributes:
+    name (str): The dataset name.
+    n_rows (int): The number of rows seen so far.
+    counts (pd.Series): The null count per column.
+
+    Methods:
+    update(df): Add the null counts of a DataFrame (or chunk) to the summary.
+    to_dict(): Export the summary as plain Python types, e.g. to feed metrics.
+
+    Example:
+    summary = NullSummary('test_df')
+    for chunk in DatasetLoader('test.csv').load_chunks(10000):
+        summary.update(chunk)
+    print(summary.to_dict())
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.n_rows = 0
+        self.counts = pd.Series(dtype="int64")
+
+    def update(self, df):
+        counts = df.isna().sum()
+        if not self.counts.empty:
+            counts = self.counts.add(counts, fill_value=0)
+        self.counts = counts.astype("int64")
+        self.n_rows += len(df)
+        return self
+
+    def to_dict(self):
+        return {"rows": self.n_rows, "nulls": {c: int(n) for c, n in self.counts.items()}}
+
+    def __str__(self):
+        nulls = ", ".join(f"'{c}': {n}{' **' if n else ''}" for c, n in self.counts.items())
+        return f"no. of nulls in set '{self.name}' ({self.n_rows} rows): {{{nulls}}}"
+
+
 class FeatureEngine:
 
     _logger = logging.getLogger(__name__)
@@ -229,35 +290,30 @@ class FeatureEngine:
         Returns:
         None
         """
-        slice_df = dataset[column].copy()
+        slice_df = dataset[column].to_numpy(dtype=float, copy=True)
         slice_df[np.isnan(slice_df)] = rand
-        dataset[column] = slice_df
-        dataset[column] = train_df[column].astype(int)
+        dataset[column] = slice_df.astype(int)
 
     @staticmethod
     def check_nulls(env=None, **kwargs):
         """
-        Check the number of null values in each column of each
-        DataFrame in a dictionary of DataFrames.
+        Count the null values of every column of each DataFrame in a dictionary
+        of DataFrames in a single vectorized pass, logging one summary line per set.
 
         Parameters:
         **kwargs (dict): A dictionary of DataFrames to check null values in.
 
         Returns:
-        print description of null counts marked with '**'
+        summaries (dict): A NullSummary per DataFrame name, columns with nulls marked with '**' in the log.
         """
+        summaries = {}
         for df_name, df in kwargs.items():
-            cols_to_check = df.columns
-            for c in cols_to_check:
-                chk_null = df[c].isnull().sum()
-                if chk_null >= 1:
-                    chk_null = f"{chk_null} **"
-                if env == "vm":
-                    print(f"no. of nulls for col '{c}' in set '{df_name}': {chk_null}")
-                else:
-                    FeatureEngine._logger.info(
-                        f"no. of nulls for col '{c}' in set '{df_name}': {chk_null}"
-                    )
+            summaries[df_name] = NullSummary(df_name).update(df)
+            if env == "vm":
+                print(summaries[df_name])
+            else:
+                FeatureEngine._logger.info(summaries[df_name])
+        return summaries
 
     @staticmethod
     def nan_inputer(datasets: list, column: str):
@@ -265,21 +321,19 @@ class FeatureEngine:
         Impute missing values in a column of multiple
         DataFrames by filling NaN values with random integers.
 
+        The mean and standard deviation are learned once on the first (training)
+        DataFrame and the fill is seeded, see `ml.preprocess.feature.RandomImputer`.
+
         Parameters:
-        datasets (list): A list of DataFrames to impute missing values in.
+        datasets (list): A list of DataFrames to impute missing values in, training one first.
         column (str): The name of the column to impute missing values in.
 
         Returns:
         None
         """
-        train_df = datasets[0]
-        test_df = datasets[1]
+        imputer = RandomImputer(column).fit(datasets[0])
         for dataset in datasets:
-            mean = train_df[column].mean()
-            std = test_df[column].std()
-            is_null = dataset[column].isnull().sum()
-            rand = FeatureEngine._compute_random_num(mean, std, is_null)
-            FeatureEngine._fill_nan(train_df, dataset, rand, column)
+            imputer.transform(dataset)
 
     @staticmethod
     def common_value_inputer(df, col: str, common_value: str):
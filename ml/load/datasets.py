@@ -1,15 +1,31 @@
+import os
+import hashlib
+import numpy as np
 import pandas as pd
 
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+FEATHER_EXTENSIONS = (".feather", ".arrow")
+NUMPY_EXTENSIONS = (".npy",)
+COLUMNAR_FORMATS = {"parquet": ".parquet", "feather": ".feather"}
+
 
 class DatasetLoader:
     """
-    A class for loading a CSV file into a pandas DataFrame.
+    A class for loading a CSV, Parquet, Feather or NumPy file.
+
+    The format is detected from the file extension. Only the requested `columns` are read
+    (never materialized for CSV, never read from disk for Parquet/Feather) and cast to the
+    given `dtypes`, while `.npy` feature matrices are memory-mapped instead of read into memory.
 
     Attributes:
-    file_path (str): The path to the CSV file to load.
+    file_path (str): The path to the file to load.
+    columns (list): Optional column projection, columns not listed are never read.
+    dtypes (dict): Optional column -> dtype mapping (e.g. 'category', 'int8', 'float32') applied at load.
 
     Methods:
-    load(): Load the CSV file into a pandas DataFrame.
+    load(): Load the file into a pandas DataFrame (a read-only memory-mapped np.ndarray for `.npy`).
+    load_chunks(chunk_size): Lazily yield the file as pandas DataFrames of at most chunk_size rows.
+    cache_columnar(cache_dir, fmt): Convert a CSV once into a columnar file keyed by its content hash.
 
     Example:
     # create a DatasetLoader object for a file called 'my_data.csv'
@@ -19,19 +35,120 @@ class DatasetLoader:
     df = loader.load()
     print(df.head())
 
+    # cache it as Parquet and reload only two columns
+    df = DatasetLoader(loader.cache_columnar('cache'), columns=['Column 1', 'Column 2']).load()
+
     Output:
        Column 1  Column 2  Column 3
     0         1         4         7
     1         2         5         8
     2         3         6         9
     """
-    
-    def __init__(self, file_path):
+
+    def __init__(self, file_path, columns=None, dtypes=None):
         self._file_path = file_path
-        
+        self._columns = list(columns) if columns is not None else None
+        self._dtypes = dtypes
+
+    def _astype(self, load_df):
+        if not self._dtypes:
+            return load_df
+        return load_df.astype({c: t for c, t in self._dtypes.items() if c in load_df.columns})
+
+    def _extension(self):
+        return os.path.splitext(str(self._file_path))[1].lower()
+
     def load(self):
         try:
-            load_df = pd.read_csv(self._file_path)
+            extension = self._extension()
+            if extension in PARQUET_EXTENSIONS:
+                return self._astype(pd.read_parquet(self._file_path, columns=self._columns))
+            if extension in FEATHER_EXTENSIONS:
+                return self._astype(pd.read_feather(self._file_path, columns=self._columns))
+            if extension in NUMPY_EXTENSIONS:
+                return np.load(self._file_path, mmap_mode="r")
+            load_df = pd.read_csv(self._file_path, usecols=self._columns, dtype=self._dtypes)
             return load_df
         except FileNotFoundError as fnf:
             raise FileNotFoundError(f"File from 'file_path' does not exists. Provide a valid path. {fnf}") from fnf
+
+    def load_chunks(self, chunk_size):
+        try:
+            extension = self._extension()
+            if extension in PARQUET_EXTENSIONS + FEATHER_EXTENSIONS:
+                yield from self._load_columnar_chunks(chunk_size, extension)
+                return
+            if extension in NUMPY_EXTENSIONS:
+                matrix = np.load(self._file_path, mmap_mode="r")
+                for start in range(0, len(matrix), chunk_size):
+                    yield matrix[start:start + chunk_size]
+                return
+            with pd.read_csv(self._file_path, usecols=self._columns, dtype=self._dtypes,
+                             chunksize=chunk_size) as reader:
+                for chunk_df in reader:
+                    yield chunk_df
+        except FileNotFoundError as fnf:
+            raise FileNotFoundError(f"File from 'file_path' does not exists. Provide a valid path. {fnf}") from fnf
+
+    def _load_columnar_chunks(self, chunk_size, extension):
+        import pyarrow.feather as feather
+        import pyarrow.parquet as pq
+
+        if extension in PARQUET_EXTENSIONS:
+            batches = pq.ParquetFile(self._file_path).iter_batches(batch_size=chunk_size, columns=self._columns)
+        else:
+            batches = feather.read_table(self._file_path, columns=self._columns, memory_map=True).to_batches(chunk_size)
+        for batch in batches:
+            yield self._astype(batch.to_pandas())
+
+    def content_hash(self, block_size=1 << 20):
+        digest = hashlib.sha256()
+        try:
+            with open(self._file_path, "rb") as file:
+                for block in iter(lambda: file.read(block_size), b""):
+                    digest.update(block)
+        except FileNotFoundError as fnf:
+            raise FileNotFoundError(f"File from 'file_path' does not exists. Provide a valid path. {fnf}") from fnf
+        return digest.hexdigest()
+
+    def cache_columnar(self, cache_dir, fmt="parquet", chunk_size=65536):
+        """
+        Convert the CSV file into a columnar file inside `cache_dir`, named after the CSV content
+        hash (and the column projection) so the text is parsed only once per distinct content.
+
+        The CSV is streamed `chunk_size` rows at a time into the columnar writer with the same
+        `columns` and `dtypes` as `load`, so the whole file is never held in memory.
+
+        Returns:
+            str: The path of the cached columnar file, reused when it already exists.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if fmt not in COLUMNAR_FORMATS:
+            raise ValueError(f"Unknown columnar format '{fmt}', expected one of {list(COLUMNAR_FORMATS)}.")
+        stem = os.path.splitext(os.path.basename(str(self._file_path)))[0]
+        key = self.content_hash()[:16]
+        if self._columns is not None or self._dtypes:
+            projection = repr((self._columns, sorted((self._dtypes or {}).items())))
+            key = f"{key}-{hashlib.sha256(projection.encode()).hexdigest()[:8]}"
+        cache_path = os.path.join(cache_dir, f"{stem}-{key}{COLUMNAR_FORMATS[fmt]}")
+        if not os.path.exists(cache_path):
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.tmp"
+            writer = None
+            try:
+                for chunk_df in self.load_chunks(chunk_size):
+                    table = pa.Table.from_pandas(self._astype(chunk_df), preserve_index=False)
+                    if writer is None:
+                        # categories differ per chunk, store their values and let `load` re-cast them
+                        schema = pa.schema([pa.field(f.name, f.type.value_type) if pa.types.is_dictionary(f.type)
+                                            else f for f in table.schema])
+                        writer = pq.ParquetWriter(tmp_path, schema) if fmt == "parquet" \
+                            else pa.ipc.new_file(tmp_path, schema)
+                    writer.write_table(table.cast(schema))
+            finally:
+                if writer is not None:
+                    writer.close()
+            os.replace(tmp_path, cache_path)
+        return cache_path
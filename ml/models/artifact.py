@@ -0,0 +1,68 @@
+import os
+import joblib
+import sklearn
+
+ARTIFACT_VERSION = 8
+ARTIFACT_FILE_NAME = "model.joblib"
+
+
+class ModelArtifact:
+    """
+    A versioned bundle of every fitted object needed to score new data without retraining.
+
+    Attributes:
+    encoder (Encoder): The fitted categorical encoder (per-column category -> code tables).
+    scaler (Scalers): The fitted standard scaler (train mean / scale).
+    svm (SVM): The fitted SVM wrapper (support vectors and params).
+    imputers (list): The fitted imputers holding the train-time statistics used on new batches.
+    feature_names (list): The ordered feature columns the model was trained on.
+    search (dict): The hyperparameter search outcome (strategy, best params and score), if one ran.
+    training (dict): The training rows seen and the incremental refits since the last full fit.
+    calibrator (ScoreCalibrator): The decision margin -> probability calibration, if one was fitted.
+    compressed (NumpyPredictor): The reduced support vector set scoring in place of svm, if compression was accepted.
+
+    Methods:
+    save(output_path): Write the artifact next to the predictions file and return its path.
+    load(artifact_path): Load a previously saved artifact, checking its version.
+
+    Example:
+    # persist after training, then reload in a scoring job
+    path = ModelArtifact(encoder, scaler, svm, imputers, feature_names).save('pipeline/data/output')
+    artifact = ModelArtifact.load(path)
+    """
+
+    def __init__(self, encoder, scaler, svm, imputers, feature_names, search=None, training=None, calibrator=None,
+                 compressed=None):
+        self.encoder = encoder
+        self.scaler = scaler
+        self.svm = svm
+        self.imputers = imputers
+        self.feature_names = list(feature_names)
+        self.search = search
+        self.training = training
+        self.calibrator = calibrator
+        self.compressed = compressed
+        self.version = ARTIFACT_VERSION
+        self.sklearn_version = sklearn.__version__
+
+    def save(self, output_path):
+        artifact_path = os.path.join(output_path, ARTIFACT_FILE_NAME)
+        joblib.dump(self, artifact_path)
+        return artifact_path
+
+    @staticmethod
+    def load(artifact_path):
+        if os.path.isdir(artifact_path):
+            artifact_path = os.path.join(artifact_path, ARTIFACT_FILE_NAME)
+        try:
+            artifact = joblib.load(artifact_path)
+        except FileNotFoundError as fnf:
+            raise FileNotFoundError(
+                f"Model artifact does not exists. Run the pipeline in 'train' mode first. {fnf}"
+            ) from fnf
+        if getattr(artifact, "version", None) != ARTIFACT_VERSION:
+            raise ValueError(
+                f"Unsupported model artifact version {getattr(artifact, 'version', None)}, "
+                f"expected {ARTIFACT_VERSION}. Retrain the model."
+            )
+        return artifact
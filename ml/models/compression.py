@@ -0,0 +1,103 @@
+import math
+import time
+import logging
+import numpy as np
+from sklearn.cluster import KMeans
+from sklearn.metrics.pairwise import pairwise_kernels
+from ml.models.numpy_predictor import NumpyPredictor
+
+
+def _timed_predict(model, x):
+    start = time.perf_counter()
+    y_pred = model.predict(x)
+    return y_pred, time.perf_counter() - start
+
+
+class SupportVectorCompressor:
+    """
+    Post-training reduced-set compression of a binary kernel SVC.
+
+    Inference cost grows with the number of support vectors. The support vectors are clustered
+    into k-means centroids and the decision function is projected onto them in the kernel feature
+    space: with Z the centroids and S the support vectors, the reduced coefficients solve
+    K(Z, Z) beta = K(Z, S) alpha (Burges' reduced-set method), keeping the intercept. Candidate
+    sizes are tried from the smallest ratio up, and the first one whose accuracy on the evaluation
+    rows is within `tolerance` of the full model is kept as a `NumpyPredictor`.
+
+    Attributes:
+    ratios (list): Candidate reduced-set sizes, as fractions of the support vector count.
+    tolerance (float): The largest accepted accuracy drop (0.01 = 1 point) against the full model.
+    ridge (float): The K(Z, Z) diagonal regularization, for near-duplicate centroids.
+
+    Methods:
+    compress(svm, x, y): Return (the compressed NumpyPredictor or None, the before/after report).
+
+    Example:
+    compressed, report = SupportVectorCompressor(ratios=[0.1, 0.25], tolerance=0.01).compress(svm, x_val, y_val)
+    y_pred = (compressed or svm).predict(x_test)
+    """
+
+    def __init__(self, ratios=(0.1, 0.25, 0.5), tolerance=0.01, ridge=1e-8, random_state=0):
+        if not ratios or not all(0 < ratio < 1 for ratio in ratios):
+            raise ValueError(f"Compression ratios must be in (0, 1), got {list(ratios)}.")
+        self.ratios = sorted(ratios)
+        self.tolerance = tolerance
+        self.ridge = ridge
+        self._random_state = random_state
+        self._logger = logging.getLogger(__name__)
+
+    def reduce(self, expansion, n_vectors):
+        """The `NumpyPredictor` of the decision function projected onto n_vectors k-means centroids."""
+        support_vectors, dual_coef, kernel = expansion["support_vectors"], expansion["dual_coef"], expansion["kernel"]
+        centroids = KMeans(n_clusters=n_vectors, n_init=1, random_state=self._random_state).fit(
+            support_vectors).cluster_centers_
+        params = {name: value for name, value in kernel.items() if name != "metric"}
+        kernel_zz = pairwise_kernels(centroids, metric=kernel["metric"], filter_params=True, **params)
+        kernel_zs = pairwise_kernels(centroids, support_vectors, metric=kernel["metric"], filter_params=True, **params)
+        kernel_zz[np.diag_indices_from(kernel_zz)] += self.ridge
+        coef = np.linalg.lstsq(kernel_zz, kernel_zs @ dual_coef, rcond=None)[0]
+        return NumpyPredictor(centroids, coef, expansion["intercept"], expansion["classes"], kernel)
+
+    def compress(self, svm, x, y):
+        expansion = svm.kernel_expansion()
+        if expansion is None:
+            raise ValueError("Only a binary SVC with a linear, poly, rbf or sigmoid kernel can be compressed.")
+        y = np.asarray(y)
+        n_support = len(expansion["support_vectors"])
+        y_full, svc_seconds = _timed_predict(svm, x)
+        full_accuracy = float(np.mean(y_full == y))
+        _, numpy_seconds = _timed_predict(NumpyPredictor(**expansion), x)
+
+        candidates, compressed, chosen = [], None, None
+        for ratio in self.ratios:
+            n_vectors = max(1, math.ceil(ratio * n_support))
+            if n_vectors >= n_support:
+                continue
+            predictor = self.reduce(expansion, n_vectors)
+            y_pred, seconds = _timed_predict(predictor, x)
+            candidate = {
+                "ratio": ratio,
+                "support_vectors": n_vectors,
+                "accuracy": round(float(np.mean(y_pred == y)), 4),
+                "agreement": round(float(np.mean(y_pred == y_full)), 4),
+                "latency_seconds": round(seconds, 6),
+            }
+            candidates.append(candidate)
+            self._logger.info(f"Reduced Set Of {n_vectors}/{n_support} Support Vectors: "
+                              f"Accuracy {candidate['accuracy']} (Full {full_accuracy:.4f})")
+            if full_accuracy - candidate["accuracy"] <= self.tolerance:
+                compressed, chosen = predictor, candidate
+                break
+
+        report = {
+            "accepted": compressed is not None,
+            "tolerance": self.tolerance,
+            "rows": len(y),
+            "support_vectors": {"before": n_support, "after": chosen["support_vectors"] if chosen else n_support},
+            "accuracy": {"before": round(full_accuracy, 4),
+                         "after": chosen["accuracy"] if chosen else round(full_accuracy, 4)},
+            "latency_seconds": {"svc": round(svc_seconds, 6), "numpy": round(numpy_seconds, 6),
+                                "after": chosen["latency_seconds"] if chosen else round(svc_seconds, 6)},
+            "candidates": candidates,
+        }
+        return compressed, report
@@ -0,0 +1,110 @@
+import os
+import logging
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+BACKGROUNDS = ("kmeans", "sample")
+
+# the KernelExplainer built once per worker process by `_init_worker`
+_WORKER_STATE = {}
+
+
+def _init_worker(svm, background, nsamples, random_state):
+    # shap is a heavy import, only pay for it when explanations are requested
+    import shap
+
+    _WORKER_STATE["explainer"] = shap.KernelExplainer(svm.decision_function, background)
+    _WORKER_STATE["nsamples"] = nsamples
+    _WORKER_STATE["random_state"] = random_state
+
+
+def _explain_batch(n_batch, x_batch):
+    # KernelExplainer samples coalitions from the global numpy generator, seed per batch so the
+    # values do not depend on which worker picked the batch up, and restore the caller's state since
+    # inline batches run in the pipeline process
+    state = np.random.get_state()
+    try:
+        np.random.seed(_WORKER_STATE["random_state"] + n_batch)
+        return np.asarray(_WORKER_STATE["explainer"].shap_values(x_batch, nsamples=_WORKER_STATE["nsamples"],
+                                                                 silent=True))
+    finally:
+        np.random.set_state(state)
+
+
+class ShapExplainer:
+    """
+    Model-agnostic (Kernel SHAP) explanations of an `SVM` decision function, built to run headless.
+
+    The training matrix is summarized into a small background set (weighted k-means centroids or a
+    seeded sample) instead of being used whole, since Kernel SHAP cost grows with background rows.
+    The rows to explain are split into batches explained concurrently in a process pool, every
+    worker building its explainer once. Nothing is plotted, values are returned as an array.
+
+    Attributes:
+    background (str): 'kmeans' (weighted centroids) or 'sample' (seeded random rows).
+    background_size (int): The number of background rows (centroids) to summarize the training matrix into.
+    nsamples (int or str): The coalitions evaluated per explained row, 'auto' lets shap decide.
+    batch_size (int): The rows explained per task.
+    n_jobs (int): The number of worker processes, -1 uses every core and 1 runs inline.
+    max_rows (int): Explain at most this many rows (a seeded sample), None explains every row.
+
+    Methods:
+    explain(svm, x_train, x_test): Return (rows, shap_values), setting expected_value_.
+
+    Example:
+    rows, values = ShapExplainer(background_size=50, n_jobs=4).explain(svm, x_train, x_test)
+    np.save('shap-values.npy', values)
+    """
+
+    def __init__(self, background="kmeans", background_size=50, nsamples="auto", batch_size=64, n_jobs=-1,
+                 max_rows=None, random_state=0):
+        if background not in BACKGROUNDS:
+            raise ValueError(f"Unknown SHAP background '{background}', expected one of {list(BACKGROUNDS)}.")
+        self.background = background
+        self.background_size = background_size
+        self.nsamples = nsamples
+        self.batch_size = batch_size
+        self.n_jobs = os.cpu_count() if n_jobs == -1 else n_jobs
+        self.max_rows = max_rows
+        self._random_state = random_state
+        self.expected_value_ = None
+        self._logger = logging.getLogger(__name__)
+
+    def summarize(self, x_train):
+        import shap
+
+        x_train = np.asarray(x_train, dtype=float)
+        if len(x_train) <= self.background_size:
+            return x_train
+        if self.background == "kmeans":
+            return shap.kmeans(x_train, self.background_size)
+        return shap.sample(x_train, self.background_size, random_state=self._random_state)
+
+    def rows(self, n_rows):
+        """The (sorted) row positions explained out of n_rows."""
+        if self.max_rows is None or n_rows <= self.max_rows:
+            return np.arange(n_rows)
+        rng = np.random.default_rng(self._random_state)
+        return np.sort(rng.choice(n_rows, size=self.max_rows, replace=False))
+
+    def explain(self, svm, x_train, x_test):
+        background = self.summarize(x_train)
+        rows = self.rows(len(x_test))
+        x_explain = np.asarray(x_test, dtype=float)[rows]
+        batches = [x_explain[start:start + self.batch_size] for start in range(0, len(x_explain), self.batch_size)]
+        n_workers = min(self.n_jobs or 1, len(batches))
+        initargs = (svm, background, self.nsamples, self._random_state)
+        self._logger.info(f"Explaining {len(x_explain)} Rows In {len(batches)} Batches On {n_workers} Workers")
+        if n_workers > 1:
+            with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker, initargs=initargs) as pool:
+                values = list(pool.map(_explain_batch, range(len(batches)), batches))
+        else:
+            _init_worker(*initargs)
+            try:
+                values = [_explain_batch(n_batch, batch) for n_batch, batch in enumerate(batches)]
+            finally:
+                _WORKER_STATE.clear()
+        # shap.kmeans returns weighted centroids, a sampled background weighs every row the same
+        data, weights = (background.data, background.weights) if hasattr(background, "weights") else (background, None)
+        self.expected_value_ = float(np.average(svm.decision_function(data), weights=weights))
+        return rows, np.concatenate(values) if values else np.empty((0, x_explain.shape[1]))
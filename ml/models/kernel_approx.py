@@ -0,0 +1,96 @@
+import logging
+import numpy as np
+from sklearn.kernel_approximation import Nystroem, RBFSampler
+from sklearn.linear_model import SGDClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.svm import LinearSVC
+from ml.models.svm import SVM
+
+APPROXIMATIONS = {
+    "nystroem": Nystroem,
+    "rff": RBFSampler,
+}
+SOLVERS = ("linear-svc", "sgd")
+
+
+class KernelApproxSVM(SVM):
+    """
+    A scalable stand-in for the exact RBF `SVM`: the RBF kernel is approximated by an explicit
+    feature map (Nystroem or random Fourier features) and a linear SVM is trained on top of it,
+    so fit cost grows linearly with the number of rows instead of quadratically-to-cubically.
+
+    Attributes:
+    approximation (str): 'nystroem' or 'rff' (random Fourier features).
+    solver (str): 'sgd' (hinge-loss SGD, linear in rows) or 'linear-svc' (liblinear, slower on large sets).
+    n_components (int): The dimension of the approximate feature map.
+    C (float): The SVM regularization parameter, as in `SVC`.
+    gamma (float or str): The RBF kernel coefficient, 'scale' resolves it like `SVC` at fit time.
+
+    Methods:
+    Same as `SVM`: fit, fit_predict, predict, score, set_params and shap.
+    fit_incremental(x_new, y_new): One more SGD pass over the new rows only (solver 'sgd').
+
+    Example:
+    svm = KernelApproxSVM(approximation='nystroem', n_components=500)
+    y_pred = svm.fit_predict(x_train, x_test, y_train)
+    """
+
+    def __init__(self, approximation="nystroem", solver="sgd", n_components=300, C=1.0, gamma="scale",
+                 random_state=0):
+        if approximation not in APPROXIMATIONS:
+            raise ValueError(f"Unknown approximation '{approximation}', expected one of {list(APPROXIMATIONS)}.")
+        if solver not in SOLVERS:
+            raise ValueError(f"Unknown solver '{solver}', expected one of {list(SOLVERS)}.")
+        self._kernel = "rbf"
+        self._approximation = approximation
+        self._solver = solver
+        self._n_components = n_components
+        self._C = C
+        self._gamma = gamma
+        self._random_state = random_state
+        self.model = Pipeline([
+            ("approximation", APPROXIMATIONS[approximation](
+                n_components=n_components,
+                random_state=random_state
+            )),
+            ("classifier", self._classifier()),
+        ])
+        self._logger = logging.getLogger(__name__)
+
+    def _classifier(self):
+        if self._solver == "sgd":
+            return SGDClassifier(loss="hinge", random_state=self._random_state)
+        return LinearSVC(C=self._C, random_state=self._random_state)
+
+    def _fit_params(self, x_train):
+        gamma = self._gamma
+        if gamma == "scale":
+            gamma = 1.0 / (x_train.shape[1] * np.asarray(x_train).var())
+        params = {"approximation__gamma": gamma}
+        if self._solver == "sgd":
+            # the hinge-loss SGD objective matches the SVC one with alpha = 1 / (C * n_samples)
+            params["classifier__alpha"] = 1.0 / (self._C * x_train.shape[0])
+        return params
+
+    def fit(self, x_train, y_train):
+        self.model.set_params(**self._fit_params(x_train))
+        return super().fit(x_train, y_train)
+
+    def fit_incremental(self, x_new, y_new):
+        if self._solver != "sgd":
+            raise ValueError(f"Incremental training requires solver 'sgd', got '{self._solver}'.")
+        x_mapped = self.model.named_steps["approximation"].transform(x_new)
+        self.model.named_steps["classifier"].partial_fit(x_mapped, y_new)
+        return self
+
+    def set_params(self, **params):
+        if "C" in params:
+            self._C = params.pop("C")
+            if self._solver == "linear-svc":
+                params["classifier__C"] = self._C
+        if "gamma" in params:
+            self._gamma = params.pop("gamma")
+        if "n_components" in params:
+            self._n_components = params.pop("n_components")
+            params["approximation__n_components"] = self._n_components
+        self.model.set_params(**params)
@@ -0,0 +1,203 @@
+import os
+import math
+import logging
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from sklearn.metrics import euclidean_distances
+from sklearn.model_selection import StratifiedKFold
+from sklearn.svm import SVC
+from ml.models.shared import allocate, attach, release
+
+STRATEGIES = ("grid", "halving")
+# rows of the squared distance matrix computed per block, bounding the temporary distances
+DISTANCE_BLOCK_ROWS = 1024
+# float64 n x n matrices held at once: the shared distances plus, per worker, a kernel and a fold copy
+MATRICES_PER_WORKER = 2
+
+# squared distance matrix (attached from shared memory) and labels, published once per worker process by
+# `_init_worker`, plus the worker's reused kernel buffer
+_WORKER_STATE = {}
+
+
+def _init_worker(sq_distances_spec, y):
+    _WORKER_STATE["shm"], _WORKER_STATE["sq_distances"] = attach(sq_distances_spec)
+    _WORKER_STATE["y"] = y
+
+
+def _kernel(gamma, n_rows):
+    """
+    exp(-gamma * d) over the first n_rows rows, computed in place in the worker's kernel buffer. The buffer
+    is kept for the last (gamma, n_rows), so consecutive fold tasks of a gamma derive it only once.
+    """
+    if _WORKER_STATE.get("kernel_key") == (gamma, n_rows):
+        return _WORKER_STATE["kernel"][:n_rows * n_rows].reshape(n_rows, n_rows)
+    buffer = _WORKER_STATE.get("kernel")
+    if buffer is None or buffer.size < n_rows * n_rows:
+        buffer = _WORKER_STATE["kernel"] = np.empty(n_rows * n_rows)
+    kernel = buffer[:n_rows * n_rows].reshape(n_rows, n_rows)
+    np.multiply(_WORKER_STATE["sq_distances"][:n_rows, :n_rows], -gamma, out=kernel)
+    np.exp(kernel, out=kernel)
+    _WORKER_STATE["kernel_key"] = (gamma, n_rows)
+    return kernel
+
+
+def _evaluate_fold(gamma, c_values, n_rows, train_idx, val_idx):
+    """
+    Score every C of a single gamma on one fold of the first n_rows (shuffled) rows. The RBF kernel is
+    derived from the cached squared distances and shared by all the C values of the task.
+    """
+    y = _WORKER_STATE["y"][:n_rows]
+    kernel = _kernel(gamma, n_rows)
+    scores = []
+    for c in c_values:
+        model = SVC(kernel="precomputed", C=c)
+        model.fit(kernel[np.ix_(train_idx, train_idx)], y[train_idx])
+        scores.append(model.score(kernel[np.ix_(val_idx, train_idx)], y[val_idx]))
+    return scores
+
+
+def _squared_distances(x, out):
+    """The pairwise squared distances of x written into `out` one block of rows at a time."""
+    x_norms = np.einsum("ij,ij->i", x, x)[np.newaxis, :]
+    for start in range(0, len(x), DISTANCE_BLOCK_ROWS):
+        stop = min(start + DISTANCE_BLOCK_ROWS, len(x))
+        out[start:stop] = euclidean_distances(x[start:stop], x, Y_norm_squared=x_norms, squared=True)
+        np.fill_diagonal(out[start:stop, start:stop], 0)
+    return out
+
+
+class KernelSearch:
+    """
+    A cross-validated search over the RBF SVM `C` and `gamma` parameters.
+
+    The pairwise squared distances are computed once and every gamma only applies
+    `exp(-gamma * d)` on top of them, so no candidate recomputes distances and all the C values
+    of a gamma share one kernel matrix. Every (gamma, fold) pair is a task of a process pool, so the
+    folds of a gamma run concurrently too; the distance matrix is written once into shared memory that every
+    worker attaches to, and each worker computes its kernels in place in one reused buffer.
+
+    Attributes:
+    param_grid (dict): The candidate values, e.g. {'C': [0.1, 1, 10], 'gamma': ['scale', 0.01, 0.1]}.
+    strategy (str): 'grid' evaluates every candidate on all rows, 'halving' runs successive halving,
+        evaluating all candidates on a small row budget and keeping the best 1/factor at each round.
+    cv (int): The number of stratified folds.
+    n_jobs (int): The number of worker processes, -1 uses every core and 1 runs inline.
+    factor (int): The halving elimination rate and row budget growth.
+    max_samples (int): Cap on the rows used for the search, since the distance matrix is n x n.
+    memory_mb (int): Bound on the n x n matrices held at once, the shared distance matrix plus a kernel
+        and a fold copy per worker, which lowers the row cap as n_jobs grows. None disables it.
+
+    Methods:
+    fit(x, y): Run the search and set best_params_, best_score_ and results_.
+
+    Example:
+    search = KernelSearch({'C': [0.1, 1, 10], 'gamma': [0.01, 0.1, 1]}, strategy='halving').fit(x, y)
+    svm.set_params(**search.best_params_)
+    """
+
+    def __init__(self, param_grid, strategy="grid", cv=5, n_jobs=-1, factor=3, max_samples=None, memory_mb=None,
+                 random_state=0):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown search strategy '{strategy}', expected one of {list(STRATEGIES)}.")
+        self.param_grid = param_grid
+        self.strategy = strategy
+        self.cv = cv
+        self.n_jobs = os.cpu_count() if n_jobs == -1 else n_jobs
+        self.factor = factor
+        self.max_samples = max_samples
+        self.memory_mb = memory_mb
+        self._random_state = random_state
+        self.best_params_ = None
+        self.best_score_ = None
+        self.results_ = []
+        self._logger = logging.getLogger(__name__)
+
+    def _gammas(self, x):
+        gammas = []
+        for gamma in self.param_grid.get("gamma", ["scale"]):
+            if gamma == "scale":
+                gamma = 1.0 / (x.shape[1] * x.var())
+            gammas.append(float(gamma))
+        return gammas
+
+    def _folds(self, y):
+        splitter = StratifiedKFold(n_splits=self.cv, shuffle=True, random_state=self._random_state)
+        return list(splitter.split(np.zeros(len(y)), y))
+
+    def _evaluate(self, pool, candidates, n_rows, y):
+        folds = self._folds(y[:n_rows])
+        by_gamma = {}
+        for c, gamma in candidates:
+            by_gamma.setdefault(gamma, []).append(c)
+        # one task per (gamma, fold), ordered by gamma so a worker reuses its kernel across folds
+        tasks = [(gamma, c_values, n_rows, train_idx, val_idx)
+                 for gamma, c_values in by_gamma.items() for train_idx, val_idx in folds]
+        if pool is None:
+            fold_scores = [_evaluate_fold(*task) for task in tasks]
+        else:
+            fold_scores = list(pool.map(_evaluate_fold, *zip(*tasks)))
+        results = []
+        for i, (gamma, c_values) in enumerate(by_gamma.items()):
+            scores = np.asarray(fold_scores[i * len(folds):(i + 1) * len(folds)])
+            results.extend({"C": c, "gamma": gamma, "n_samples": n_rows, "mean_score": float(score)}
+                           for c, score in zip(c_values, scores.mean(axis=0)))
+        self.results_.extend(results)
+        return sorted(results, key=lambda r: r["mean_score"], reverse=True)
+
+    def _budgets(self, n_candidates, n_rows, n_classes):
+        if self.strategy == "grid" or n_candidates == 1:
+            return [n_rows]
+        n_rounds = math.ceil(math.log(n_candidates, self.factor))
+        min_rows = max(n_rows // self.factor ** n_rounds, 2 * self.cv * n_classes)
+        # the last round always uses every row so the winner is scored like a grid candidate
+        return [min(n_rows, min_rows * self.factor ** i) for i in range(n_rounds)] + [n_rows]
+
+    def _max_rows(self, n_workers):
+        max_rows = [self.max_samples] if self.max_samples else []
+        if self.memory_mb:
+            n_matrices = 1 + MATRICES_PER_WORKER * n_workers
+            max_rows.append(int(math.sqrt(self.memory_mb * 2 ** 20 / (8 * n_matrices))))
+        return min(max_rows, default=None)
+
+    def fit(self, x, y):
+        x, y = np.asarray(x, dtype=float), np.asarray(y)
+        rng = np.random.default_rng(self._random_state)
+        rows = rng.permutation(len(x))
+        n_workers = self.n_jobs if self.n_jobs and self.n_jobs > 1 else 1
+        max_rows = self._max_rows(n_workers)
+        if max_rows and len(rows) > max_rows:
+            self._logger.info(f"Searching On {max_rows} Of {len(rows)} Rows")
+            rows = rows[:max_rows]
+        x, y = x[rows], y[rows]
+
+        candidates = [(c, g) for c in self.param_grid.get("C", [1.0]) for g in self._gammas(x)]
+        self.results_ = []
+        pool, shm = None, None
+        try:
+            if n_workers > 1:
+                shm, sq_distances, spec = allocate((len(x), len(x)), np.float64)
+                _squared_distances(x, sq_distances)
+                pool = ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker, initargs=(spec, y))
+            else:
+                _WORKER_STATE["sq_distances"] = _squared_distances(x, np.empty((len(x), len(x))))
+                _WORKER_STATE["y"] = y
+            budgets = self._budgets(len(candidates), len(x), len(np.unique(y)))
+            for n_round, n_rows in enumerate(budgets):
+                ranked = self._evaluate(pool, candidates, n_rows, y)
+                self._logger.info(
+                    f"Search round {n_round}: {len(candidates)} candidates on {n_rows} rows, "
+                    f"best {ranked[0]['mean_score']:.4f} (C={ranked[0]['C']}, gamma={ranked[0]['gamma']:.4g})"
+                )
+                if n_round < len(budgets) - 1:
+                    n_keep = max(1, math.ceil(len(candidates) / self.factor))
+                    candidates = [(r["C"], r["gamma"]) for r in ranked[:n_keep]]
+        finally:
+            if pool is not None:
+                pool.shutdown()
+            if shm is not None:
+                release(shm)
+            _WORKER_STATE.clear()
+
+        self.best_params_ = {"C": ranked[0]["C"], "gamma": ranked[0]["gamma"]}
+        self.best_score_ = ranked[0]["mean_score"]
+        return self
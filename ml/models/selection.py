@@ -0,0 +1,173 @@
+import os
+import logging
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from sklearn.model_selection import StratifiedKFold
+from ml.models.svm import SVM
+from ml.models.shared import share, attach, release
+
+STRATEGIES = ("best", "vote")
+
+# read-only views over the shared training matrix and labels, attached once per worker by `_init_worker`
+_WORKER_STATE = {}
+
+
+def _init_worker(x_spec, y_spec):
+    _WORKER_STATE["x_shm"], _WORKER_STATE["x"] = attach(x_spec)
+    _WORKER_STATE["y_shm"], _WORKER_STATE["y"] = attach(y_spec)
+
+
+def _build(spec, engines):
+    params = dict(spec)
+    engine = params.pop("engine", "svc")
+    if engine not in engines:
+        raise ValueError(f"Unknown model engine '{engine}', expected one of {list(engines)}.")
+    return engines[engine](**params)
+
+
+def _fit_candidate(index, spec, engines, folds):
+    """Cross-validate one candidate spec, then fit it on every row of the shared training matrix."""
+    x, y = _WORKER_STATE["x"], _WORKER_STATE["y"]
+    scores = []
+    for train_idx, val_idx in folds:
+        model = _build(spec, engines).fit(x[train_idx], y[train_idx])
+        scores.append(float(np.mean(model.predict(x[val_idx]) == y[val_idx])))
+    return {"index": index, "spec": spec, "mean_score": float(np.mean(scores))}, _build(spec, engines).fit(x, y)
+
+
+class VotingSVM(SVM):
+    """
+    A majority-vote ensemble of fitted `SVM` models, exposing the `SVM` interface.
+
+    Ties are broken in favor of the first class in `classes_` order.
+    """
+
+    def __init__(self, models):
+        self.models = list(models)
+        self.model = self.models[0].model
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def classes_(self):
+        return self.models[0].model.classes_
+
+    def fit(self, x_train, y_train):
+        for model in self.models:
+            model.fit(x_train, y_train)
+        return self
+
+    def fit_incremental(self, x_new, y_new):
+        for model in self.models:
+            model.fit_incremental(x_new, y_new)
+        return self
+
+    def _vote(self, predictions):
+        votes = (np.stack(predictions)[:, :, None] == self.classes_).sum(axis=0)
+        return self.classes_[votes.argmax(axis=1)]
+
+    def predict(self, x_test):
+        return self._vote([model.predict(x_test) for model in self.models])
+
+    def decision_function(self, x_test):
+        return np.mean([model.decision_function(x_test) for model in self.models], axis=0)
+
+    def predict_scores(self, x_test):
+        labels, scores = zip(*(model.predict_scores(x_test) for model in self.models))
+        return self._vote(labels), np.mean(scores, axis=0)
+
+    def kernel_expansion(self):
+        return None
+
+    def score(self, x_train, y_train, env=None):
+        acc_score = round(float(np.mean(self.predict(x_train) == np.asarray(y_train))) * 100, 2)
+        if env == "vm":
+            print(f"Accuracy SVM ensemble score: {acc_score}")
+        else:
+            self._logger.info(f"Accuracy SVM ensemble score: {acc_score}")
+
+    def set_params(self, **params):
+        for model in self.models:
+            model.set_params(**params)
+
+
+class ModelSelection:
+    """
+    Fit several model specs concurrently and keep the best one, or a majority vote of the top ones.
+
+    The training matrix and labels are copied once into shared memory and every worker process
+    attaches read-only views to them, instead of each task pickling its own copy of the data.
+    Each candidate is scored by stratified cross-validation and then fit on every row.
+
+    Attributes:
+    candidates (list): Model specs, e.g. [{'kernel': 'rbf', 'C': 10}, {'kernel': 'poly', 'class_weight': 'balanced'}],
+        with an optional 'engine' key ('svc' by default) and the engine constructor arguments.
+    engines (dict): engine name -> model class, e.g. {'svc': SVM, 'kernel-approximation': KernelApproxSVM}.
+    strategy (str): 'best' keeps the best cross-validated candidate, 'vote' a `VotingSVM` of the top_k ones.
+    top_k (int): The number of candidates in the 'vote' ensemble.
+    cv (int): The number of stratified folds.
+    n_jobs (int): The number of worker processes, -1 uses every core and 1 runs inline.
+
+    Methods:
+    fit(x, y): Fit every candidate, setting best_model_, best_spec_, best_score_ and results_.
+
+    Example:
+    selection = ModelSelection([{'kernel': 'rbf'}, {'kernel': 'linear', 'C': 0.1}], {'svc': SVM}).fit(x, y)
+    y_pred = selection.best_model_.predict(x_test)
+    """
+
+    def __init__(self, candidates, engines, strategy="best", top_k=3, cv=5, n_jobs=-1, random_state=0):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown selection strategy '{strategy}', expected one of {list(STRATEGIES)}.")
+        if not candidates:
+            raise ValueError("Model selection needs at least one candidate spec.")
+        self.candidates = [dict(spec) for spec in candidates]
+        self.engines = engines
+        self.strategy = strategy
+        self.top_k = top_k
+        self.cv = cv
+        self.n_jobs = os.cpu_count() if n_jobs == -1 else n_jobs
+        self._random_state = random_state
+        self.best_model_ = None
+        self.best_spec_ = None
+        self.best_score_ = None
+        self.results_ = []
+        self._logger = logging.getLogger(__name__)
+
+    def _folds(self, y):
+        splitter = StratifiedKFold(n_splits=self.cv, shuffle=True, random_state=self._random_state)
+        return list(splitter.split(np.zeros(len(y)), y))
+
+    def fit(self, x, y):
+        x, y = np.ascontiguousarray(x), np.ascontiguousarray(y)
+        folds = self._folds(y)
+        tasks = [(i, spec, self.engines, folds) for i, spec in enumerate(self.candidates)]
+        n_workers = min(self.n_jobs or 1, len(tasks))
+        if n_workers > 1:
+            x_shm, x_spec = share(x)
+            y_shm, y_spec = share(y)
+            try:
+                with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                         initargs=(x_spec, y_spec)) as pool:
+                    fitted = list(pool.map(_fit_candidate, *zip(*tasks)))
+            finally:
+                release(x_shm, y_shm)
+        else:
+            _WORKER_STATE.update(x=x, y=y)
+            try:
+                fitted = [_fit_candidate(*task) for task in tasks]
+            finally:
+                _WORKER_STATE.clear()
+
+        ranked = sorted(fitted, key=lambda result: result[0]["mean_score"], reverse=True)
+        self.results_ = [result for result, _ in fitted]
+        for result, _ in ranked:
+            self._logger.info(f"Candidate {result['spec']}: CV Score {result['mean_score']:.4f}")
+        if self.strategy == "vote":
+            top = ranked[:self.top_k]
+            self.best_model_ = VotingSVM([model for _, model in top])
+            self.best_spec_ = [result["spec"] for result, _ in top]
+        else:
+            self.best_model_ = ranked[0][1]
+            self.best_spec_ = ranked[0][0]["spec"]
+        self.best_score_ = ranked[0][0]["mean_score"]
+        return self
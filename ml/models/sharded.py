@@ -0,0 +1,130 @@
+import os
+import logging
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from ml.models.shared import share, attach, release
+from ml.models.numpy_predictor import NumpyPredictor
+
+# the kernel expansion arrays published through shared memory rather than pickled to every worker
+SHARED_ARRAYS = ("support_vectors", "dual_coef")
+
+# the published model, attached once per worker by `_init_worker`
+_WORKER_STATE = {}
+
+
+def _init_worker(svm, expansion):
+    if expansion is None:
+        _WORKER_STATE["svm"] = svm
+        return
+    expansion = dict(expansion)
+    for name in SHARED_ARRAYS:
+        _WORKER_STATE[f"{name}_shm"], expansion[name] = attach(expansion[name])
+    # the arrays already have the predictor dtype, so the views are used without a copy
+    _WORKER_STATE["svm"] = NumpyPredictor(**expansion)
+
+
+def _predict_shard(x_spec, start, stop, scores):
+    """Labels (and decision margins when `scores`) of the rows [start, stop) of the shared test matrix."""
+    x_shm, x = attach(x_spec)
+    try:
+        svm = _WORKER_STATE["svm"]
+        return svm.predict_scores(x[start:stop]) if scores else (svm.predict(x[start:stop]), None)
+    finally:
+        del x
+        x_shm.close()
+
+
+class ShardedPredictor:
+    """
+    Batch prediction sharded over a process pool.
+
+    Each test matrix is copied once into shared memory and split into contiguous row shards, each
+    task only carrying the block name and its (start, stop) bounds. The pool is started on the
+    first sharded call and kept for the next ones with the same model, so scoring a file chunk
+    by chunk starts the workers and publishes the model once. For a binary SVC with a built-in
+    kernel (or a `NumpyPredictor`) the support vectors and dual coefficients are published through
+    shared memory, and every worker scores its shards with a `NumpyPredictor` over them; any other
+    model is sent once per worker. Shard results are written back in row order. `close` (or the
+    end of a `with` block) stops the pool and frees the published model.
+
+    Attributes:
+    n_jobs (int): The number of worker processes, -1 uses every core and 1 runs inline.
+    shard_size (int): The test rows per task.
+
+    Methods:
+    predict(svm, x): The predicted labels.
+    predict_scores(svm, x): The predicted labels and decision margins (binary models).
+    close(): Stop the worker pool and release the shared model.
+
+    Example:
+    with ShardedPredictor(n_jobs=4, shard_size=50000) as predictor:
+        for x_chunk in x_chunks:
+            y_pred, decision = predictor.predict_scores(svm, x_chunk)
+    """
+
+    def __init__(self, n_jobs=-1, shard_size=50000):
+        self.n_jobs = os.cpu_count() if n_jobs == -1 else n_jobs
+        self.shard_size = shard_size
+        self._pool = None
+        self._model = None
+        self._model_blocks = []
+        self._logger = logging.getLogger(__name__)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def predict(self, svm, x):
+        return self._run(svm, x, scores=False)[0]
+
+    def predict_scores(self, svm, x):
+        return self._run(svm, x, scores=True)
+
+    def _start(self, svm):
+        """Start the worker pool for `svm`, publishing its kernel expansion once."""
+        self.close()
+        expansion = svm.kernel_expansion()
+        published = None
+        try:
+            if expansion is not None:
+                published = dict(expansion)
+                for name in SHARED_ARRAYS:
+                    shm, published[name] = share(np.ascontiguousarray(expansion[name]))
+                    self._model_blocks.append(shm)
+            self._pool = ProcessPoolExecutor(max_workers=self.n_jobs, initializer=_init_worker,
+                                             initargs=(None if published else svm, published))
+        except BaseException:
+            self.close()
+            raise
+        self._model = svm
+        self._logger.info(f"Started {self.n_jobs} Prediction Workers")
+
+    def close(self):
+        pool, self._pool, self._model = self._pool, None, None
+        try:
+            if pool is not None:
+                pool.shutdown()
+        finally:
+            blocks, self._model_blocks = self._model_blocks, []
+            release(*blocks)
+
+    def _run(self, svm, x, scores):
+        x = np.ascontiguousarray(x)
+        bounds = [(start, min(start + self.shard_size, len(x))) for start in range(0, len(x), self.shard_size)]
+        if min(self.n_jobs or 1, len(bounds)) <= 1:
+            return svm.predict_scores(x) if scores else (svm.predict(x), None)
+
+        if self._pool is None or self._model is not svm:
+            self._start(svm)
+        x_shm, x_spec = share(x)
+        try:
+            self._logger.info(f"Predicting {len(x)} Rows In {len(bounds)} Shards On {self.n_jobs} Workers")
+            results = list(self._pool.map(_predict_shard, [x_spec] * len(bounds), *zip(*bounds),
+                                          [scores] * len(bounds)))
+        finally:
+            release(x_shm)
+
+        labels = np.concatenate([shard_labels for shard_labels, _ in results])
+        return labels, (np.concatenate([shard_scores for _, shard_scores in results]) if scores else None)
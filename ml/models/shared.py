@@ -0,0 +1,33 @@
+import numpy as np
+from multiprocessing.shared_memory import SharedMemory
+
+
+def allocate(shape, dtype):
+    """A new shared memory block, returning the block, a writable view over it and how to attach to it."""
+    dtype = np.dtype(dtype)
+    shm = SharedMemory(create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf), (shm.name, tuple(shape), dtype.str)
+
+
+def share(array):
+    """Copy `array` once into a new shared memory block, returning the block and how to attach to it."""
+    shm, view, spec = allocate(array.shape, array.dtype)
+    view[...] = array
+    return shm, spec
+
+
+def attach(spec):
+    """A read-only view over a block published by `share`, with the block handle keeping it alive."""
+    name, shape, dtype = spec
+    # pool workers share the parent's resource tracker, which unlinks the block only if the parent leaks it
+    shm = SharedMemory(name=name)
+    array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    array.flags.writeable = False
+    return shm, array
+
+
+def release(*blocks):
+    """Close and unlink the blocks created by `share`."""
+    for shm in blocks:
+        shm.close()
+        shm.unlink()
@@ -1,16 +1,20 @@
-import shap
 import logging
+import numpy as np
 from sklearn.svm import SVC
 
+# kernels whose decision function `kernel_expansion` can export, as `sklearn.metrics.pairwise_kernels` metrics
+EXPANDABLE_KERNELS = ("linear", "poly", "rbf", "sigmoid")
+
 
 class SVM:
     
-    def __init__(self, kernel='rbf', random_state=0):
+    def __init__(self, kernel='rbf', random_state=0, **svc_params):
         self._kernel = kernel
         self._random_state = random_state
         self.model = SVC(
             kernel=self._kernel, 
-            random_state=self._random_state
+            random_state=self._random_state,
+            **svc_params  # e.g. C, gamma, degree, class_weight
         )
         self._logger = logging.getLogger(__name__)
     
@@ -21,15 +25,62 @@ class SVM:
         else:
             self._logger.info(f"Accuracy SVM score: {acc_score}")
         
-    def shap(self, x_train, x_test, feature_names, plot_type="bar"):
-        explainer = shap.Explainer(self.model.predict, x_train)
-        shap_values = explainer(x_test).abs
-        shap.summary_plot(shap_values, x_test, plot_type=plot_type, feature_names=feature_names)
+    def shap(self, x_train, x_test, feature_names, plot_type="bar", **explainer_args):
+        # shap is a heavy import, only pay for it when explanations are requested
+        import shap
+        from ml.models.explain import ShapExplainer
 
-    def fit_predict(self, x_train, x_test, y_train):
+        rows, shap_values = ShapExplainer(**explainer_args).explain(self, x_train, x_test)
+        shap.summary_plot(np.abs(shap_values), np.asarray(x_test)[rows], plot_type=plot_type,
+                          feature_names=feature_names)
+
+    def fit(self, x_train, y_train):
         self.model.fit(x_train, y_train)
+        return self
+
+    def support_set(self):
+        """The fitted support vectors and their labels, a compact summary of the rows the model was trained on."""
+        # libsvm stores the support vectors grouped by class, n_support_[i] of them for classes_[i]
+        labels = np.repeat(self.model.classes_, self.model.n_support_)
+        return self.model.support_vectors_, labels
+
+    def fit_incremental(self, x_new, y_new):
+        """Warm-started refit on the previous support vectors plus the new rows, instead of every row seen."""
+        x_support, y_support = self.support_set()
+        return self.fit(np.vstack([x_support, x_new]), np.concatenate([y_support, y_new]))
+
+    def fit_predict(self, x_train, x_test, y_train):
+        self.fit(x_train, y_train)
         y_pred = self.model.predict(x_test)
         return y_pred
+
+    def predict(self, x_test):
+        return self.model.predict(x_test)
+
+    def decision_function(self, x_test):
+        return self.model.decision_function(x_test)
+
+    def predict_scores(self, x_test):
+        """Binary labels and decision margins from a single decision_function pass."""
+        scores = self.decision_function(x_test)
+        return self.model.classes_[(scores > 0).astype(int)], scores
+
+    def kernel_expansion(self):
+        """
+        The fitted binary decision function as plain arrays and kernel parameters,
+        decision(x) = K(x, support_vectors) @ dual_coef + intercept, or None when the model is not a
+        binary SVC with a built-in kernel.
+        """
+        model = self.model
+        if not isinstance(model, SVC) or model.kernel not in EXPANDABLE_KERNELS or len(model.classes_) != 2:
+            return None
+        return {
+            "support_vectors": model.support_vectors_,
+            "dual_coef": model.dual_coef_[0],
+            "intercept": float(model.intercept_[0]),
+            "classes": model.classes_,
+            "kernel": {"metric": model.kernel, "gamma": model._gamma, "degree": model.degree, "coef0": model.coef0},
+        }
     
     def set_params(self, **params):
         self.model.set_params(**params)
@@ -1,30 +1,339 @@
-from sklearn.preprocessing import LabelEncoder
+import logging
+import numpy as np
+import pandas as pd
 from sklearn.preprocessing import StandardScaler
 
 
+def _update_moments(moments, values):
+    """
+    Merge the non-missing values of a batch into running (count, mean, M2) moments with the pairwise
+    form of Welford's update (Chan et al.), stable and independent of how the data is chunked.
+    """
+    values = values[~np.isnan(values)]
+    if not len(values):
+        return moments
+    count, mean, m2 = moments
+    batch_mean = values.mean()
+    total = count + len(values)
+    delta = batch_mean - mean
+    return (total, mean + delta * len(values) / total,
+            m2 + np.square(values - batch_mean).sum() + delta ** 2 * count * len(values) / total)
+
+
 class Encoder:
-    
-    def __init__(self, cols):
-        self._cols = cols
-        self._le = LabelEncoder()
-    
+    """
+    Encode categorical columns with per-column category -> code tables learned once at fit
+    time (sorted categories, the same codes `LabelEncoder` produces) and applied to any later
+    batch with a vectorized categorical lookup, so scoring batches never refit.
+
+    Categories unseen at fit time (or missing values) are encoded as `unknown_value`.
+    """
+
+    def __init__(self, cols, unknown_value=-1):
+        self._cols = [cols] if isinstance(cols, str) else list(cols)
+        self._unknown_value = unknown_value
+        self.categories_ = {}
+        self._logger = logging.getLogger(__name__)
+
+    def __repr__(self):
+        return f"Encoder(cols={self._cols!r}, unknown_value={self._unknown_value!r})"
+
+    @property
+    def mappings(self):
+        return {c: {cat: code for code, cat in enumerate(cats)} for c, cats in self.categories_.items()}
+
+    def fit(self, df):
+        self.categories_ = {}
+        return self.partial_fit(df)
+
+    def partial_fit(self, df):
+        """Add the categories of a batch, keeping the sorted category -> code tables."""
+        for c in self._cols:
+            seen = np.asarray(df[c].dropna().unique())
+            if c in self.categories_:
+                seen = np.append(np.asarray(self.categories_[c]), seen)
+            self.categories_[c] = pd.Index(np.unique(seen))
+        return self
+
+    def add_category(self, col, value):
+        if value not in self.categories_[col]:
+            self.categories_[col] = pd.Index(np.sort(np.append(np.asarray(self.categories_[col]), value)))
+
+    def encode(self, values, col):
+        codes = pd.Categorical(values, categories=self.categories_[col]).codes.astype("int64")
+        is_unknown = codes == -1
+        if is_unknown.any():
+            self._logger.warning(f"{is_unknown.sum()} unseen categories in col '{col}' "
+                                 f"encoded as {self._unknown_value}")
+            codes[is_unknown] = self._unknown_value
+        return codes
+
+    def transform(self, df):
+        for c in self._cols:
+            df[c] = self.encode(df[c], c)
+        return df
+
     def fit_transform(self, df):
-        if isinstance(self._cols, str):
-            col = self._cols
-            df[col] = self._le.fit_transform(df[col])
-            return df
-        elif isinstance(self._cols, list):
-            cols = self._cols
-            for c in cols:
-                df[c] = self._le.fit_transform(df[c])
-            return df
+        return self.fit(df).transform(df)
 
 
 class Scalers:
-    
+
     def __init__(self):
         self._sc = StandardScaler()
-    
+
+    def fit(self, x_train):
+        self._sc.fit(x_train)
+        return self
+
+    def partial_fit(self, x):
+        """Update the mean and variance with a chunk of rows (sklearn's running Welford/Chan accumulation)."""
+        self._sc.partial_fit(x)
+        return self
+
+    def fit_chunks(self, chunks):
+        for x in chunks:
+            self.partial_fit(x)
+        return self
+
+    def transform_chunks(self, chunks, copy=True):
+        """Lazily standardize each chunk of rows."""
+        for x in chunks:
+            yield self.transform(x, copy=copy)
+
     def fit_transform(self, x_train, x_test):
         x_train, x_test = self._sc.fit_transform(x_train), self._sc.transform(x_test)
         return x_train, x_test
+
+    def transform(self, x, copy=True):
+        return self._sc.transform(x, copy=copy)
+
+
+class RandomImputer:
+    """
+    Fill the missing values of a column with random integers drawn uniformly from
+    [mean - std, mean + std), where mean and std are learned once on the training data.
+
+    Each draw is derived from (random_state, the row's key), the `key_col` value (e.g.
+    PassengerId) or, without it, the frame index label. A row is therefore always filled with the
+    same value whatever batch or chunk it is scored in and wherever it sits in it, and scoring never
+    needs to look at the training frame again. The mean and std can also be learned chunk by chunk
+    with `partial_fit`.
+    """
+
+    def __init__(self, col, random_state=0, key_col=None):
+        self.col = col
+        self.key_col = key_col
+        self._random_state = random_state
+        self._moments = (0, 0.0, 0.0)
+        self.mean_ = None
+        self.std_ = None
+
+    def __repr__(self):
+        return f"RandomImputer(col={self.col!r}, random_state={self._random_state!r}, key_col={self.key_col!r})"
+
+    def fit(self, df):
+        self._moments = (0, 0.0, 0.0)
+        return self.partial_fit(df)
+
+    def partial_fit(self, df):
+        self._moments = _update_moments(self._moments, df[self.col].to_numpy(dtype=float))
+        count, mean, m2 = self._moments
+        self.mean_ = float(mean) if count else np.nan
+        self.std_ = float(np.sqrt(m2 / (count - 1))) if count > 1 else np.nan
+        return self
+
+    def row_keys(self, df):
+        """The values seeding each row's draw: the `key_col` column when df has it, else the index."""
+        return df[self.key_col].to_numpy() if self.key_col in df else df.index.to_numpy()
+
+    def fill(self, values, keys=None):
+        """
+        Impute a float array in place, truncating every value to an integer like `transform`. `keys` are the
+        rows' `row_keys`, their positions when not given.
+        """
+        is_null = np.isnan(values)
+        if is_null.any():
+            keys = np.arange(len(values)) if keys is None else np.asarray(keys)
+            low = int(self.mean_ - self.std_)
+            high = max(int(self.mean_ + self.std_), low + 1)
+            # a seeded 64-bit hash per key, so a row's draw never depends on the other rows
+            seed = pd.util.hash_array(np.array([self._random_state]))
+            hashes = pd.util.hash_array(pd.util.hash_array(keys[is_null]) ^ seed)
+            values[is_null] = low + (hashes % np.uint64(high - low)).astype(np.int64)
+        np.trunc(values, out=values)
+        return values
+
+    def transform(self, df):
+        values = self.fill(df[self.col].to_numpy(dtype=float, copy=True), self.row_keys(df))
+        df[self.col] = values.astype(int)
+        return df
+
+    def fit_transform(self, df):
+        return self.fit(df).transform(df)
+
+
+class ValueImputer:
+    """
+    Fill the missing values of a column with a constant value, or with the training
+    mean of the column when no value is given.
+    """
+
+    def __init__(self, col, value=None):
+        self.col = col
+        self._value = value
+        self._moments = (0, 0.0, 0.0)
+        self.value_ = value
+
+    def __repr__(self):
+        return f"ValueImputer(col={self.col!r}, value={self._value!r})"
+
+    def fit(self, df):
+        self._moments = (0, 0.0, 0.0)
+        return self.partial_fit(df)
+
+    def partial_fit(self, df):
+        if self._value is None:
+            self._moments = _update_moments(self._moments, df[self.col].to_numpy(dtype=float))
+            count, mean, _ = self._moments
+            self.value_ = float(mean) if count else np.nan
+        return self
+
+    def fill(self, values):
+        """Impute a numeric float array in place."""
+        values[np.isnan(values)] = self.value_
+        return values
+
+    def transform(self, df):
+        column = df[self.col]
+        if isinstance(column.dtype, pd.CategoricalDtype) and self.value_ not in column.cat.categories:
+            column = column.cat.add_categories([self.value_])
+        df[self.col] = column.fillna(self.value_)
+        return df
+
+    def fit_transform(self, df):
+        return self.fit(df).transform(df)
+
+
+class FeatureMatrix:
+    """
+    Fused preprocessing: convert a raw frame into one preallocated, C-contiguous feature matrix.
+
+    Every feature column is imputed, encoded and written straight into its slot of the output
+    matrix, which is then standardized in place, so a row is copied once instead of once per
+    `DropPdColumns` / imputer / `Encoder` / `SetSplit` / `Scalers` step of the DataFrame path.
+    The fitted imputers, encoder and scaler are shared with that path and produce the same
+    features (up to `dtype` precision).
+
+    Attributes:
+    feature_names (list): The feature columns, in matrix column order.
+    imputers (list): The `RandomImputer` / `ValueImputer` objects, at most one per column.
+    encoder (Encoder): The categorical columns encoder.
+    scaler (Scalers): The standard scaler applied in place to the whole matrix.
+    dtype (np.dtype): The matrix dtype, float32 by default.
+
+    Methods:
+    fit_transform(df): Fit the imputers, encoder and scaler on df and return its feature matrix.
+    transform(df, out=None): Return the feature matrix of df, written into `out` when given.
+    fit_chunks(load_chunks): Out-of-core fit over the frames yielded by `load_chunks()`, one chunk resident at a time.
+    fit_transform_chunks(load_chunks): `fit_chunks`, also returning the scaled feature matrix of every row.
+    transform_chunks(chunks): Lazily yield the feature matrix of each frame of `chunks`.
+
+    Example:
+    matrix = FeatureMatrix(['Pclass', 'Sex', 'Age'], [RandomImputer('Age')], Encoder(['Sex']), Scalers())
+    x_train = matrix.fit_transform(train_df)
+    x_test = matrix.transform(test_df)
+
+    matrix.fit_chunks(lambda: DatasetLoader('train.csv').load_chunks(100000))
+    for x_chunk in matrix.transform_chunks(DatasetLoader('test.csv').load_chunks(100000)):
+        ...
+    """
+
+    def __init__(self, feature_names, imputers, encoder, scaler, dtype=np.float32):
+        self.feature_names = list(feature_names)
+        self.imputers = {imputer.col: imputer for imputer in imputers}
+        self.encoder = encoder
+        self.scaler = scaler
+        self.dtype = np.dtype(dtype)
+
+    def _fill(self, df, out):
+        for j, col in enumerate(self.feature_names):
+            imputer = self.imputers.get(col)
+            if col in self.encoder.categories_:
+                column = df[col]
+                if imputer is not None and column.isna().any():
+                    column = imputer.transform(column.to_frame())[col]
+                out[:, j] = self.encoder.encode(column, col)
+                continue
+            out[:, j] = df[col].to_numpy()
+            if isinstance(imputer, RandomImputer):
+                imputer.fill(out[:, j], imputer.row_keys(df))
+            elif imputer is not None:
+                imputer.fill(out[:, j])
+        return out
+
+    def _imputed_columns(self, df):
+        return {col for col in self.imputers if col in self.encoder.categories_ and df[col].isna().any()}
+
+    def _add_fill_categories(self, imputed_columns):
+        # the DataFrame path fits the encoder after imputation, so the fill value is a category
+        for col in imputed_columns:
+            self.encoder.add_category(col, self.imputers[col].value_)
+
+    def _empty(self, n_rows):
+        return np.empty((n_rows, len(self.feature_names)), dtype=self.dtype)
+
+    def fit_transform(self, df):
+        for imputer in self.imputers.values():
+            imputer.fit(df)
+        self.encoder.fit(df)
+        self._add_fill_categories(self._imputed_columns(df))
+        out = self._fill(df, self._empty(len(df)))
+        self.scaler.fit(out)
+        return self.scaler.transform(out, copy=False)
+
+    def fit_chunks(self, load_chunks):
+        """
+        Fit without the whole frame resident: `load_chunks` is called twice for a fresh iterator of frames,
+        the first pass fits the imputers and encoder, the second fills each chunk and updates the scaler.
+        Random fills are keyed by row, so the fit matches `fit_transform` on the concatenated chunks as long as
+        the chunks keep the rows' keys (the `RandomImputer.key_col` column or the frame index).
+        """
+        self._fit_chunks(load_chunks, keep=False)
+        return self
+
+    def fit_transform_chunks(self, load_chunks):
+        """
+        `fit_chunks`, also returning the scaled feature matrix of every row. The matrix is built from the
+        chunks of the second pass, so only it (not the raw frame) is ever fully resident.
+        """
+        return self._fit_chunks(load_chunks, keep=True)
+
+    def _fit_chunks(self, load_chunks, keep):
+        imputed_columns = set()
+        for n_chunk, df in enumerate(load_chunks()):
+            for estimator in (*self.imputers.values(), self.encoder):
+                # the first chunk resets any previous fit, later chunks update it
+                fit = estimator.partial_fit if n_chunk else estimator.fit
+                fit(df)
+            imputed_columns |= self._imputed_columns(df)
+        self._add_fill_categories(imputed_columns)
+        blocks = []
+        for n_chunk, df in enumerate(load_chunks()):
+            out = self._fill(df, self._empty(len(df)))
+            fit = self.scaler.partial_fit if n_chunk else self.scaler.fit
+            fit(out)
+            if keep:
+                blocks.append(out)
+        if not keep:
+            return None
+        return self.scaler.transform(np.concatenate(blocks) if blocks else self._empty(0), copy=False)
+
+    def transform_chunks(self, chunks):
+        for df in chunks:
+            yield self.transform(df)
+
+    def transform(self, df, out=None):
+        if out is None:
+            out = self._empty(len(df))
+        return self.scaler.transform(self._fill(df, out), copy=False)
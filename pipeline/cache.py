@@ -0,0 +1,100 @@
+"""
+A local on-disk cache for TitanicKernelSVMPipeline stage outputs.
+
+Each stage output (loaded frames, feature matrices with their fitted preprocessors, the fitted
+model, predictions) is stored as `<stage>-<key>.joblib`, where the key hashes everything the
+output depends on: input file content hashes, stage parameters and the keys of upstream stages.
+Unchanged stages are read back instead of recomputed, and changing one input only invalidates
+the stages downstream of it. Entries are written atomically (temporary file + `os.replace`) and
+the cache directory is kept under `max_size_mb` by evicting the least recently used entries.
+
+Example:
+    cache = StageCache("pipeline/data/cache", max_size_mb=512)
+    key = cache.key("load", DatasetLoader("train.csv").content_hash())
+    train_df = cache.get("load", key)
+    if train_df is None:
+        train_df = DatasetLoader("train.csv").load()
+        cache.put("load", key, train_df)
+"""
+
+import os
+import json
+import glob
+import hashlib
+import logging
+import joblib
+import sklearn
+
+# bump when a stage output format or the code producing it changes, invalidating every entry
+STAGE_CACHE_VERSION = 2
+STAGE_CACHE_EXTENSION = ".joblib"
+
+
+class StageCache:
+    """
+    A size-bounded LRU on-disk cache of pipeline stage outputs.
+
+    Attributes:
+    cache_dir (str): The cache directory, created on first write.
+    max_size_mb (float): The maximum total size of the cached entries.
+
+    Methods:
+    key(*parts): Hash the JSON-serializable parts a stage output depends on.
+    get(stage, key): The cached output, or None on a miss. Marks the entry as recently used.
+    put(stage, key, value): Store an output and evict least recently used entries past max_size_mb.
+    size(): The total size in bytes of the cached entries.
+    """
+
+    def __init__(self, cache_dir, max_size_mb=1024):
+        self.cache_dir = cache_dir
+        self.max_size_mb = max_size_mb
+        self._logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def key(*parts):
+        payload = json.dumps([STAGE_CACHE_VERSION, sklearn.__version__, *parts], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, stage, key):
+        return os.path.join(self.cache_dir, f"{stage}-{key}{STAGE_CACHE_EXTENSION}")
+
+    def _entries(self):
+        return glob.glob(os.path.join(self.cache_dir, f"*{STAGE_CACHE_EXTENSION}"))
+
+    def size(self):
+        return sum(os.path.getsize(path) for path in self._entries())
+
+    def get(self, stage, key):
+        path = self._path(stage, key)
+        try:
+            value = joblib.load(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self._logger.warning(f"Discarding Unreadable Stage Cache Entry '{path}': {e}")
+            os.remove(path)
+            return None
+        os.utime(path)  # the modification time orders the LRU eviction
+        return value
+
+    def put(self, stage, key, value):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(stage, key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        joblib.dump(value, tmp_path)
+        os.replace(tmp_path, path)
+        self._evict(keep=path)
+        return path
+
+    def _evict(self, keep=None):
+        entries = sorted(self._entries(), key=os.path.getmtime)
+        total = sum(os.path.getsize(path) for path in entries)
+        max_bytes = self.max_size_mb * 2 ** 20
+        for path in entries:
+            if total <= max_bytes:
+                break
+            if path == keep:
+                continue
+            total -= os.path.getsize(path)
+            os.remove(path)
+            self._logger.info(f"Evicted Stage Cache Entry: {path}")
@@ -7,4 +7,28 @@ EMBARKED = "Embarked"
 SEX = "Sex"
 FARE = "Fare"
 SURVIVED = "Survived"
+PCLASS = "Pclass"
+SIBSP = "SibSp"
+PARCH = "Parch"
+# optional predictions.csv score columns
+DECISION = "Decision"
+PROBABILITY = "Probability"
+TEST_COLUMNS = [PASSENGER_ID, PCLASS, NAME, SEX, AGE, SIBSP, PARCH, TICKET, FARE, CABIN, EMBARKED]
+TRAIN_COLUMNS = [PASSENGER_ID, SURVIVED] + TEST_COLUMNS[1:]
+# free-text columns the model never uses, projected away at load time
+UNUSED_COLUMNS = [NAME, TICKET, CABIN]
+# model input columns, in feature matrix order
+FEATURE_COLUMNS = [PCLASS, SEX, AGE, SIBSP, PARCH, FARE, EMBARKED]
+# explicit load dtypes, instead of pandas' inferred 64-bit numbers and object strings
+SCHEMA_DTYPES = {
+    PASSENGER_ID: "int64",
+    SURVIVED: "int8",
+    PCLASS: "int8",
+    SEX: "category",
+    AGE: "float32",
+    SIBSP: "int8",
+    PARCH: "int8",
+    FARE: "float32",
+    EMBARKED: "category",
+}
 PROFILER_REPORT_PATH = "pipeline/data/output/report"
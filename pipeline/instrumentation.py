@@ -0,0 +1,224 @@
+"""
+Stage-level timing and memory instrumentation for TitanicKernelSVMPipeline runs.
+
+Every pipeline stage runs inside `RunReport.stage(name)`, which records its wall time
+(`time.perf_counter`), its CPU time and its peak RSS. CPU time counts this process plus the
+child processes reaped during the stage (worker pools are shut down within their stage). The
+peak RSS of this process and the summed peak RSS of its live child processes (the search,
+selection, SHAP, sharded prediction and profiling pools) are sampled on a background thread
+while the stage runs, read from /proc, so they are None where /proc is not available. Shared
+memory blocks count in the RSS of every process attached to them. Stages entered several times
+(e.g. `load` for train and test, or every chunk of a streamed prediction) are aggregated under
+one name, keeping the highest peak. The report is exported as JSON next to `predictions.csv` and
+optionally as Prometheus text exposition format.
+
+Example:
+    report = RunReport("train")
+    with report.stage("load"):
+        train_df = loader.load()
+    report.save("pipeline/data/output", prometheus=True)
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import threading
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+RUN_REPORT_FILE_NAME = "run-report.json"
+PROMETHEUS_FILE_NAME = "run-metrics.prom"
+PROMETHEUS_PREFIX = "titanic_pipeline"
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def max_rss_mb(who="self"):
+    """
+    The lifetime high-water mark of the resident set size in MB, of this process ('self') or of its largest
+    reaped child process ('children'), None when the platform does not expose it.
+    """
+    if resource is None:
+        return None
+    usage = resource.RUSAGE_SELF if who == "self" else resource.RUSAGE_CHILDREN
+    max_rss = resource.getrusage(usage).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes on Linux
+    return max_rss / 2 ** 20 if sys.platform == "darwin" else max_rss / 2 ** 10
+
+
+def _rss_bytes(pid="self"):
+    with open(f"/proc/{pid}/statm", encoding="ascii") as statm:
+        return int(statm.read().split()[1]) * PAGE_SIZE
+
+
+def _child_pids():
+    pids = []
+    for task in os.listdir("/proc/self/task"):
+        with open(f"/proc/self/task/{task}/children", encoding="ascii") as children:
+            pids += children.read().split()
+    return pids
+
+
+def current_rss_mb():
+    """The current (this process, its live child processes summed) resident set sizes in MB, or (None, None)."""
+    try:
+        own = _rss_bytes()
+        pids = _child_pids()
+    except OSError:
+        return None, None
+    children = 0
+    for pid in pids:
+        try:
+            children += _rss_bytes(pid)
+        except OSError:
+            pass  # exited since it was listed
+    return own / 2 ** 20, children / 2 ** 20
+
+
+def cpu_seconds():
+    """User and system CPU time of this process plus its reaped child processes."""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+class _RssSampler:
+    """Track the peak current RSS of this process and of its children until `stop`."""
+
+    def __init__(self, interval):
+        self.peak, self.children_peak = current_rss_mb()
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._thread = None
+        if self.peak is not None and interval:
+            self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stopped.wait(self._interval):
+            self._sample()
+
+    def _sample(self):
+        own, children = current_rss_mb()
+        if own is not None:
+            self.peak = max(own, self.peak or 0.0)
+            self.children_peak = max(children, self.children_peak or 0.0)
+
+    def stop(self):
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+        self._sample()
+        return self.peak, self.children_peak
+
+
+class RunReport:
+    """
+    Collect per-stage wall time, CPU time and peak RSS of one pipeline run.
+
+    Attributes:
+    mode (str): The pipeline mode of the run ('train' or 'predict').
+    enabled (bool): When False, `stage` is a no-op and `save` writes nothing.
+    sample_interval (float): Seconds between two RSS samples while a stage runs.
+    stages (dict): stage name -> {"calls", "wall_seconds", "cpu_seconds", "peak_rss_mb", "peak_children_rss_mb"},
+        in first-run order.
+
+    Methods:
+    stage(name): Context manager timing one execution of the named stage.
+    to_dict(): The JSON-serializable run report.
+    to_prometheus(): The run report in Prometheus text exposition format.
+    save(output_path, prometheus=False): Write the JSON (and Prometheus) report, returning the written paths.
+    """
+
+    def __init__(self, mode, enabled=True, sample_interval=0.01):
+        self.mode = mode
+        self.enabled = enabled
+        self.sample_interval = sample_interval
+        self.stages = {}
+        self._started_at = time.time()
+        self._start = time.perf_counter()
+        self._logger = logging.getLogger(__name__)
+
+    @contextmanager
+    def stage(self, name):
+        if not self.enabled:
+            yield
+            return
+        sampler = _RssSampler(self.sample_interval)
+        wall, cpu = time.perf_counter(), cpu_seconds()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall, cpu_seconds() - cpu
+            peak, children_peak = sampler.stop()
+            metrics = self.stages.setdefault(name, {"calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0,
+                                                    "peak_rss_mb": None, "peak_children_rss_mb": None})
+            metrics["calls"] += 1
+            metrics["wall_seconds"] += wall
+            metrics["cpu_seconds"] += cpu
+            if peak is not None:
+                metrics["peak_rss_mb"] = max(peak, metrics["peak_rss_mb"] or 0.0)
+                metrics["peak_children_rss_mb"] = max(children_peak, metrics["peak_children_rss_mb"] or 0.0)
+            self._logger.info(f"Stage '{name}' Took {wall:.4f}s Wall, {cpu:.4f}s CPU, Peak RSS {peak} MB "
+                              f"(Children {children_peak} MB)")
+
+    def to_dict(self):
+        return {
+            "mode": self.mode,
+            "started_at": self._started_at,
+            "wall_seconds": round(time.perf_counter() - self._start, 6),
+            # lifetime high-water marks, of this process and of its largest reaped child
+            "max_rss_mb": max_rss_mb("self"),
+            "children_max_rss_mb": max_rss_mb("children"),
+            "stages": [
+                {
+                    "stage": name,
+                    "calls": metrics["calls"],
+                    "wall_seconds": round(metrics["wall_seconds"], 6),
+                    "cpu_seconds": round(metrics["cpu_seconds"], 6),
+                    "peak_rss_mb": metrics["peak_rss_mb"],
+                    "peak_children_rss_mb": metrics["peak_children_rss_mb"],
+                }
+                for name, metrics in self.stages.items()
+            ],
+        }
+
+    def to_prometheus(self):
+        report = self.to_dict()
+        labels = f'mode="{self.mode}"'
+        lines = []
+        for key, help_text in (("wall_seconds", "Wall time spent in the pipeline stage."),
+                               ("cpu_seconds", "Process and reaped child processes CPU time spent in the stage."),
+                               ("peak_rss_mb", "Process peak resident set size sampled during the stage."),
+                               ("peak_children_rss_mb",
+                                "Summed child processes peak resident set size sampled during the stage."),
+                               ("calls", "Number of times the pipeline stage ran.")):
+            metric = f"{PROMETHEUS_PREFIX}_stage_{key}"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} gauge"]
+            lines += [
+                f'{metric}{{{labels},stage="{stage["stage"]}"}} {stage[key]}'
+                for stage in report["stages"] if stage[key] is not None
+            ]
+        metric = f"{PROMETHEUS_PREFIX}_run_wall_seconds"
+        lines += [f"# HELP {metric} Wall time of the whole pipeline run.", f"# TYPE {metric} gauge",
+                  f"{metric}{{{labels}}} {report['wall_seconds']}"]
+        return "\n".join(lines) + "\n"
+
+    def save(self, output_path, prometheus=False):
+        if not self.enabled:
+            return []
+        os.makedirs(output_path, exist_ok=True)
+        report_path = os.path.join(output_path, RUN_REPORT_FILE_NAME)
+        with open(report_path, "w", encoding="utf-8") as report_file:
+            json.dump(self.to_dict(), report_file, indent=2)
+        paths = [report_path]
+        if prometheus:
+            metrics_path = os.path.join(output_path, PROMETHEUS_FILE_NAME)
+            with open(metrics_path, "w", encoding="utf-8") as metrics_file:
+                metrics_file.write(self.to_prometheus())
+            paths.append(metrics_path)
+        return paths
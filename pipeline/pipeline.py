@@ -1,27 +1,211 @@
 import os
+import json
+import joblib
+import hashlib
 import logging
+import numpy as np
 import pandas as pd
+from sklearn.model_selection import train_test_split
+from concurrent.futures import ProcessPoolExecutor
 from ml.models.svm import SVM
+from ml.models.kernel_approx import KernelApproxSVM
+from ml.models.search import KernelSearch
+from ml.models.selection import ModelSelection
+from ml.models.explain import ShapExplainer
+from ml.models.sharded import ShardedPredictor
+from ml.models.numpy_predictor import NumpyPredictor, EXPORT_FILE_NAME
+from ml.models.calibration import ScoreCalibrator
+from ml.models.compression import SupportVectorCompressor
+from ml.models.artifact import ModelArtifact
 from ml.load.datasets import DatasetLoader
-from ml.preprocess.feature import Encoder, Scalers
-from ml.functions import DropPdColumns, FeatureEngine, SetSplit, PandasProfiler
-from pipeline.constants import PASSENGER_ID, NAME, TICKET, CABIN, AGE, EMBARKED, SEX, FARE, SURVIVED
+from ml.preprocess.feature import Encoder, Scalers, RandomImputer, ValueImputer, FeatureMatrix
+from ml.functions import DropPdColumns, FeatureEngine, NullSummary, PandasProfiler
+from pipeline.instrumentation import RunReport
+from pipeline.cache import StageCache
+from pipeline.writer import PredictionWriter
+from pipeline.constants import PASSENGER_ID, NAME, TICKET, CABIN, AGE, EMBARKED, SEX, FARE, SURVIVED, \
+    DECISION, PROBABILITY, TRAIN_COLUMNS, TEST_COLUMNS, UNUSED_COLUMNS, FEATURE_COLUMNS, SCHEMA_DTYPES
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
+DEFAULT_PROFILING = {
+    "enabled": True,  # generate the train & test ydata-profiling HTML reports
+    "minimal": False,  # build the cheaper minimal report instead of the full one
+    "sample_size": None,  # profile a seeded sample of at most this many rows
+    "background": False,  # render reports in a process pool concurrently with training
+}
+DEFAULT_MODEL = {
+    "engine": "svc",  # 'svc' (exact RBF kernel) or 'kernel-approximation' (scales to large training sets)
+}
+DEFAULT_SEARCH = {
+    "enabled": False,  # tune C/gamma with a cross-validated search before the final fit
+    "strategy": "grid",  # 'grid' or 'halving' (successive halving)
+    "C": [0.1, 1.0, 10.0, 100.0],
+    "gamma": ["scale", 0.01, 0.1, 1.0],
+    "cv": 5,
+    "n_jobs": -1,  # worker processes, -1 uses every core
+    "factor": 3,  # successive halving elimination rate
+    "max_samples": 5000,  # cap on search rows, the cached distance matrix is n x n
+    "memory_mb": 2048,  # bound on the shared distance matrix plus a kernel and a fold copy per worker
+}
+DEFAULT_SELECTION = {
+    "enabled": False,  # fit every candidate spec concurrently and keep the best, replacing the `model` section
+    "candidates": [],  # model specs: optional 'engine' (default 'svc') plus its arguments (kernel, C, gamma, ...)
+    "strategy": "best",  # 'best' keeps the best cross-validated candidate, 'vote' ensembles the top_k ones
+    "top_k": 3,
+    "cv": 5,
+    "n_jobs": -1,  # worker processes sharing one read-only copy of the training matrix, -1 uses every core
+}
+DEFAULT_PREDICTION = {
+    "n_jobs": 1,  # worker processes scoring row shards of the test matrix, -1 uses every core and 1 runs inline
+    "shard_size": 50000,  # test rows per worker task
+    "engine": "svc",  # 'numpy' scores a binary SVC with the blocked NumPy decision function and exports it
+    "dtype": "float64",  # 'numpy' engine computation dtype, float32 halves the memory traffic
+    "block_size": 1024,  # 'numpy' engine rows per kernel block
+}
+DEFAULT_COMPRESSION = {
+    "enabled": False,  # score with a reduced support vector set when it keeps the accuracy within tolerance
+    "ratios": [0.05, 0.1, 0.25, 0.5],  # candidate reduced-set sizes as fractions of the support vectors, smallest first
+    "tolerance": 0.01,  # largest accepted held-out accuracy drop against the full model
+}
+DEFAULT_SCORES = {
+    "decision": False,  # add the SVM decision_function margins to predictions.csv
+    "calibration": None,  # 'sigmoid' (Platt) or 'isotonic' margin -> probability calibration, None disables it
+    "holdout": 0.2,  # fraction of the training rows held out (not fitted on) to calibrate and check compression on
+}
+DEFAULT_EXPLAIN = {
+    "enabled": False,  # write Kernel SHAP values of the test predictions next to predictions.csv
+    "background": "kmeans",  # summarize the training matrix with 'kmeans' centroids or a seeded 'sample'
+    "background_size": 50,
+    "nsamples": 200,  # coalitions evaluated per explained row
+    "batch_size": 64,  # rows per parallel task
+    "n_jobs": -1,  # worker processes, -1 uses every core
+    "max_rows": 200,  # explain a seeded sample of at most this many test rows, null explains every row
+    "formats": ["npy", "parquet"],
+}
+DEFAULT_OUTPUT = {
+    "format": "csv",  # predictions file format, 'csv' or 'parquet'
+    "compression": None,  # 'gzip', 'bz2' or 'xz' for csv, a parquet codec ('snappy', 'zstd', ...), None for none
+    "buffer_rows": 100000,  # rows buffered before a write is issued
+    "asynchronous": True,  # write on a background thread, overlapping the next chunk's prediction
+}
+DEFAULT_INSTRUMENTATION = {
+    "enabled": True,  # write per-stage wall time, CPU time and peak RSS to run-report.json
+    "prometheus": False,  # also write the run report as Prometheus text (run-metrics.prom)
+}
+DEFAULT_CACHE = {
+    "enabled": False,  # reuse stage outputs (frames, feature matrices, fitted model, predictions) across runs
+    "path": "pipeline/data/cache",
+    "max_size_mb": 1024,  # least recently used entries are evicted past this size
+}
+DEFAULT_TRAINING = {
+    "incremental": False,  # warm-start from the persisted model's support vectors plus the new labeled rows
+    "full_refit_every": 7,  # incremental refits before the next full retrain
+    "chunk_size": None,  # stream the training file through the preprocessing in chunks of this many rows
+}
+ENGINES = {
+    "svc": SVM,
+    "kernel-approximation": KernelApproxSVM,
+}
+
 
 class TitanicKernelSVMPipeline:
 
-    def __init__(self, train_ds_path, test_ds_path, output_path):
+    def __init__(self, train_ds_path, test_ds_path, output_path, model_path=None, profiling=None, model=None,
+                 search=None, columnar_cache=None, instrumentation=None, cache=None,
+                 training=None, selection=None, explain=None, scores=None, prediction=None, compression=None,
+                 output=None):
         self.train_ds_path = train_ds_path
         self.test_ds_path = test_ds_path
         self.output_path = output_path  # pipeline/data/output
+        self.model_path = model_path or output_path
+        self.profiling = {**DEFAULT_PROFILING, **(profiling or {})}
+        self.model = {**DEFAULT_MODEL, **(model or {})}
+        self.search = {**DEFAULT_SEARCH, **(search or {})}
+        self.columnar_cache = columnar_cache  # directory where CSV inputs are cached as Parquet
+        self.instrumentation = {**DEFAULT_INSTRUMENTATION, **(instrumentation or {})}
+        self.cache = {**DEFAULT_CACHE, **(cache or {})}
+        self.training = {**DEFAULT_TRAINING, **(training or {})}
+        self.selection = {**DEFAULT_SELECTION, **(selection or {})}
+        self.explain = {**DEFAULT_EXPLAIN, **(explain or {})}
+        self.scores = {**DEFAULT_SCORES, **(scores or {})}
+        self.prediction = {**DEFAULT_PREDICTION, **(prediction or {})}
+        self.compression = {**DEFAULT_COMPRESSION, **(compression or {})}
+        self.output = {**DEFAULT_OUTPUT, **(output or {})}
 
         self._logger = logging.getLogger(__name__)
         self._feat = FeatureEngine()
-        self._slrs = Scalers()
-        self._svm = SVM()
+        self._reset_model()
         self._y_pred = None
+        self._scoring = None  # (scoring model, ShardedPredictor) of the current run
+        self._decision = None
+        self._probability = None
+        self.null_summaries = {}
+        self._profiler_pool = None
+        self._profiler_reports = []
+        self.run_report = RunReport(None, enabled=False)
+        self._stage_cache = StageCache(self.cache["path"], self.cache["max_size_mb"]) \
+            if self.cache["enabled"] else None
+
+    def _reset_model(self):
+        """Unfitted preprocessing and model state built from the current configuration."""
+        self._encoder = Encoder([SEX, EMBARKED])
+        self._slrs = Scalers()
+        self._svm = self._build_model(self.model)
+        self._imputers = [
+            RandomImputer(AGE, key_col=PASSENGER_ID),
+            ValueImputer(EMBARKED, "S"),
+            ValueImputer(FARE)
+        ]
+        self._feature_names = list(FEATURE_COLUMNS)
+        self._matrix = self._build_matrix()
+        self._search_result = None
+        self._training_state = None  # rows trained on and incremental refits since the last full fit
+        self._calibrator = None
+        self._compressed = None
+
+    @staticmethod
+    def _build_model(model_conf):
+        model_args = dict(model_conf)
+        engine = model_args.pop("engine")
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown model engine '{engine}', expected one of {list(ENGINES)}.")
+        return ENGINES[engine](**model_args)
+
+    def _build_matrix(self):
+        return FeatureMatrix(self._feature_names, self._imputers, self._encoder, self._slrs)
+
+    def _dataset_loader(self, ds_path, schema_columns):
+        columns = [c for c in schema_columns if c not in UNUSED_COLUMNS]
+        dtypes = {c: SCHEMA_DTYPES[c] for c in columns}
+        if self.columnar_cache and str(ds_path).lower().endswith(".csv"):
+            ds_path = DatasetLoader(ds_path, columns=columns, dtypes=dtypes).cache_columnar(self.columnar_cache)
+            self._logger.info(f"Using Columnar Cache: {ds_path}")
+        return DatasetLoader(ds_path, columns=columns, dtypes=dtypes)
+
+    def _stage_key(self, stage, *parts):
+        return self._stage_cache.key(stage, *parts) if self._stage_cache is not None else None
+
+    def _cached(self, stage, key, compute):
+        """Return the cached output of `stage` for `key`, computing and caching it on a miss."""
+        if key is None:
+            return compute()
+        value = self._stage_cache.get(stage, key)
+        if value is not None:
+            self._logger.info(f"Stage Cache Hit For '{stage}': {key[:16]}")
+            return value
+        value = compute()
+        self._stage_cache.put(stage, key, value)
+        return value
+
+    def _load_key(self, ds_path, schema_columns):
+        columns = [c for c in schema_columns if c not in UNUSED_COLUMNS]
+        return self._stage_key("load", DatasetLoader(ds_path).content_hash(), columns, SCHEMA_DTYPES) \
+            if self._stage_cache is not None else None
+
+    def _load_dataset(self, ds_path, schema_columns):
+        key = self._load_key(ds_path, schema_columns)
+        return self._cached("load", key, lambda: self._dataset_loader(ds_path, schema_columns).load()), key
 
     def _if_dir_not_exists_create(self, output_dir):
         if not os.path.exists(output_dir):
@@ -36,84 +220,680 @@ class TitanicKernelSVMPipeline:
                 TICKET,
                 CABIN
             ]
-            drop_train_cols = DropPdColumns(train_df, cols_to_drop_train)
+            drop_train_cols = DropPdColumns(train_df, cols_to_drop_train, errors="ignore")
             drop_train_cols.drop()
+            for imputer in self._imputers:
+                train_df = imputer.fit_transform(train_df)
+            train_df = self._encoder.fit_transform(train_df)
+            test_df = self.preprocess_test_dataset(test_df)
+            return train_df, test_df
+        except Exception as e:
+            raise self._logger.error(f"Fatal Error On 'preprocess_dataset' Step. Trace: {e}")
+
+    def preprocess_test_dataset(self, test_df):
+        try:
             cols_to_drop_test = [
                 NAME,
                 TICKET,
                 CABIN
             ]
-            drop_test_cols = DropPdColumns(test_df, cols_to_drop_test)
+            drop_test_cols = DropPdColumns(test_df, cols_to_drop_test, errors="ignore")
             drop_test_cols.drop()
-            self._feat.nan_inputer([train_df, test_df], AGE)
-            self._feat.common_value_inputer(train_df, EMBARKED, "S")
-            test_df = self._feat.mean_inputer(test_df, FARE)
-            train_df = Encoder([SEX, EMBARKED]).fit_transform(train_df)
-            test_df = Encoder([SEX, EMBARKED]).fit_transform(test_df)
-            return train_df, test_df
+            for imputer in self._imputers:
+                test_df = imputer.transform(test_df)
+            test_df = self._encoder.transform(test_df)
+            return test_df
         except Exception as e:
-            raise self._logger.error(f"Fatal Error On 'preprocess_dataset' Step. Trace: {e}")
+            self._logger.error(f"Fatal Error On 'preprocess_test_dataset' Step. Trace: {e}")
+            raise
+
+    def transform_dataset(self, train_df, test_df):
+        """
+        Fused alternative to `preprocess_dataset` + `SetSplit` + `Scalers`: build the scaled train
+        and test feature matrices directly from the raw frames, leaving the frames untouched.
+        """
+        try:
+            x_train = self._matrix.fit_transform(train_df)
+            x_test = self._matrix.transform(test_df)
+            return x_train, x_test
+        except Exception as e:
+            self._logger.error(f"Fatal Error On 'transform_dataset' Step. Trace: {e}")
+            raise
+
+    def transform_train_chunks(self, chunk_size):
+        """
+        Streaming alternative to `transform_dataset` for the training file: fit the preprocessing over chunks
+        of chunk_size rows (`FeatureMatrix.fit_transform_chunks`), so the raw training frame is never resident,
+        only its feature matrix. Returns the training matrix and labels.
+        """
+        try:
+            loader = self._dataset_loader(self.train_ds_path, TRAIN_COLUMNS)
+            null_summary = NullSummary("train_df")
+            labels = []
+            n_passes = 0
+
+            def load_chunks():
+                nonlocal n_passes
+                n_passes += 1
+                for train_df in loader.load_chunks(chunk_size):
+                    # the matrix is built on the second pass, the null audit and labels come from the first
+                    if n_passes == 1:
+                        null_summary.update(train_df)
+                        labels.append(train_df[SURVIVED].to_numpy())
+                    yield train_df
+
+            x_train = self._matrix.fit_transform_chunks(load_chunks)
+            self._logger.info(null_summary)
+            self.null_summaries[null_summary.name] = null_summary
+            return x_train, np.concatenate(labels)
+        except Exception as e:
+            self._logger.error(f"Fatal Error On 'transform_train_chunks' Step. Trace: {e}")
+            raise
+
+    def _submission(self, test_df):
+        submission = pd.DataFrame({
+            PASSENGER_ID: test_df[PASSENGER_ID].to_numpy(),
+            SURVIVED: self._y_pred
+        })
+        if self._decision is not None:
+            submission[DECISION] = self._decision
+        if self._probability is not None:
+            submission[PROBABILITY] = self._probability
+        return submission
+
+    def _prediction_writer(self, output_path):
+        self._if_dir_not_exists_create(output_path)
+        return PredictionWriter(output_path, fmt=self.output["format"], compression=self.output["compression"],
+                                buffer_rows=self.output["buffer_rows"], asynchronous=self.output["asynchronous"])
 
     def persist(self, test_df, output_path):
+        """Write the predictions file through a temporary file atomically renamed into place."""
         try:
-            self._if_dir_not_exists_create(output_path)
-            submission = pd.DataFrame({
-                PASSENGER_ID: test_df[PASSENGER_ID],
-                SURVIVED: self._y_pred
-            })
-            predictions_csv_path = os.path.join(output_path, "predictions.csv")
-            submission.to_csv(predictions_csv_path, index=False)
-            self._logger.info(f'Successfully Persisted SVM Model Predictions In: {predictions_csv_path}')
+            with self._prediction_writer(output_path) as writer:
+                writer.write(self._submission(test_df))
+            self._logger.info(f'Successfully Persisted SVM Model Predictions In: {writer.path}')
         except Exception as e:
             raise self._logger.error(f"Fatal Error On 'persist' Step. Trace: {e}")
 
+    def persist_model(self, output_path):
+        try:
+            self._if_dir_not_exists_create(output_path)
+            artifact = ModelArtifact(
+                encoder=self._encoder,
+                scaler=self._slrs,
+                svm=self._svm,
+                imputers=self._imputers,
+                feature_names=self._feature_names,
+                search=self._search_result,
+                training=self._training_state,
+                calibrator=self._calibrator,
+                compressed=self._compressed
+            )
+            artifact_path = artifact.save(output_path)
+            self._logger.info(f'Successfully Persisted SVM Model Artifact In: {artifact_path}')
+            predictor = self._scoring_model()
+            if isinstance(predictor, NumpyPredictor):
+                export_path = predictor.save(os.path.join(output_path, EXPORT_FILE_NAME))
+                self._logger.info(f'Successfully Exported NumPy SVM Predictor In: {export_path}')
+        except Exception as e:
+            self._logger.error(f"Fatal Error On 'persist_model' Step. Trace: {e}")
+            raise
+
+    def load_model(self, model_path):
+        artifact = ModelArtifact.load(model_path)
+        self._encoder = artifact.encoder
+        self._slrs = artifact.scaler
+        self._svm = artifact.svm
+        self._imputers = artifact.imputers
+        self._feature_names = artifact.feature_names
+        self._search_result = artifact.search
+        self._training_state = artifact.training
+        self._calibrator = artifact.calibrator
+        self._compressed = artifact.compressed
+        self._matrix = self._build_matrix()
+        self._logger.info(f'Successfully Loaded SVM Model Artifact From: {model_path}')
+
+    def tune(self, x_train, y_train):
+        try:
+            search = KernelSearch(
+                param_grid={"C": self.search["C"], "gamma": self.search["gamma"]},
+                strategy=self.search["strategy"],
+                cv=self.search["cv"],
+                n_jobs=self.search["n_jobs"],
+                factor=self.search["factor"],
+                max_samples=self.search["max_samples"],
+                memory_mb=self.search["memory_mb"]
+            ).fit(x_train, y_train)
+            self._svm.set_params(**search.best_params_)
+            self._search_result = {
+                "strategy": search.strategy,
+                "best_params": search.best_params_,
+                "best_score": search.best_score_
+            }
+            self._logger.info(f"Best SVM Params: {search.best_params_}, CV Score: {search.best_score_:.4f}")
+        except Exception as e:
+            self._logger.error(f"Fatal Error On 'tune' Step. Trace: {e}")
+            raise
+
+    def select(self, x_train, y_train):
+        try:
+            selection = ModelSelection(
+                candidates=self.selection["candidates"],
+                engines=ENGINES,
+                strategy=self.selection["strategy"],
+                top_k=self.selection["top_k"],
+                cv=self.selection["cv"],
+                n_jobs=self.selection["n_jobs"]
+            ).fit(x_train, y_train)
+            self._svm = selection.best_model_
+            self._search_result = {
+                "strategy": f"selection-{selection.strategy}",
+                "best_params": selection.best_spec_,
+                "best_score": selection.best_score_,
+                "results": selection.results_
+            }
+            self._logger.info(f"Selected Model: {selection.best_spec_}, CV Score: {selection.best_score_:.4f}")
+        except Exception as e:
+            self._logger.error(f"Fatal Error On 'select' Step. Trace: {e}")
+            raise
+
+    def calibrate(self, x_holdout, y_holdout, model=None):
+        """Fit the score calibration on the held-out margins of `model`, the fitted model by default."""
+        try:
+            self._calibrator = ScoreCalibrator(self.scores["calibration"]).fit(
+                (model or self._svm).decision_function(x_holdout), y_holdout)
+            self._logger.info(f"Fitted '{self.scores['calibration']}' Score Calibration On {len(y_holdout)} "
+                              f"Held-Out Rows")
+        except Exception as e:
+            self._logger.error(f"Fatal Error On 'calibrate' Step. Trace: {e}")
+            raise
+
+    def compress(self, x_holdout, y_holdout):
+        """
+        Reduce the support vector set of the fitted model (`SupportVectorCompressor`), keeping the smallest
+        candidate within `tolerance` accuracy of the full model on held-out rows the model was not fitted on.
+        Returns (the compressed predictor or None, the support vector count, prediction latency and accuracy
+        before/after report or None).
+        """
+        try:
+            if self._svm.kernel_expansion() is None:
+                self._logger.warning("Support Vector Compression Needs A Binary SVC, Keeping The Full Model")
+                return None, None
+            compressor = SupportVectorCompressor(self.compression["ratios"], self.compression["tolerance"])
+            compressed, report = compressor.compress(self._svm, x_holdout, y_holdout)
+            self._logger.info(f"Support Vectors {report['support_vectors']['before']} -> "
+                              f"{report['support_vectors']['after']}, Accuracy {report['accuracy']['before']} -> "
+                              f"{report['accuracy']['after']}")
+            return compressed, report
+        except Exception as e:
+            self._logger.error(f"Fatal Error On 'compress' Step. Trace: {e}")
+            raise
+
+    def _holdout_split(self, y):
+        """
+        The (fitted, held-out) row indices of a stratified seeded `holdout` split of the labels `y`, which the
+        calibration and the compression tolerance are evaluated on, or (every row, None) when both are disabled.
+        """
+        rows = np.arange(len(y))
+        if not self.scores["calibration"] and not self.compression["enabled"]:
+            return rows, None
+        return train_test_split(rows, test_size=self.scores["holdout"], stratify=y, random_state=0)
+
+    def _compress_and_recalibrate(self, x_holdout, y_holdout):
+        """Compress the fitted model and refit the calibration on the accepted compressed predictor's margins."""
+        compressed, report = self.compress(x_holdout, y_holdout)
+        if compressed is not None and self._calibrator is not None:
+            self.calibrate(x_holdout, y_holdout, compressed)
+        return compressed, report, self._calibrator
+
+    def save_compression_report(self, report, output_path):
+        if report is None:
+            return
+        try:
+            self._if_dir_not_exists_create(output_path)
+            report_path = os.path.join(output_path, "compression-report.json")
+            with open(report_path, "w", encoding="utf-8") as report_file:
+                json.dump(report, report_file, indent=2)
+            self._logger.info(f'Successfully Persisted Compression Report In: {report_path}')
+        except Exception as e:
+            self._logger.error(f"Fatal Error On 'save_compression_report' Step. Trace: {e}")
+            raise
+
+    def _scoring_model(self):
+        """
+        The fitted model, its accepted compressed NumpyPredictor, or its NumpyPredictor export with the
+        'numpy' prediction engine.
+        """
+        if self.compression["enabled"] and self._compressed is not None:
+            return NumpyPredictor(**{**self._compressed.kernel_expansion(), "dtype": self.prediction["dtype"],
+                                     "block_size": self.prediction["block_size"]})
+        if self.prediction["engine"] != "numpy":
+            return self._svm
+        if self._svm.kernel_expansion() is None:
+            self._logger.warning("The 'numpy' Prediction Engine Needs A Binary SVC, Scoring With The Model Instead")
+            return self._svm
+        return NumpyPredictor.from_svm(self._svm, self.prediction["dtype"], self.prediction["block_size"])
+
+    def _scorer(self):
+        """
+        The scoring model and its ShardedPredictor, created on first use and kept until `_release_scorer`,
+        so chunked scoring starts the worker pool and publishes the model once per run.
+        """
+        if self._scoring is None:
+            self._scoring = (self._scoring_model(),
+                             ShardedPredictor(self.prediction["n_jobs"], self.prediction["shard_size"]))
+        return self._scoring
+
+    def _release_scorer(self):
+        scoring, self._scoring = self._scoring, None
+        if scoring is not None:
+            scoring[1].close()
+
+    def _predict(self, x_test):
+        """
+        Predict labels, plus the decision margins and calibrated probabilities when the `scores` section asks
+        for them. Labels and margins come from one decision_function pass, never a second kernel evaluation.
+        """
+        self._decision = self._probability = None
+        model, predictor = self._scorer()
+        if not self.scores["decision"] and self._calibrator is None:
+            self._y_pred = predictor.predict(model, x_test)
+            return self._y_pred
+        self._y_pred, decision = predictor.predict_scores(model, x_test)
+        if self.scores["decision"]:
+            self._decision = decision
+        if self._calibrator is not None:
+            self._probability = self._calibrator.predict_proba(decision)
+        return self._y_pred
+
+    def explain_predictions(self, x_train, x_test, test_df, output_path):
+        """
+        Write the Kernel SHAP values of the test predictions as shap-values.npy (rows x features) and/or
+        shap-values.parquet (PassengerId, one column per feature and the base value). With the stage
+        cache enabled, explanations are reused per model version (a hash of the fitted model) and test matrix.
+        """
+        try:
+            explainer_args = {k: v for k, v in self.explain.items() if k not in ("enabled", "formats")}
+            key = self._stage_key(
+                "explain", joblib.hash(self._svm),
+                hashlib.sha256(np.ascontiguousarray(x_test).tobytes()).hexdigest(), explainer_args
+            ) if self._stage_cache is not None else None
+
+            def explain():
+                explainer = ShapExplainer(**explainer_args)
+                rows, values = explainer.explain(self._svm, x_train, x_test)
+                return rows, values, explainer.expected_value_
+
+            rows, values, expected_value = self._cached("explain", key, explain)
+            self._if_dir_not_exists_create(output_path)
+            if "npy" in self.explain["formats"]:
+                npy_path = os.path.join(output_path, "shap-values.npy")
+                np.save(npy_path, values)
+                self._logger.info(f'Successfully Persisted SHAP Values In: {npy_path}')
+            if "parquet" in self.explain["formats"]:
+                shap_df = pd.DataFrame(values, columns=self._feature_names)
+                shap_df.insert(0, PASSENGER_ID, test_df[PASSENGER_ID].to_numpy()[rows])
+                shap_df["base_value"] = expected_value
+                parquet_path = os.path.join(output_path, "shap-values.parquet")
+                shap_df.to_parquet(parquet_path, index=False)
+                self._logger.info(f'Successfully Persisted SHAP Values In: {parquet_path}')
+        except Exception as e:
+            self._logger.error(f"Fatal Error On 'explain_predictions' Step. Trace: {e}")
+            raise
+
     def save_profiler_report(self, pandas_df, output_path, dataset_type: str):
-        profiler = PandasProfiler(
-            pandas_df=pandas_df,
-            title=f"Pandas Profiler {dataset_type} Dataset"
-        )
+        if not self.profiling["enabled"]:
+            self._logger.info(f"Profiler Report Disabled, Skip {dataset_type} Dataset.")
+            return
         profiler_report_path = os.path.join(output_path, "report")
         self._if_dir_not_exists_create(profiler_report_path)
         report_path = f"{profiler_report_path}/{dataset_type}-report.html"
+        background = self.profiling["background"]
+        profiler = PandasProfiler(
+            # the fused feature matrix transform never mutates the raw frames, so no snapshot copy; the sample
+            # is drawn here, so a background worker is only sent the sampled rows
+            pandas_df=pandas_df,
+            title=f"Pandas Profiler {dataset_type} Dataset",
+            minimal=self.profiling["minimal"],
+            sample_size=self.profiling["sample_size"]
+        )
+        if background:
+            if self._profiler_pool is None:
+                self._profiler_pool = ProcessPoolExecutor(max_workers=2)
+            self._profiler_reports.append(self._profiler_pool.submit(profiler.save_report, report_path))
+            self._logger.info(f"Profiler Report Submitted To Background Pool: '{report_path}'.")
+            return
         profiler.save_report(report_path)
         self._logger.info(f"Profiler Report Generated Successfully On: '{report_path}'.")
 
+    def wait_profiler_reports(self):
+        try:
+            for report in self._profiler_reports:
+                self._logger.info(f"Profiler Report Generated Successfully On: '{report.result()}'.")
+        except Exception as e:
+            self._logger.error(f"Fatal Error On 'save_profiler_report' Step. Trace: {e}")
+            raise
+        finally:
+            self._profiler_reports = []
+            if self._profiler_pool is not None:
+                self._profiler_pool.shutdown()
+                self._profiler_pool = None
+
+    def save_run_report(self, output_path):
+        try:
+            for report_path in self.run_report.save(output_path, prometheus=self.instrumentation["prometheus"]):
+                self._logger.info(f'Successfully Persisted Run Report In: {report_path}')
+        except Exception as e:
+            self._logger.error(f"Fatal Error On 'save_run_report' Step. Trace: {e}")
+            raise
+
     def process(self):
-        self._logger.info(f'Load Train Dataset: {self.train_ds_path}')
-        train_loader = DatasetLoader(self.train_ds_path)
-        train_df = train_loader.load()
-        self._logger.info(f'Successful Load.')
-        self._feat.check_nulls(test_df=train_df)
+        self.run_report = RunReport("train", enabled=self.instrumentation["enabled"])
+        # the preprocessing configuration, captured before anything is fitted
+        preprocess_params = [self._feature_names, repr(self._imputers), repr(self._encoder), FeatureMatrix.__name__]
+        chunk_size = self.training["chunk_size"]
+        if chunk_size:
+            # the training file is streamed through the preprocessing stage, never loaded whole
+            train_df, train_key = None, self._load_key(self.train_ds_path, TRAIN_COLUMNS)
+            self._logger.info(f'Stream Train Dataset: {self.train_ds_path} In Chunks Of {chunk_size} Rows, '
+                              f'Skip Its Profiler Report.')
+        else:
+            self._logger.info(f'Load Train Dataset: {self.train_ds_path}')
+            with self.run_report.stage("load"):
+                train_df, train_key = self._load_dataset(self.train_ds_path, TRAIN_COLUMNS)
+            self._logger.info(f'Successful Load.')
+            with self.run_report.stage("null_check"):
+                self.null_summaries.update(self._feat.check_nulls(train_df=train_df))
 
-        self._logger.info(f'Generate Profiler Report for Train Dataset.')
-        self.save_profiler_report(train_df, self.output_path, "train")
+            self._logger.info(f'Generate Profiler Report for Train Dataset.')
+            with self.run_report.stage("profiling"):
+                self.save_profiler_report(train_df, self.output_path, "train")
 
         self._logger.info(f'Load Test Dataset: {self.test_ds_path}')
-        test_loader = DatasetLoader(self.test_ds_path)
-        test_df = test_loader.load()
+        with self.run_report.stage("load"):
+            test_df, test_key = self._load_dataset(self.test_ds_path, TEST_COLUMNS)
         self._logger.info(f'Successful Load.')
-        self._feat.check_nulls(test_df=test_df)
+        with self.run_report.stage("null_check"):
+            self.null_summaries.update(self._feat.check_nulls(test_df=test_df))
 
         self._logger.info(f'Generate Profiler Report for Test Dataset.')
-        self.save_profiler_report(test_df, self.output_path, "test")
+        with self.run_report.stage("profiling"):
+            self.save_profiler_report(test_df, self.output_path, "test")
+
+        def preprocess():
+            if chunk_size:
+                x_train, y_train = self.transform_train_chunks(chunk_size)
+                x_test = self._matrix.transform(test_df)
+            else:
+                x_train, x_test = self.transform_dataset(train_df, test_df)
+                y_train = train_df[SURVIVED].to_numpy()
+            return x_train, x_test, y_train, self._imputers, self._encoder, self._slrs
+
+        self._logger.info('Start Train & Test Feature Matrix Transform')
+        with self.run_report.stage("preprocess"):
+            preprocess_key = self._stage_key("preprocess", train_key, test_key, preprocess_params)
+            x_train, x_test, y_train, self._imputers, self._encoder, self._slrs = self._cached(
+                "preprocess", preprocess_key, preprocess)
+            self._matrix = self._build_matrix()
+        self._logger.info('End Train & Test Feature Matrix Transform')
+
+        # calibrate (instead of SVC(probability=True) cross-validated refits) and check the compression on rows
+        # the model never saw
+        fit_rows, holdout_rows = self._holdout_split(y_train)
+
+        def fit():
+            x_fit, y_fit = (x_train, y_train) if holdout_rows is None else (x_train[fit_rows], y_train[fit_rows])
+            if self.selection["enabled"]:
+                self._logger.info('Start SVM Model Selection')
+                with self.run_report.stage("select"):
+                    self.select(x_fit, y_fit)
+                self._logger.info('End SVM Model Selection')
+            else:
+                if self.search["enabled"]:
+                    self._logger.info('Start SVM Hyperparameter Search')
+                    with self.run_report.stage("tune"):
+                        self.tune(x_fit, y_fit)
+                    self._logger.info('End SVM Hyperparameter Search')
+                self._svm.fit(x_fit, y_fit)
+            if self.scores["calibration"]:
+                self.calibrate(x_train[holdout_rows], y_train[holdout_rows])
+            return self._svm, self._search_result, self._calibrator
+
+        self._logger.info('Start SVM Model Fit')
+        with self.run_report.stage("fit"):
+            fit_key = self._stage_key("fit", preprocess_key, self.model, self.search, self.selection,
+                                      self.scores["calibration"], self.scores["holdout"], self.compression["enabled"])
+            self._svm, self._search_result, self._calibrator = self._cached("fit", fit_key, fit)
+        self._logger.info('End SVM Model Fit')
+
+        model_key = fit_key
+        if self.compression["enabled"]:
+            self._logger.info('Start SVM Support Vector Compression')
+            with self.run_report.stage("compress"):
+                model_key = self._stage_key("compress", fit_key, self.compression)
+                self._compressed, report, self._calibrator = self._cached(
+                    "compress", model_key,
+                    lambda: self._compress_and_recalibrate(x_train[holdout_rows], y_train[holdout_rows]))
+                self.save_compression_report(report, self.output_path)
+            self._logger.info('End SVM Support Vector Compression')
+
+        self._logger.info('Start SVM Model Predict')
+        with self.run_report.stage("predict"):
+            try:
+                self._y_pred, self._decision, self._probability = self._cached(
+                    "predict", self._stage_key("predict", model_key, self.scores["decision"],
+                                               self.prediction["engine"], self.prediction["dtype"]),
+                    lambda: (self._predict(x_test), self._decision, self._probability))
+            finally:
+                self._release_scorer()
+        self._logger.info('End SVM Model Predict')
 
-        self._logger.info('Start Train & Test Datasets Preprocess')
-        train_df, test_df = self.preprocess_dataset(train_df, test_df)
-        self._logger.info('End Train & Test Datasets Preprocess')
+        with self.run_report.stage("score"):
+            self._svm.score(x_train, y_train)
 
-        self._logger.info('Start Split Train & Test Datasets')
-        s = SetSplit(train_df, test_df)
-        s.split(train_col=SURVIVED, test_col=PASSENGER_ID)
-        self._logger.info('End Split Train & Test Datasets')
+        if self.explain["enabled"]:
+            with self.run_report.stage("explain"):
+                self.explain_predictions(x_train, x_test, test_df, self.output_path)
 
-        self._logger.info('Start Standard Scaler Transform')
-        x_train, x_test = self._slrs.fit_transform(s.X_train, s.X_test)
-        self._logger.info('End Standard Scaler Fit')
+        with self.run_report.stage("persist"):
+            self._training_state = {"rows": len(y_train), "incremental_fits": 0}
+            self.persist(test_df, self.output_path)
+            self.persist_model(self.output_path)
+
+        with self.run_report.stage("profiling"):
+            self.wait_profiler_reports()
+
+        self.save_run_report(self.output_path)
+
+    def _needs_full_refit(self):
+        try:
+            self.load_model(self.model_path)
+        except (FileNotFoundError, ValueError) as e:
+            self._logger.info(f"No Usable Model Artifact To Warm Start From, Full Retrain. {e}")
+            return True
+        if self._training_state is None:
+            return True
+        calibration = self._calibrator.method if self._calibrator is not None else None
+        if calibration != self.scores["calibration"]:
+            self._logger.info(f"Score Calibration Changed From '{calibration}' To '{self.scores['calibration']}', "
+                              f"Full Retrain")
+            return True
+        if self._training_state["incremental_fits"] + 1 >= self.training["full_refit_every"]:
+            self._logger.info(f"Periodic Full Retrain After {self._training_state['incremental_fits']} "
+                              f"Incremental Refits")
+            return True
+        return False
+
+    def _full_refit(self):
+        # the artifact loaded to decide on a warm start must not leak its engine, params or calibrator
+        self._reset_model()
+        self.process()
+
+    def retrain(self):
+        """
+        Train on the labeled rows appended to the training file since the persisted model was fit.
+
+        The model is warm-started from its own support vectors plus the new rows (`SVM.fit_incremental`),
+        reusing the persisted imputers, encoder and scaler, so only the new rows are preprocessed. Falls
+        back to a full `process()` when there is no usable artifact, when the training file shrank (it
+        is expected to be append-only), when the `scores.calibration` method differs from the artifact's, and
+        every `full_refit_every` runs to refresh every statistic. A full retrain starts from a model built from the
+        current `model`, `scores` and `compression` sections, not from the persisted artifact.
+
+        With calibration or compression, a stratified `scores.holdout` part of the new rows is held out of the
+        incremental fit to refit the calibration and check the compression on; those rows are fitted on at the
+        next full retrain.
+        """
+        if not self.training["incremental"] or self._needs_full_refit():
+            self._full_refit()
+            return
+        self.run_report = RunReport("retrain", enabled=self.instrumentation["enabled"])
+        self._logger.info(f'Load Train Dataset: {self.train_ds_path}')
+        with self.run_report.stage("load"):
+            train_df, _ = self._load_dataset(self.train_ds_path, TRAIN_COLUMNS)
+        seen_rows = self._training_state["rows"]
+        if len(train_df) < seen_rows:
+            self._logger.info(f"Train Dataset Shrank From {seen_rows} To {len(train_df)} Rows, Full Retrain")
+            self._full_refit()
+            return
+        new_df = train_df.iloc[seen_rows:]
+        self._logger.info(f'Successful Load, {len(new_df)} New Labeled Rows.')
+        with self.run_report.stage("null_check"):
+            self.null_summaries.update(self._feat.check_nulls(new_train_df=new_df))
+
+        with self.run_report.stage("load"):
+            test_df, _ = self._load_dataset(self.test_ds_path, TEST_COLUMNS)
+
+        with self.run_report.stage("preprocess"):
+            x_new = self._matrix.transform(new_df)
+            y_new = new_df[SURVIVED].to_numpy()
+            x_test = self._matrix.transform(test_df)
+
+        if len(new_df):
+            # the calibration is refitted and the compression checked on held-out new rows the incremental fit
+            # doesn't train on
+            compressible = self.compression["enabled"] and self._svm.kernel_expansion() is not None
+            needs_holdout = compressible or self._calibrator is not None
+            try:
+                fit_rows, holdout_rows = self._holdout_split(y_new) if needs_holdout else (slice(None), None)
+            except ValueError as e:
+                self._logger.info(f"Too Few New Rows To Hold Out, Full Retrain. {e}")
+                self._full_refit()
+                return
+            self._logger.info('Start SVM Model Incremental Fit')
+            with self.run_report.stage("fit"):
+                self._svm.fit_incremental(x_new[fit_rows], y_new[fit_rows])
+                # the previous calibration and reduced set fit the previous model's margins
+                if self._calibrator is not None:
+                    self.calibrate(x_new[holdout_rows], y_new[holdout_rows])
+            self._logger.info('End SVM Model Incremental Fit')
+
+            self._compressed = None
+            if compressible:
+                with self.run_report.stage("compress"):
+                    self._compressed, report, self._calibrator = self._compress_and_recalibrate(
+                        x_new[holdout_rows], y_new[holdout_rows])
+                    self.save_compression_report(report, self.output_path)
+
+            with self.run_report.stage("score"):
+                self._svm.score(x_new, y_new)
 
         self._logger.info('Start SVM Model Predict')
-        self._y_pred = self._svm.fit_predict(x_train, x_test, s.Y_train)
+        with self.run_report.stage("predict"):
+            try:
+                self._predict(x_test)
+            finally:
+                self._release_scorer()
         self._logger.info('End SVM Model Predict')
 
-        self._svm.score(x_train, s.Y_train)
+        with self.run_report.stage("persist"):
+            self._training_state = {"rows": len(train_df),
+                                    "incremental_fits": self._training_state["incremental_fits"] + bool(len(new_df))}
+            self.persist(test_df, self.output_path)
+            self.persist_model(self.output_path)
 
-        self.persist(test_df, self.output_path)
+        self.save_run_report(self.output_path)
+
+    def predict(self, chunk_size=None):
+        self.run_report = RunReport("predict", enabled=self.instrumentation["enabled"])
+        with self.run_report.stage("load"):
+            self.load_model(self.model_path)
+        if chunk_size:
+            self.predict_chunks(chunk_size)
+            self.save_run_report(self.output_path)
+            return
+
+        self._logger.info(f'Load Test Dataset: {self.test_ds_path}')
+        with self.run_report.stage("load"):
+            test_df, _ = self._load_dataset(self.test_ds_path, TEST_COLUMNS)
+        self._logger.info(f'Successful Load.')
+        with self.run_report.stage("null_check"):
+            self.null_summaries.update(self._feat.check_nulls(test_df=test_df))
+
+        self._logger.info('Start Test Feature Matrix Transform')
+        with self.run_report.stage("preprocess"):
+            x_test = self._matrix.transform(test_df)
+        self._logger.info('End Test Feature Matrix Transform')
+
+        self._logger.info('Start SVM Model Predict')
+        with self.run_report.stage("predict"):
+            try:
+                self._predict(x_test)
+            finally:
+                self._release_scorer()
+        self._logger.info('End SVM Model Predict')
+
+        with self.run_report.stage("persist"):
+            self.persist(test_df, self.output_path)
+
+        self.save_run_report(self.output_path)
+
+    def predict_frame(self, test_df):
+        """
+        Score an in-memory test DataFrame like `predict` does, through the compressed predictor or 'numpy'
+        engine and the calibrator of the loaded model. Returns the submission DataFrame (PassengerId,
+        Survived, plus the decision and probability columns the `scores` section asks for). The scorer is kept
+        for the next call until `close`.
+        """
+        self._predict(self._matrix.transform(test_df))
+        return self._submission(test_df)
+
+    def close(self):
+        """Release the scoring model and its worker pool kept by `predict_frame`."""
+        self._release_scorer()
+
+    def predict_chunks(self, chunk_size):
+        self._logger.info(f'Stream Test Dataset: {self.test_ds_path} In Chunks Of {chunk_size} Rows')
+        test_loader = self._dataset_loader(self.test_ds_path, TEST_COLUMNS)
+        chunks = test_loader.load_chunks(chunk_size)
+        null_summary = NullSummary("test_df")
+        n_rows = 0
+        # with asynchronous output, writing a chunk overlaps the next chunk's load, preprocess and predict
+        writer = self._prediction_writer(self.output_path)
+        try:
+            while True:
+                with self.run_report.stage("load"):
+                    test_df = next(chunks, None)
+                if test_df is None:
+                    break
+                with self.run_report.stage("null_check"):
+                    null_summary.update(test_df)
+                with self.run_report.stage("preprocess"):
+                    x_test = self._matrix.transform(test_df)
+                with self.run_report.stage("predict"):
+                    self._predict(x_test)
+                with self.run_report.stage("persist"):
+                    writer.write(self._submission(test_df))
+                n_rows += len(test_df)
+            with self.run_report.stage("persist"):
+                writer.close()
+        except BaseException:
+            # keep the previous predictions file rather than a partial one
+            writer.abort()
+            raise
+        finally:
+            self._release_scorer()
+        self._logger.info(f'Successfully Persisted SVM Model Predictions In: {writer.path}')
+        self._logger.info(null_summary)
+        self.null_summaries[null_summary.name] = null_summary
+        self._logger.info(f'End SVM Model Predict For {n_rows} Streamed Rows')
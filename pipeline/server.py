@@ -0,0 +1,231 @@
+"""
+A local HTTP scoring service for the persisted TitanicKernelSVMPipeline model artifact.
+
+The artifact is loaded once at startup. Concurrent requests are queued and coalesced by a
+single scoring thread into micro-batches (up to `max_batch_size` records, waiting at most
+`max_wait_ms` for a batch to fill), so preprocessing and the SVC kernel evaluation against the
+support vectors run vectorized over the whole batch instead of once per request.
+
+Endpoints:
+    GET  /health   -> {"status": "ok"}
+    POST /predict  -> body: a passenger record or a list of records (test.csv columns),
+                      response: {"predictions": [{"PassengerId": ..., "Survived": ...}, ...]}, plus the
+                      Decision and Probability scores the model's `scores` section enables
+
+Example:
+    python main.py --mode serve
+    curl -X POST localhost:8080/predict -d '{"PassengerId": 1, "Pclass": 3, "Sex": "male", "SibSp": 0, "Parch": 0}'
+"""
+
+import json
+import time
+import queue
+import logging
+import threading
+import pandas as pd
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pipeline.pipeline import TitanicKernelSVMPipeline
+from pipeline.constants import PASSENGER_ID, PCLASS, SEX, SIBSP, PARCH, AGE, FARE, EMBARKED, SURVIVED, \
+    TEST_COLUMNS
+
+REQUIRED_FIELDS = [PASSENGER_ID, PCLASS, SEX, SIBSP, PARCH]
+INTEGER_FIELDS = [PASSENGER_ID, PCLASS, SIBSP, PARCH]
+# optional, imputed by the model when missing
+FLOAT_FIELDS = [AGE, FARE]
+STRING_FIELDS = [SEX, EMBARKED]
+
+
+def _coerce(record, field):
+    """The record's `field` value cast to its schema type, raising ValueError when it can't be."""
+    value = record.get(field)
+    if value is None:
+        return None
+    if field in STRING_FIELDS:
+        if not isinstance(value, str):
+            raise ValueError(f"Passenger record field '{field}' must be a string, got {value!r}")
+        return value
+    try:
+        if isinstance(value, bool):
+            raise ValueError
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Passenger record field '{field}' must be a number, got {value!r}") from None
+    if field in INTEGER_FIELDS:
+        if not number.is_integer():
+            raise ValueError(f"Passenger record field '{field}' must be an integer, got {value!r}")
+        return int(number)
+    return number
+
+
+class TitanicScoringService:
+    """
+    Score passenger records with the persisted model, coalescing concurrent calls into micro-batches.
+
+    Attributes:
+    model_path (str): The model artifact file or its directory.
+    max_batch_size (int): The maximum number of records scored together.
+    max_wait_ms (float): How long the scoring thread waits for a batch to fill after its first request.
+    scores, prediction, compression (dict): The pipeline scoring options, so the service scores like `predict`.
+
+    Methods:
+    start(): Load the artifact and start the scoring thread.
+    stop(): Stop the scoring thread.
+    submit(records): Queue records for scoring, returning a Future with their predictions.
+    """
+
+    def __init__(self, model_path, max_batch_size=64, max_wait_ms=2.0, scores=None, prediction=None,
+                 compression=None):
+        self.model_path = model_path
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._pipeline = TitanicKernelSVMPipeline(None, None, None, model_path=model_path, scores=scores,
+                                                  prediction=prediction, compression=compression)
+        self._queue = queue.Queue()
+        self._thread = None
+        self._logger = logging.getLogger(__name__)
+
+    def start(self):
+        self._pipeline.load_model(self.model_path)
+        self._thread = threading.Thread(target=self._run, name="scoring-batcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._queue.put(None)
+        self._thread.join()
+        self._pipeline.close()
+
+    @staticmethod
+    def validate(records):
+        """
+        Check the records and cast their fields to the schema types, so a malformed request is rejected on
+        its own instead of failing the micro-batch it would be scored in.
+        """
+        if isinstance(records, dict):
+            records = [records]
+        if not isinstance(records, list) or not records or not all(isinstance(r, dict) for r in records):
+            raise ValueError("Expected a passenger record or a non-empty list of passenger records.")
+        validated = []
+        for record in records:
+            missing = [f for f in REQUIRED_FIELDS if record.get(f) is None]
+            if missing:
+                raise ValueError(f"Passenger record missing required fields {missing}: {record}")
+            fields = INTEGER_FIELDS + FLOAT_FIELDS + STRING_FIELDS
+            validated.append({**record, **{field: _coerce(record, field) for field in fields}})
+        return validated
+
+    def submit(self, records):
+        future = Future()
+        self._queue.put((self.validate(records), future))
+        return future
+
+    def _next_batch(self, first):
+        batch, n_rows = [first], len(first[0])
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+        while n_rows < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)
+                break
+            batch.append(item)
+            n_rows += len(item[0])
+        return batch
+
+    def _score(self, batch):
+        try:
+            records = [record for records, _ in batch for record in records]
+            # JSON nulls leave object columns behind, the imputed numeric fields must stay float
+            test_df = pd.DataFrame.from_records(records).reindex(columns=TEST_COLUMNS)
+            test_df = test_df.astype({AGE: float, FARE: float})
+            predictions = self._pipeline.predict_frame(test_df).astype({SURVIVED: int}).to_dict("records")
+        except Exception as e:
+            if len(batch) > 1:
+                # score the requests one by one so only the failing one gets the error
+                self._logger.warning(f"Micro-Batch Of {len(batch)} Requests Failed, Scoring Them Separately: {e}")
+                for item in batch:
+                    self._score([item])
+                return
+            batch[0][1].set_exception(e)
+            return
+        start = 0
+        for records, future in batch:
+            future.set_result(predictions[start:start + len(records)])
+            start += len(records)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            self._score(self._next_batch(item))
+
+
+class _ScoringRequestHandler(BaseHTTPRequestHandler):
+
+    service = None
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._reply(200, {"status": "ok"})
+        else:
+            self._reply(404, {"error": f"Unknown path '{self.path}'"})
+
+    def do_POST(self):
+        if self.path != "/predict":
+            self._reply(404, {"error": f"Unknown path '{self.path}'"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            future = self.service.submit(json.loads(self.rfile.read(length)))
+        except ValueError as e:
+            self._reply(400, {"error": str(e)})
+            return
+        try:
+            self._reply(200, {"predictions": future.result()})
+        except Exception as e:
+            self._reply(500, {"error": str(e)})
+
+    def log_message(self, format, *args):
+        logging.getLogger(__name__).debug(format, *args)
+
+
+class _ScoringHTTPServer(ThreadingHTTPServer):
+
+    daemon_threads = True
+    # the default listen backlog of 5 resets connections under concurrent load
+    request_queue_size = 128
+
+
+def make_server(service, host="127.0.0.1", port=8080):
+    handler = type("ScoringRequestHandler", (_ScoringRequestHandler,), {"service": service})
+    return _ScoringHTTPServer((host, port), handler)
+
+
+def serve(model_path, host="127.0.0.1", port=8080, max_batch_size=64, max_wait_ms=2.0, scores=None, prediction=None,
+          compression=None):
+    service = TitanicScoringService(model_path, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms,
+                                    scores=scores, prediction=prediction, compression=compression).start()
+    server = make_server(service, host, port)
+    logging.getLogger(__name__).info(f"Serving Titanic SVM Model From '{model_path}' On http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.stop()
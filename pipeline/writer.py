@@ -0,0 +1,151 @@
+"""
+Buffered, atomic and optionally compressed, asynchronous writer of prediction files.
+
+Frames handed to `PredictionWriter.write` are buffered up to `buffer_rows` rows and appended to
+a temporary file next to the destination, as CSV (optionally gzip / bz2 / xz compressed) or as
+Parquet row groups. With `asynchronous`, each write runs on one background thread, so scoring
+the next chunk overlaps writing the previous one; at most one write is in flight. `close` waits
+for it and moves the file into place with `os.replace`, so readers only ever see the previous
+complete file or the new complete file, never a truncated one. `abort` (or an exception in a
+`with` block) discards the temporary file.
+
+Example:
+    with PredictionWriter("pipeline/data/output", fmt="csv", compression="gzip") as writer:
+        for test_df, y_pred in scored_chunks:
+            writer.write(pd.DataFrame({"PassengerId": test_df["PassengerId"], "Survived": y_pred}))
+"""
+
+import os
+import bz2
+import gzip
+import lzma
+import logging
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+
+FORMATS = ("csv", "parquet")
+# CSV compression -> (text mode opener, file extension)
+CSV_COMPRESSIONS = {"gzip": (gzip.open, ".gz"), "bz2": (bz2.open, ".bz2"), "xz": (lzma.open, ".xz")}
+PARQUET_COMPRESSIONS = ("snappy", "gzip", "zstd", "brotli", "lz4")
+
+
+class PredictionWriter:
+    """
+    Stream prediction frames into one file, atomically replaced on close.
+
+    Attributes:
+    path (str): The destination, `<output_dir>/<name>.csv[.gz|.bz2|.xz]` or `<output_dir>/<name>.parquet`.
+    fmt (str): 'csv' or 'parquet'.
+    compression (str): 'gzip', 'bz2' or 'xz' for CSV, a Parquet codec ('snappy', 'zstd', ...), None for none.
+    buffer_rows (int): Rows buffered before a write is issued.
+    asynchronous (bool): Write on a background thread, overlapping the caller's next chunk.
+    rows (int): The rows written so far.
+
+    Methods:
+    write(frame): Buffer a frame, writing the buffer once it holds buffer_rows rows.
+    close(): Write the rest, wait for pending writes and move the file into place. Returns the path.
+    abort(): Discard everything written, leaving any previous file untouched.
+    """
+
+    def __init__(self, output_dir, name="predictions", fmt="csv", compression=None, buffer_rows=100000,
+                 asynchronous=True):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown predictions format '{fmt}', expected one of {list(FORMATS)}.")
+        codecs = CSV_COMPRESSIONS if fmt == "csv" else PARQUET_COMPRESSIONS
+        if compression is not None and compression not in codecs:
+            raise ValueError(f"Unknown {fmt} compression '{compression}', expected one of {list(codecs)}.")
+        extension = f".{fmt}" + (CSV_COMPRESSIONS[compression][1] if fmt == "csv" and compression else "")
+        self.path = os.path.join(output_dir, f"{name}{extension}")
+        self.fmt = fmt
+        self.compression = compression
+        self.buffer_rows = buffer_rows
+        self.asynchronous = asynchronous
+        self.rows = 0
+        self._tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        self._buffer = []
+        self._buffered_rows = 0
+        self._file = None
+        self._pending = None
+        self._executor = ThreadPoolExecutor(max_workers=1) if asynchronous else None
+        self._logger = logging.getLogger(__name__)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, frame):
+        self._buffer.append(frame)
+        self._buffered_rows += len(frame)
+        if self._buffered_rows >= self.buffer_rows:
+            self._flush()
+
+    def _flush(self):
+        if not self._buffer:
+            return
+        frame = pd.concat(self._buffer, ignore_index=True) if len(self._buffer) > 1 else self._buffer[0]
+        self._buffer, self._buffered_rows = [], 0
+        # one write in flight at a time, which also bounds the frames held in memory
+        self._wait()
+        if self._executor is None:
+            self._write_frame(frame)
+        else:
+            self._pending = self._executor.submit(self._write_frame, frame)
+
+    def _wait(self):
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            pending.result()
+
+    def _write_frame(self, frame):
+        if self.fmt == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._file is None:
+                self._file = pq.ParquetWriter(self._tmp_path, table.schema, compression=self.compression or "none")
+            self._file.write_table(table)
+        else:
+            if self._file is None:
+                opener = CSV_COMPRESSIONS[self.compression][0] if self.compression else open
+                self._file = opener(self._tmp_path, "wt", newline="", encoding="utf-8")
+            frame.to_csv(self._file, index=False, header=self.rows == 0)
+        self.rows += len(frame)
+
+    def _close_file(self):
+        file, self._file = self._file, None
+        if file is not None:
+            file.close()
+
+    def close(self):
+        try:
+            self._flush()
+            self._wait()
+            self._close_file()
+            if os.path.exists(self._tmp_path):
+                os.replace(self._tmp_path, self.path)
+        except BaseException:
+            self.abort()
+            raise
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+        return self.path
+
+    def abort(self):
+        self._buffer, self._buffered_rows = [], 0
+        try:
+            self._wait()
+        except Exception as e:
+            self._logger.warning(f"Discarding Failed Predictions Write: {e}")
+        finally:
+            self._close_file()
+            if os.path.exists(self._tmp_path):
+                os.remove(self._tmp_path)
+            if self._executor is not None:
+                self._executor.shutdown()
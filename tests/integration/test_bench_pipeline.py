@@ -0,0 +1,48 @@
+import os
+import shutil
+import unittest
+import pandas as pd
+from benchmarks.bench_pipeline import STAGES, bench, regressions, synthesize
+from pipeline.constants import PASSENGER_ID, TRAIN_COLUMNS
+
+
+class TestBenchPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = "tests/integration/data/bench"
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+        os.makedirs(self.data_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    def test_synthesize_is_seeded_and_keeps_schema(self):
+        first = synthesize("pipeline/data/input/train.csv", os.path.join(self.data_dir, "a.csv"), 2500)
+        second = synthesize("pipeline/data/input/train.csv", os.path.join(self.data_dir, "b.csv"), 2500)
+        first_df, second_df = pd.read_csv(first), pd.read_csv(second)
+        pd.testing.assert_frame_equal(first_df, second_df)
+        self.assertListEqual(list(first_df.columns), TRAIN_COLUMNS)
+        self.assertEqual(len(first_df), 2500)
+        self.assertTrue(first_df[PASSENGER_ID].is_unique)
+
+    def test_bench_times_every_stage(self):
+        results = bench(500, repeats=1, data_dir=self.data_dir, max_exact_rows=1000)
+        self.assertListEqual([row["stage"] for row in results], STAGES)
+        self.assertTrue(all(row["median_seconds"] > 0 for row in results))
+        self.assertEqual(results[STAGES.index("fit_predict")]["engine"], "svc")
+
+    def test_regressions_respect_threshold_and_min_delta(self):
+        baseline = {"results": [{"rows": 1000, "stage": "load", "median_seconds": 1.0},
+                                {"rows": 1000, "stage": "persist", "median_seconds": 0.01}]}
+        results = [{"rows": 1000, "stage": "load", "median_seconds": 1.2},
+                   {"rows": 1000, "stage": "persist", "median_seconds": 0.03},
+                   {"rows": 5000, "stage": "load", "median_seconds": 9.0}]
+        self.assertListEqual(regressions(results, baseline), [])
+        results[0]["median_seconds"] = 1.5
+        found = regressions(results, baseline)
+        self.assertEqual(len(found), 1)
+        self.assertTrue(found[0].startswith("load @ 1000 rows"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,12 @@
+import unittest
+from benchmarks.bench_startup import loaded_heavy_modules
+
+
+class TestStartupImports(unittest.TestCase):
+
+    def test_import_main_does_not_load_heavy_modules(self):
+        self.assertListEqual(loaded_heavy_modules("main"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -31,6 +31,11 @@ class TestFeatureEngine(unittest.TestCase):
         FeatureEngine.nan_inputer(self.datasets, self.column)
         self.assertFalse(self.test_df[self.column].isnull().any())
 
+    def test_check_nulls_returns_summary_per_dataset(self):
+        summaries = FeatureEngine.check_nulls(train_df=self.train_df, test_df=self.test_df)
+        self.assertEqual(summaries['train_df'].to_dict()['nulls'], {'A': 0, 'B': 0, 'C': 0})
+        self.assertEqual(summaries['test_df'].to_dict()['nulls'], {'A': 0, 'B': 0, 'C': 1})
+
     def test_common_value_inputer_replaces_missing_values_with_common_value(self):
         col = 'B'
         common_value = 'missing'
@@ -0,0 +1,29 @@
+import unittest
+import numpy as np
+import pandas as pd
+from ml.functions import NullSummary
+
+
+class TestNullSummary(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({'Z': [1, np.nan, 3], 'A': ['x', None, None], 'C': [7, 8, 9]})
+
+    def test_update_counts_nulls_per_column(self):
+        summary = NullSummary('train_df').update(self.df)
+        self.assertDictEqual(summary.to_dict(), {'rows': 3, 'nulls': {'Z': 1, 'A': 2, 'C': 0}})
+
+    def test_update_accumulates_chunks(self):
+        summary = NullSummary('test_df')
+        for start in range(0, 3, 2):
+            summary.update(self.df.iloc[start:start + 2])
+        self.assertDictEqual(summary.to_dict(), NullSummary('test_df').update(self.df).to_dict())
+
+    def test_str_marks_columns_with_nulls(self):
+        self.assertEqual(
+            str(NullSummary('train_df').update(self.df)),
+            "no. of nulls in set 'train_df' (3 rows): {'Z': 1 **, 'A': 2 **, 'C': 0}"
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 import pandas as pd
 import ydata_profiling as yp
@@ -14,6 +15,19 @@ class TestPandasProfiler(unittest.TestCase):
         report = self.profiler.profiler()
         self.assertTrue(isinstance(report, yp.profile_report.ProfileReport))
 
+    def test_profiler_samples_large_frames(self):
+        profiler = PandasProfiler(self.df, self.title, minimal=True, sample_size=2)
+        report = profiler.profiler()
+        self.assertEqual(len(report.df), 2)
+        self.assertEqual(len(PandasProfiler(self.df, self.title, sample_size=10)._sample()), 3)
+
+    def test_sample_is_drawn_before_pickling(self):
+        df = pd.DataFrame({'A': range(1000), 'B': [str(i) for i in range(1000)]})
+        profiler = PandasProfiler(df, self.title, sample_size=10)
+        self.assertEqual(len(profiler.pandas_df), 10)
+        self.assertEqual(len(pickle.loads(pickle.dumps(profiler)).pandas_df), 10)
+        pd.testing.assert_frame_equal(profiler.pandas_df, df.sample(n=10, random_state=0))
+
 
 if __name__ == '__main__':
     unittest.main()
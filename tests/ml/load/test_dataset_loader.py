@@ -1,5 +1,8 @@
 import os
+import tempfile
 import unittest
+from unittest import mock
+import numpy as np
 import pandas as pd
 from ml.load.datasets import DatasetLoader
 
@@ -7,8 +10,9 @@ from ml.load.datasets import DatasetLoader
 class TestDatasetLoader(unittest.TestCase):
     def setUp(self):
         test_dir = os.path.dirname(os.path.abspath(__file__))
-        data_path = os.path.join(test_dir, 'data', 'input', 'test_data.csv')
-        self.loader = DatasetLoader(data_path)
+        self.data_path = os.path.join(test_dir, 'data', 'input', 'test_data.csv')
+        self.loader = DatasetLoader(self.data_path)
+        self.cache_dir = tempfile.mkdtemp()
 
     def tearDown(self):
         pass
@@ -22,6 +26,70 @@ class TestDatasetLoader(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             self.loader.load()
 
+    def test_load_chunks(self):
+        chunks = list(self.loader.load_chunks(chunk_size=4))
+        self.assertListEqual([len(chunk) for chunk in chunks], [4, 4, 1])
+        self.assertListEqual(list(pd.concat(chunks)['PassengerId']), list(self.loader.load()['PassengerId']))
+
+        self.loader = DatasetLoader('invalid_path.csv')
+        with self.assertRaises(FileNotFoundError):
+            list(self.loader.load_chunks(chunk_size=4))
+
+    def test_cache_columnar_is_keyed_by_content_hash(self):
+        parquet_path = self.loader.cache_columnar(self.cache_dir)
+        self.assertTrue(parquet_path.endswith('.parquet'))
+        self.assertIn(self.loader.content_hash()[:16], parquet_path)
+        mtime = os.path.getmtime(parquet_path)
+        self.assertEqual(self.loader.cache_columnar(self.cache_dir), parquet_path)
+        self.assertEqual(os.path.getmtime(parquet_path), mtime)
+        with self.assertRaises(ValueError):
+            self.loader.cache_columnar(self.cache_dir, fmt='orc')
+
+    def test_load_columnar_with_projection(self):
+        columns = ['PassengerId', 'Age', 'Sex']
+        expected = pd.read_csv(self.data_path)[columns]
+        for fmt in ('parquet', 'feather'):
+            loader = DatasetLoader(self.loader.cache_columnar(self.cache_dir, fmt=fmt), columns=columns)
+            df = loader.load()
+            self.assertListEqual(list(df.columns), columns)
+            pd.testing.assert_frame_equal(df, expected)
+            chunks = list(loader.load_chunks(chunk_size=4))
+            self.assertListEqual([len(chunk) for chunk in chunks], [4, 4, 1])
+            self.assertListEqual(list(chunks[0].columns), columns)
+
+    def test_load_with_schema_dtypes(self):
+        dtypes = {'PassengerId': 'int64', 'Sex': 'category', 'Age': 'float32', 'Pclass': 'int8'}
+        full_df = self.loader.load()
+        for path in (self.data_path, self.loader.cache_columnar(self.cache_dir)):
+            df = DatasetLoader(path, columns=list(dtypes), dtypes=dtypes).load()
+            self.assertDictEqual({c: str(t) for c, t in df.dtypes.items()}, dtypes)
+            self.assertLess(df.memory_usage(deep=True).sum(), full_df.memory_usage(deep=True).sum() / 5)
+            chunk = next(DatasetLoader(path, columns=list(dtypes), dtypes=dtypes).load_chunks(chunk_size=4))
+            self.assertEqual(str(chunk['Age'].dtype), 'float32')
+
+    def test_cache_columnar_streams_projected_chunks(self):
+        dtypes = {'PassengerId': 'int64', 'Sex': 'category', 'Age': 'float32', 'Pclass': 'int8'}
+        loader = DatasetLoader(self.data_path, columns=list(dtypes), dtypes=dtypes)
+        read_csv = pd.read_csv
+        with mock.patch('ml.load.datasets.pd.read_csv', side_effect=read_csv) as patched:
+            paths = [loader.cache_columnar(self.cache_dir, fmt=fmt, chunk_size=4) for fmt in ('parquet', 'feather')]
+        self.assertTrue(all(call.kwargs.get('chunksize') == 4 for call in patched.call_args_list))
+        self.assertNotEqual(paths[0], self.loader.cache_columnar(self.cache_dir))
+        expected = loader.load()
+        for path in paths:
+            df = DatasetLoader(path, columns=list(dtypes), dtypes=dtypes).load()
+            self.assertDictEqual({c: str(t) for c, t in df.dtypes.items()}, dtypes)
+            pd.testing.assert_frame_equal(df[expected.columns], expected, check_categorical=False)
+
+    def test_load_memory_mapped_numpy(self):
+        npy_path = os.path.join(self.cache_dir, 'features.npy')
+        np.save(npy_path, np.arange(12, dtype=np.float32).reshape(6, 2))
+        loader = DatasetLoader(npy_path)
+        matrix = loader.load()
+        self.assertIsInstance(matrix, np.memmap)
+        self.assertEqual(matrix.shape, (6, 2))
+        self.assertListEqual([len(chunk) for chunk in loader.load_chunks(chunk_size=4)], [4, 2])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+import joblib
+import numpy as np
+import pandas as pd
+from ml.models.svm import SVM
+from ml.models.artifact import ModelArtifact, ARTIFACT_FILE_NAME
+from ml.preprocess.feature import Encoder, Scalers
+
+
+class TestModelArtifact(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({'sex': ['male', 'female', 'male', 'female'], 'age': [20, 30, 25, 40]})
+        self.y = np.array([0, 1, 0, 1])
+        self.encoder = Encoder(['sex'])
+        self.scaler = Scalers()
+        self.svm = SVM()
+        x = self.encoder.fit_transform(self.df.copy())
+        x_train, _ = self.scaler.fit_transform(x, x)
+        self.svm.fit_predict(x_train, x_train, self.y)
+        self.output_dir = tempfile.mkdtemp()
+
+    def test_save_and_load_round_trip(self):
+        artifact = ModelArtifact(self.encoder, self.scaler, self.svm, [], ['sex', 'age'])
+        artifact_path = artifact.save(self.output_dir)
+        self.assertEqual(artifact_path, os.path.join(self.output_dir, ARTIFACT_FILE_NAME))
+
+        loaded = ModelArtifact.load(self.output_dir)
+        self.assertEqual(loaded.feature_names, ['sex', 'age'])
+        self.assertEqual(loaded.encoder.mappings, {'sex': {'female': 0, 'male': 1}})
+        x = loaded.scaler.transform(loaded.encoder.transform(self.df.copy()))
+        np.testing.assert_array_equal(loaded.svm.predict(x), self.svm.predict(x))
+
+    def test_load_rejects_other_versions(self):
+        artifact = ModelArtifact(self.encoder, self.scaler, self.svm, {}, ['sex', 'age'])
+        artifact.version = -1
+        joblib.dump(artifact, os.path.join(self.output_dir, ARTIFACT_FILE_NAME))
+        with self.assertRaises(ValueError):
+            ModelArtifact.load(self.output_dir)
+
+    def test_load_missing_artifact(self):
+        with self.assertRaises(FileNotFoundError):
+            ModelArtifact.load(os.path.join(self.output_dir, 'missing.joblib'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+import numpy as np
+from sklearn.datasets import make_classification
+from sklearn.preprocessing import StandardScaler
+from ml.models.svm import SVM
+from ml.models.calibration import ScoreCalibrator
+
+
+class TestScoreCalibrator(unittest.TestCase):
+    def setUp(self):
+        x, y = make_classification(n_samples=400, n_features=5, n_informative=3, flip_y=0.1, random_state=0)
+        x = StandardScaler().fit_transform(x)
+        svm = SVM().fit(x[:250], y[:250])
+        self.holdout_scores, self.y_holdout = svm.decision_function(x[250:350]), y[250:350]
+        self.test_scores = svm.decision_function(x[350:])
+
+    def test_probabilities_are_monotonic_in_the_margin(self):
+        for method in ("sigmoid", "isotonic"):
+            calibrator = ScoreCalibrator(method).fit(self.holdout_scores, self.y_holdout)
+            order = np.argsort(self.test_scores)
+            probability = calibrator.predict_proba(self.test_scores)[order]
+            self.assertTrue(np.all((probability >= 0) & (probability <= 1)))
+            self.assertTrue(np.all(np.diff(probability) >= -1e-12))
+
+    def test_sigmoid_separates_the_classes(self):
+        calibrator = ScoreCalibrator("sigmoid").fit(self.holdout_scores, self.y_holdout)
+        probability = calibrator.predict_proba(self.holdout_scores)
+        self.assertGreater(probability[self.y_holdout == 1].mean(), probability[self.y_holdout == 0].mean())
+
+    def test_non_binary_labels(self):
+        with self.assertRaises(ValueError):
+            ScoreCalibrator().fit([0.1, 0.2, 0.3], [0, 1, 2])
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            ScoreCalibrator("beta")
+
+
+if __name__ == '__main__':
+    unittest.main()
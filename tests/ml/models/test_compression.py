@@ -0,0 +1,51 @@
+import unittest
+import numpy as np
+from sklearn.datasets import make_classification, load_iris
+from sklearn.preprocessing import StandardScaler
+from ml.models.svm import SVM
+from ml.models.numpy_predictor import NumpyPredictor
+from ml.models.compression import SupportVectorCompressor
+
+
+class TestSupportVectorCompressor(unittest.TestCase):
+    def setUp(self):
+        x, y = make_classification(n_samples=3000, n_features=7, n_informative=5, flip_y=0.1, random_state=0)
+        x = StandardScaler().fit_transform(x)
+        self.x_val, self.y_val = x[1500:], y[1500:]
+        self.svm = SVM().fit(x[:1500], y[:1500])
+
+    def test_compresses_within_tolerance(self):
+        compressed, report = SupportVectorCompressor([0.05, 0.1, 0.25], tolerance=0.01).compress(
+            self.svm, self.x_val, self.y_val)
+        self.assertIsInstance(compressed, NumpyPredictor)
+        self.assertTrue(report["accepted"])
+        self.assertEqual(len(compressed.support_vectors), report["support_vectors"]["after"])
+        self.assertLess(report["support_vectors"]["after"], report["support_vectors"]["before"] / 2)
+        self.assertGreaterEqual(report["accuracy"]["after"], report["accuracy"]["before"] - 0.01)
+        accuracy = np.mean(compressed.predict(self.x_val) == self.y_val)
+        self.assertAlmostEqual(accuracy, report["accuracy"]["after"], places=4)
+        self.assertSetEqual(set(report["latency_seconds"]), {"svc", "numpy", "after"})
+
+    def test_rejects_candidates_outside_tolerance(self):
+        compressed, report = SupportVectorCompressor([0.001], tolerance=-1).compress(self.svm, self.x_val, self.y_val)
+        self.assertIsNone(compressed)
+        self.assertFalse(report["accepted"])
+        self.assertEqual(report["support_vectors"]["after"], report["support_vectors"]["before"])
+        self.assertEqual(len(report["candidates"]), 1)
+
+    def test_reduced_set_approximates_the_decision_function(self):
+        expansion = self.svm.kernel_expansion()
+        reduced = SupportVectorCompressor().reduce(expansion, len(expansion["support_vectors"]) // 4)
+        decision = self.svm.decision_function(self.x_val)
+        self.assertLess(np.mean(np.abs(reduced.decision_function(self.x_val) - decision)), 0.1 * np.std(decision))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            SupportVectorCompressor([1.5])
+        x, y = load_iris(return_X_y=True)
+        with self.assertRaises(ValueError):
+            SupportVectorCompressor().compress(SVM().fit(x, y), x, y)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+import numpy as np
+from sklearn.datasets import make_classification
+from sklearn.preprocessing import StandardScaler
+from ml.models.svm import SVM
+from ml.models.explain import ShapExplainer
+
+
+class TestShapExplainer(unittest.TestCase):
+    def setUp(self):
+        x, y = make_classification(n_samples=300, n_features=5, n_informative=3, random_state=0)
+        x = StandardScaler().fit_transform(x)
+        self.x_train, self.y_train, self.x_test = x[:250], y[:250], x[250:]
+        self.svm = SVM().fit(self.x_train, self.y_train)
+
+    def test_values_add_up_to_the_decision_function(self):
+        explainer = ShapExplainer(background_size=10, nsamples=64, batch_size=20, n_jobs=1)
+        rows, values = explainer.explain(self.svm, self.x_train, self.x_test)
+        np.testing.assert_array_equal(rows, np.arange(len(self.x_test)))
+        self.assertEqual(values.shape, self.x_test.shape)
+        np.testing.assert_allclose(values.sum(axis=1) + explainer.expected_value_,
+                                   self.svm.decision_function(self.x_test), atol=1e-6)
+
+    def test_parallel_batches_match_inline(self):
+        args = {"background": "sample", "background_size": 10, "nsamples": 32, "batch_size": 10, "max_rows": 30}
+        rows, inline = ShapExplainer(n_jobs=1, **args).explain(self.svm, self.x_train, self.x_test)
+        parallel_rows, parallel = ShapExplainer(n_jobs=2, **args).explain(self.svm, self.x_train, self.x_test)
+        self.assertEqual(len(rows), 30)
+        np.testing.assert_array_equal(rows, parallel_rows)
+        np.testing.assert_allclose(inline, parallel)
+
+    def test_inline_batches_leave_the_global_generator_alone(self):
+        np.random.seed(123)
+        expected = np.random.rand(3)
+        np.random.seed(123)
+        ShapExplainer(background="sample", background_size=10, nsamples=32, batch_size=10, max_rows=20,
+                      n_jobs=1).explain(self.svm, self.x_train, self.x_test)
+        np.testing.assert_array_equal(np.random.rand(3), expected)
+
+    def test_unknown_background(self):
+        with self.assertRaises(ValueError):
+            ShapExplainer(background="tree")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+from ml.models.kernel_approx import KernelApproxSVM
+
+
+class TestKernelApproxSVM(unittest.TestCase):
+    def setUp(self):
+        self.x, self.y = load_iris(return_X_y=True)
+        self.x = StandardScaler().fit_transform(self.x)
+        self.x_train, self.x_test, self.y_train, self.y_test = train_test_split(self.x, self.y, test_size=0.2,
+                                                                                random_state=42)
+
+    def test_fit_predict(self):
+        for approximation in ("nystroem", "rff"):
+            for solver in ("linear-svc", "sgd"):
+                svm = KernelApproxSVM(approximation=approximation, solver=solver, n_components=100)
+                y_pred = svm.fit_predict(self.x_train, self.x_test, self.y_train)
+                self.assertIsInstance(y_pred, np.ndarray)
+                self.assertGreater(np.mean(y_pred == self.y_test), 0.8, (approximation, solver))
+
+    def test_set_params(self):
+        svm = KernelApproxSVM(solver="linear-svc")
+        svm.set_params(C=10.0, gamma=0.5, n_components=50)
+        svm.fit_predict(self.x_train, self.x_test, self.y_train)
+        self.assertAlmostEqual(svm.model.named_steps["classifier"].C, 10.0)
+        self.assertAlmostEqual(svm.model.named_steps["approximation"].gamma, 0.5)
+        self.assertEqual(svm.model.named_steps["approximation"].n_components, 50)
+
+    def test_unknown_approximation(self):
+        with self.assertRaises(ValueError):
+            KernelApproxSVM(approximation="unknown")
+
+    def test_fit_incremental(self):
+        svm = KernelApproxSVM(n_components=100)
+        svm.fit(self.x_train[:60], self.y_train[:60])
+        approximation = svm.model.named_steps["approximation"]
+        svm.fit_incremental(self.x_train[60:], self.y_train[60:])
+        self.assertIs(svm.model.named_steps["approximation"], approximation)
+        self.assertGreater(np.mean(svm.predict(self.x_test) == self.y_test), 0.8)
+        with self.assertRaises(ValueError):
+            KernelApproxSVM(solver="linear-svc").fit(self.x_train, self.y_train).fit_incremental(self.x_test,
+                                                                                                  self.y_test)
+
+
+if __name__ == '__main__':
+    unittest.main()
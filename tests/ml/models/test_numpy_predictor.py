@@ -0,0 +1,57 @@
+import os
+import sys
+import tempfile
+import unittest
+import subprocess
+import numpy as np
+from sklearn.datasets import make_classification
+from sklearn.preprocessing import StandardScaler
+from ml.models.svm import SVM
+from ml.models.kernel_approx import KernelApproxSVM
+from ml.models.numpy_predictor import NumpyPredictor
+
+
+class TestNumpyPredictor(unittest.TestCase):
+    def setUp(self):
+        x, y = make_classification(n_samples=3000, n_features=7, n_informative=5, flip_y=0.1, random_state=0)
+        x = StandardScaler().fit_transform(x)
+        self.x_train, self.y_train, self.x_test = x[:1000], y[:1000], x[1000:]
+
+    def test_float64_labels_match_svc(self):
+        for kernel in ("rbf", "linear", "poly", "sigmoid"):
+            svm = SVM(kernel=kernel).fit(self.x_train, self.y_train)
+            y_pred, scores = NumpyPredictor.from_svm(svm, block_size=300).predict_scores(self.x_test)
+            np.testing.assert_array_equal(y_pred, svm.predict(self.x_test))
+            np.testing.assert_allclose(scores, svm.decision_function(self.x_test), atol=1e-9)
+
+    def test_float32_scores_are_close(self):
+        svm = SVM().fit(self.x_train, self.y_train)
+        predictor = NumpyPredictor.from_svm(svm, dtype=np.float32, block_size=128)
+        self.assertEqual(predictor.support_vectors.dtype, np.float32)
+        np.testing.assert_allclose(predictor.decision_function(self.x_test), svm.decision_function(self.x_test),
+                                   atol=1e-3)
+        self.assertLessEqual(np.sum(predictor.predict(self.x_test) != svm.predict(self.x_test)), 2)
+
+    def test_save_and_load(self):
+        svm = SVM(kernel="poly", degree=2).fit(self.x_train, self.y_train)
+        predictor = NumpyPredictor.from_svm(svm, dtype=np.float32, block_size=500)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            loaded = NumpyPredictor.load(predictor.save(os.path.join(tmp_dir, "model-numpy.npz")))
+        self.assertEqual(loaded.dtype, np.float32)
+        self.assertEqual(loaded.block_size, 500)
+        self.assertDictEqual(loaded.kernel, predictor.kernel)
+        np.testing.assert_array_equal(loaded.decision_function(self.x_test), predictor.decision_function(self.x_test))
+
+    def test_unsupported_models(self):
+        with self.assertRaises(ValueError):
+            NumpyPredictor.from_svm(KernelApproxSVM(n_components=20).fit(self.x_train, self.y_train))
+        with self.assertRaises(ValueError):
+            NumpyPredictor.from_svm(SVM(kernel="precomputed"))
+
+    def test_import_does_not_load_sklearn(self):
+        code = "import sys, ml.models.numpy_predictor; sys.exit('sklearn' in sys.modules)"
+        self.assertEqual(subprocess.run([sys.executable, "-c", code]).returncode, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
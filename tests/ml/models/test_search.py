@@ -0,0 +1,84 @@
+import unittest
+from unittest import mock
+import numpy as np
+from sklearn.datasets import load_breast_cancer
+from sklearn.model_selection import GridSearchCV, StratifiedKFold
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+from ml.models import search as search_module
+from ml.models.search import KernelSearch
+
+
+class _SerialPool:
+    """A process pool stand-in running the tasks in this process, so the issued tasks can be counted."""
+
+    def __init__(self, max_workers, initializer, initargs):
+        initializer(*initargs)
+
+    def map(self, fn, *iterables):
+        return map(fn, *iterables)
+
+    def shutdown(self):
+        search_module._WORKER_STATE["shm"].close()
+
+
+class TestKernelSearch(unittest.TestCase):
+    def setUp(self):
+        x, y = load_breast_cancer(return_X_y=True)
+        self.x = StandardScaler().fit_transform(x)[:300]
+        self.y = y[:300]
+        self.param_grid = {'C': [0.1, 1.0, 10.0], 'gamma': [0.01, 0.1]}
+
+    def test_grid_matches_sklearn_grid_search(self):
+        search = KernelSearch(self.param_grid, strategy='grid', cv=3, n_jobs=1).fit(self.x, self.y)
+        self.assertEqual(len(search.results_), 6)
+
+        # same row permutation and folds as the search
+        rows = np.random.default_rng(0).permutation(len(self.x))
+        folds = StratifiedKFold(n_splits=3, shuffle=True, random_state=0)
+        expected = GridSearchCV(SVC(kernel='rbf'), self.param_grid, cv=folds).fit(self.x[rows], self.y[rows])
+        self.assertEqual(search.best_params_, expected.best_params_)
+        self.assertAlmostEqual(search.best_score_, expected.best_score_)
+
+    def test_parallel_search_matches_inline(self):
+        inline = KernelSearch(self.param_grid, cv=3, n_jobs=1).fit(self.x, self.y)
+        parallel = KernelSearch(self.param_grid, cv=3, n_jobs=2).fit(self.x, self.y)
+        self.assertEqual(parallel.best_params_, inline.best_params_)
+        self.assertAlmostEqual(parallel.best_score_, inline.best_score_)
+
+    def test_parallel_tasks_split_gammas_by_fold(self):
+        with mock.patch('ml.models.search.ProcessPoolExecutor', _SerialPool):
+            with mock.patch('ml.models.search._evaluate_fold', wraps=search_module._evaluate_fold) as evaluate:
+                search = KernelSearch(self.param_grid, cv=3, n_jobs=2).fit(self.x, self.y)
+        self.assertEqual(evaluate.call_count, len(self.param_grid['gamma']) * 3)
+        self.assertGreater(evaluate.call_count, len(self.param_grid['gamma']))
+        inline = KernelSearch(self.param_grid, cv=3, n_jobs=1).fit(self.x, self.y)
+        self.assertEqual(search.results_, inline.results_)
+
+    def test_halving_shrinks_candidates_and_grows_rows(self):
+        search = KernelSearch(self.param_grid, strategy='halving', cv=3, n_jobs=1, factor=2).fit(self.x, self.y)
+        rows_per_round = sorted({r['n_samples'] for r in search.results_})
+        self.assertGreater(len(rows_per_round), 1)
+        self.assertEqual(rows_per_round[-1], len(self.x))
+        final_round = [r for r in search.results_ if r['n_samples'] == rows_per_round[-1]]
+        self.assertLess(len(final_round), 6)
+        self.assertIn(search.best_params_['C'], self.param_grid['C'])
+
+    def test_memory_bound_caps_rows_by_worker_count(self):
+        # 1 MiB holds 1 + 2 * n_jobs float64 matrices of n x n rows
+        inline = KernelSearch(self.param_grid, cv=3, n_jobs=1, memory_mb=1).fit(self.x, self.y)
+        parallel = KernelSearch(self.param_grid, cv=3, n_jobs=2, memory_mb=1).fit(self.x, self.y)
+        self.assertEqual({r['n_samples'] for r in inline.results_}, {int(np.sqrt(2 ** 20 / (8 * 3)))})
+        self.assertEqual({r['n_samples'] for r in parallel.results_}, {int(np.sqrt(2 ** 20 / (8 * 5)))})
+        capped = KernelSearch(self.param_grid, cv=3, n_jobs=1, max_samples=100, memory_mb=1).fit(self.x, self.y)
+        self.assertEqual({r['n_samples'] for r in capped.results_}, {100})
+
+    def test_scale_gamma_and_unknown_strategy(self):
+        search = KernelSearch({'C': [1.0], 'gamma': ['scale']}, cv=3, n_jobs=1).fit(self.x, self.y)
+        self.assertAlmostEqual(search.best_params_['gamma'], 1.0 / (self.x.shape[1] * self.x.var()))
+        with self.assertRaises(ValueError):
+            KernelSearch(self.param_grid, strategy='random')
+
+
+if __name__ == '__main__':
+    unittest.main()
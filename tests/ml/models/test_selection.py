@@ -0,0 +1,53 @@
+import unittest
+import numpy as np
+from sklearn.datasets import make_classification
+from sklearn.preprocessing import StandardScaler
+from ml.models.svm import SVM
+from ml.models.kernel_approx import KernelApproxSVM
+from ml.models.selection import ModelSelection, VotingSVM
+
+ENGINES = {"svc": SVM, "kernel-approximation": KernelApproxSVM}
+
+
+class TestModelSelection(unittest.TestCase):
+    def setUp(self):
+        x, self.y = make_classification(n_samples=300, n_features=7, n_informative=5, random_state=0)
+        self.x = StandardScaler().fit_transform(x)
+        self.candidates = [
+            {"kernel": "rbf", "C": 1.0},
+            {"kernel": "linear", "C": 0.1, "class_weight": "balanced"},
+            {"kernel": "rbf", "C": 1e-4, "gamma": 1e-4},  # underfits badly
+            {"engine": "kernel-approximation", "n_components": 50},
+        ]
+
+    def test_parallel_matches_inline(self):
+        inline = ModelSelection(self.candidates, ENGINES, cv=3, n_jobs=1).fit(self.x, self.y)
+        parallel = ModelSelection(self.candidates, ENGINES, cv=3, n_jobs=2).fit(self.x, self.y)
+        self.assertListEqual(inline.results_, parallel.results_)
+        self.assertEqual(inline.best_spec_, parallel.best_spec_)
+        np.testing.assert_array_equal(inline.best_model_.predict(self.x), parallel.best_model_.predict(self.x))
+        self.assertNotEqual(inline.best_spec_, self.candidates[2])
+        self.assertEqual(inline.best_score_, max(r["mean_score"] for r in inline.results_))
+
+    def test_vote_ensembles_top_k(self):
+        selection = ModelSelection(self.candidates, ENGINES, strategy="vote", top_k=3, cv=3, n_jobs=1)
+        selection.fit(self.x, self.y)
+        self.assertIsInstance(selection.best_model_, VotingSVM)
+        self.assertEqual(len(selection.best_model_.models), 3)
+        self.assertNotIn(self.candidates[2], selection.best_spec_)
+        self.assertGreater(np.mean(selection.best_model_.predict(self.x) == self.y), 0.85)
+        y_pred, scores = selection.best_model_.predict_scores(self.x)
+        np.testing.assert_array_equal(y_pred, selection.best_model_.predict(self.x))
+        np.testing.assert_allclose(scores, selection.best_model_.decision_function(self.x))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ModelSelection(self.candidates, ENGINES, strategy="stacking")
+        with self.assertRaises(ValueError):
+            ModelSelection([], ENGINES)
+        with self.assertRaises(ValueError):
+            ModelSelection([{"engine": "xgboost"}], ENGINES, n_jobs=1).fit(self.x, self.y)
+
+
+if __name__ == '__main__':
+    unittest.main()
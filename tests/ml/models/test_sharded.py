@@ -0,0 +1,60 @@
+import unittest
+import numpy as np
+from sklearn.datasets import make_classification, load_iris
+from sklearn.preprocessing import StandardScaler
+from ml.models.svm import SVM
+from ml.models.kernel_approx import KernelApproxSVM
+from ml.models.sharded import ShardedPredictor
+
+
+class TestShardedPredictor(unittest.TestCase):
+    def setUp(self):
+        x, y = make_classification(n_samples=600, n_features=5, n_informative=3, random_state=0)
+        x = StandardScaler().fit_transform(x)
+        self.x_train, self.y_train, self.x_test = x[:400], y[:400], x[400:]
+
+    def test_sharded_kernel_expansion_matches_svc(self):
+        for kernel in ("rbf", "linear", "poly"):
+            svm = SVM(kernel=kernel).fit(self.x_train, self.y_train)
+            with ShardedPredictor(n_jobs=2, shard_size=45) as predictor:
+                y_pred, scores = predictor.predict_scores(svm, self.x_test)
+            np.testing.assert_array_equal(y_pred, svm.predict(self.x_test))
+            np.testing.assert_allclose(scores, svm.decision_function(self.x_test), atol=1e-9)
+
+    def test_models_without_kernel_expansion_are_published_per_worker(self):
+        svm = KernelApproxSVM(n_components=50).fit(self.x_train, self.y_train)
+        self.assertIsNone(svm.kernel_expansion())
+        with ShardedPredictor(n_jobs=2, shard_size=60) as predictor:
+            y_pred = predictor.predict(svm, self.x_test)
+        np.testing.assert_array_equal(y_pred, svm.predict(self.x_test))
+
+    def test_multiclass_falls_back_to_the_model(self):
+        x, y = load_iris(return_X_y=True)
+        svm = SVM().fit(x, y)
+        self.assertIsNone(svm.kernel_expansion())
+        with ShardedPredictor(n_jobs=2, shard_size=40) as predictor:
+            np.testing.assert_array_equal(predictor.predict(svm, x), svm.predict(x))
+
+    def test_pool_is_reused_across_calls_with_the_same_model(self):
+        svm = SVM().fit(self.x_train, self.y_train)
+        with ShardedPredictor(n_jobs=2, shard_size=30) as predictor:
+            for start in range(0, len(self.x_test), 100):
+                chunk = self.x_test[start:start + 100]
+                np.testing.assert_array_equal(predictor.predict(svm, chunk), svm.predict(chunk))
+                if start == 0:
+                    pool = predictor._pool
+                self.assertIs(predictor._pool, pool)
+            other = SVM(kernel="linear").fit(self.x_train, self.y_train)
+            np.testing.assert_array_equal(predictor.predict(other, self.x_test), other.predict(self.x_test))
+            self.assertIsNot(predictor._pool, pool)
+        self.assertIsNone(predictor._pool)
+
+    def test_single_shard_runs_inline(self):
+        svm = SVM().fit(self.x_train, self.y_train)
+        y_pred, scores = ShardedPredictor(n_jobs=4, shard_size=1000).predict_scores(svm, self.x_test)
+        np.testing.assert_array_equal(y_pred, svm.predict(self.x_test))
+        np.testing.assert_array_equal(scores, svm.decision_function(self.x_test))
+
+
+if __name__ == '__main__':
+    unittest.main()
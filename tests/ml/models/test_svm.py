@@ -33,6 +33,27 @@ class TestSVM(unittest.TestCase):
         self.assertEqual(self.svm.model.kernel, 'rbf')
         self.assertAlmostEqual(self.svm.model.C, 1.0, places=3)
 
+    def test_support_set_labels(self):
+        self.svm.fit(self.x_train, self.y_train)
+        x_support, y_support = self.svm.support_set()
+        np.testing.assert_array_equal(x_support, self.x_train[self.svm.model.support_])
+        np.testing.assert_array_equal(y_support, self.y_train[self.svm.model.support_])
+
+    def test_fit_incremental_trains_on_support_vectors_and_new_rows(self):
+        self.svm.fit(self.x_train[:80], self.y_train[:80])
+        n_support = len(self.svm.model.support_)
+        self.svm.fit_incremental(self.x_train[80:], self.y_train[80:])
+        self.assertEqual(self.svm.model.shape_fit_[0], n_support + len(self.x_train) - 80)
+        self.assertGreater(accuracy_score(self.y_test, self.svm.predict(self.x_test)), 0.9)
+
+    def test_predict_scores_match_predict_and_decision_function(self):
+        binary = self.y_train > 0
+        x_train, y_train = self.x_train[binary], self.y_train[binary]
+        self.svm.fit(x_train, y_train)
+        y_pred, scores = self.svm.predict_scores(self.x_test)
+        np.testing.assert_array_equal(y_pred, self.svm.predict(self.x_test))
+        np.testing.assert_array_equal(scores, self.svm.decision_function(self.x_test))
+
 
 if __name__ == '__main__':
     unittest.main()
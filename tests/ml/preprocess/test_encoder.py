@@ -31,6 +31,20 @@ class TestEncoder(unittest.TestCase):
         })
         pd.testing.assert_frame_equal(transformed_df, expected_df)
 
+    def test_transform_reuses_fitted_codes(self):
+        self.encoder.fit_transform(self.data)
+        batch = pd.DataFrame({'gender': ['female', 'male'], 'age': [50, 60], 'income': [1, 2]})
+        transformed_df = self.encoder.transform(batch)
+        self.assertListEqual(list(transformed_df['gender']), [0, 1])
+        self.assertEqual(self.encoder.mappings, {'gender': {'female': 0, 'male': 1}})
+
+    def test_transform_encodes_unseen_categories(self):
+        self.encoder = Encoder(cols='gender', unknown_value=-1)
+        self.encoder.fit(self.data)
+        batch = pd.DataFrame({'gender': ['male', 'unknown', None]})
+        transformed_df = self.encoder.transform(batch)
+        self.assertListEqual(list(transformed_df['gender']), [1, -1, -1])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+import numpy as np
+import pandas as pd
+from ml.preprocess.feature import Encoder, Scalers, RandomImputer, ValueImputer, FeatureMatrix
+
+
+class TestFeatureMatrix(unittest.TestCase):
+    def setUp(self):
+        self.train_df = pd.DataFrame({
+            'label': [0, 1, 1, 0, 1],
+            'sex': ['male', 'female', 'female', 'male', 'male'],
+            'age': [22.0, np.nan, 26.0, 35.0, np.nan],
+            'fare': [7.25, 71.28, np.nan, 53.1, 8.05],
+            'port': ['S', 'C', np.nan, 'S', 'Q'],
+        })
+        self.test_df = pd.DataFrame({
+            'sex': ['female', 'male'],
+            'age': [np.nan, 40.0],
+            'fare': [np.nan, 9.5],
+            'port': [np.nan, 'C'],
+        })
+        self.feature_names = ['sex', 'age', 'fare', 'port']
+
+    def _components(self):
+        imputers = [RandomImputer('age'), ValueImputer('port', 'S'), ValueImputer('fare')]
+        return imputers, Encoder(['sex', 'port']), Scalers()
+
+    def _legacy(self, train_df, test_df):
+        imputers, encoder, scaler = self._components()
+        for imputer in imputers:
+            train_df = imputer.fit_transform(train_df)
+        train_df = encoder.fit_transform(train_df)
+        for imputer in imputers:
+            test_df = imputer.transform(test_df)
+        test_df = encoder.transform(test_df)
+        return scaler.fit_transform(train_df[self.feature_names], test_df[self.feature_names])
+
+    def test_matches_dataframe_path(self):
+        expected_train, expected_test = self._legacy(self.train_df.copy(), self.test_df.copy())
+        matrix = FeatureMatrix(self.feature_names, *self._components())
+        x_train = matrix.fit_transform(self.train_df)
+        x_test = matrix.transform(self.test_df)
+        np.testing.assert_allclose(x_train, expected_train, rtol=1e-5, atol=1e-5)
+        np.testing.assert_allclose(x_test, expected_test, rtol=1e-5, atol=1e-5)
+
+    def test_single_contiguous_float32_allocation(self):
+        matrix = FeatureMatrix(self.feature_names, *self._components())
+        x_train = matrix.fit_transform(self.train_df)
+        self.assertEqual(x_train.dtype, np.float32)
+        self.assertTrue(x_train.flags['C_CONTIGUOUS'])
+        out = np.empty((len(self.test_df), len(self.feature_names)), dtype=np.float32)
+        self.assertIs(matrix.transform(self.test_df, out=out), out)
+
+    def test_raw_frames_are_not_mutated(self):
+        train_df, test_df = self.train_df.copy(), self.test_df.copy()
+        matrix = FeatureMatrix(self.feature_names, *self._components())
+        matrix.fit_transform(train_df)
+        matrix.transform(test_df)
+        pd.testing.assert_frame_equal(train_df, self.train_df)
+        pd.testing.assert_frame_equal(test_df, self.test_df)
+
+    def test_fit_chunks_matches_fit_transform(self):
+        # random fills are keyed by the index, which the chunks keep
+        train_df = self.train_df
+        self.assertTrue(train_df['age'].isna().any())
+        matrix = FeatureMatrix(self.feature_names, *self._components())
+        x_train = matrix.fit_transform(train_df)
+        x_test = matrix.transform(self.test_df)
+        chunked = FeatureMatrix(self.feature_names, *self._components())
+        chunked.fit_chunks(lambda: (train_df[i:i + 2] for i in range(0, len(train_df), 2)))
+        self.assertDictEqual(chunked.encoder.mappings, matrix.encoder.mappings)
+        x_chunks = list(chunked.transform_chunks(iter([train_df[:3], train_df[3:], self.test_df])))
+        np.testing.assert_allclose(np.concatenate(x_chunks[:2]), x_train, rtol=1e-5, atol=1e-5)
+        np.testing.assert_allclose(x_chunks[2], x_test, rtol=1e-5, atol=1e-5)
+        streamed = FeatureMatrix(self.feature_names, *self._components())
+        x_streamed = streamed.fit_transform_chunks(lambda: (train_df[i:i + 2] for i in range(0, len(train_df), 2)))
+        np.testing.assert_allclose(x_streamed, x_train, rtol=1e-5, atol=1e-5)
+
+
+if __name__ == '__main__':
+    unittest.main()
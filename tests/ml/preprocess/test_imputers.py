@@ -0,0 +1,76 @@
+import unittest
+import numpy as np
+import pandas as pd
+from ml.preprocess.feature import RandomImputer, ValueImputer
+
+
+class TestRandomImputer(unittest.TestCase):
+    def setUp(self):
+        self.train_df = pd.DataFrame({'age': [20.0, 30.0, np.nan, 40.0]})
+        self.test_df = pd.DataFrame({'age': [np.nan, 1000.0, np.nan]})
+
+    def test_fit_uses_train_statistics_only(self):
+        imputer = RandomImputer('age').fit(self.train_df)
+        imputer.transform(self.test_df)
+        self.assertAlmostEqual(imputer.mean_, 30.0)
+        self.assertAlmostEqual(imputer.std_, 10.0)
+        self.assertFalse(self.test_df['age'].isnull().any())
+        self.assertTrue(self.test_df['age'][[0, 2]].between(20, 39).all())
+        self.assertEqual(self.test_df['age'][1], 1000)
+
+    def test_transform_is_seeded(self):
+        imputer = RandomImputer('age', random_state=7).fit(self.train_df)
+        first = imputer.transform(self.test_df.copy())
+        second = imputer.transform(self.test_df.copy())
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_fill_depends_on_the_row_not_its_batch(self):
+        imputer = RandomImputer('age', key_col='id').fit(self.train_df)
+        df = pd.DataFrame({'id': range(1, 41), 'age': np.nan})
+        whole = imputer.transform(df.copy())['age']
+        self.assertGreater(whole.nunique(), 1)
+        shuffled = imputer.transform(df.sample(frac=1, random_state=1))['age']
+        pd.testing.assert_series_equal(shuffled.sort_index(), whole)
+        chunks = pd.concat([imputer.transform(df[i:i + 7].reset_index(drop=True))['age'] for i in range(0, 40, 7)])
+        np.testing.assert_array_equal(chunks.to_numpy(), whole.to_numpy())
+        other_seed = RandomImputer('age', random_state=1, key_col='id').fit(self.train_df)
+        self.assertFalse(other_seed.transform(df.copy())['age'].equals(whole))
+
+    def test_fill_without_key_column_uses_the_index(self):
+        imputer = RandomImputer('age').fit(self.train_df)
+        df = pd.DataFrame({'age': np.nan}, index=range(100, 140))
+        whole = imputer.transform(df.copy())['age']
+        pd.testing.assert_series_equal(imputer.transform(df[20:].copy())['age'], whole[20:])
+
+    def test_partial_fit_matches_fit(self):
+        imputer = RandomImputer('age').partial_fit(self.train_df[:1]).partial_fit(self.train_df[1:3])
+        imputer.partial_fit(self.train_df[3:])
+        self.assertAlmostEqual(imputer.mean_, 30.0)
+        self.assertAlmostEqual(imputer.std_, 10.0)
+
+
+class TestValueImputer(unittest.TestCase):
+    def setUp(self):
+        self.train_df = pd.DataFrame({'fare': [10.0, np.nan, 30.0], 'port': ['S', np.nan, 'C']})
+
+    def test_mean_learned_on_train(self):
+        imputer = ValueImputer('fare').fit(self.train_df)
+        test_df = imputer.transform(pd.DataFrame({'fare': [np.nan, 5.0]}))
+        self.assertListEqual(list(test_df['fare']), [20.0, 5.0])
+
+    def test_partial_fit_mean(self):
+        imputer = ValueImputer('fare').fit(self.train_df[:2]).partial_fit(self.train_df[2:])
+        self.assertAlmostEqual(imputer.value_, 20.0)
+
+    def test_constant_value_on_categorical_column(self):
+        df = pd.DataFrame({'port': pd.Series(['C', np.nan], dtype='category')})
+        df = ValueImputer('port', 'S').transform(df)
+        self.assertListEqual(list(df['port']), ['C', 'S'])
+
+    def test_constant_value(self):
+        train_df = ValueImputer('port', 'S').fit_transform(self.train_df)
+        self.assertListEqual(list(train_df['port']), ['S', 'S', 'C'])
+
+
+if __name__ == '__main__':
+    unittest.main()
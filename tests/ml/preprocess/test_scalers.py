@@ -55,6 +55,17 @@ class TestScalers(unittest.TestCase):
             expected_x_test
         )
 
+    def test_partial_fit_over_chunks_matches_fit(self):
+        # a large offset makes a naive sum-of-squares variance lose every significant digit
+        x = 1e9 + np.random.default_rng(0).normal(size=(1000, 3))
+        scaler = Scalers().fit_chunks(np.array_split(x, 7))
+        expected_scaler = self.expected_scaler(x)
+        np.testing.assert_allclose(scaler._sc.mean_, expected_scaler.mean_)
+        np.testing.assert_allclose(scaler._sc.var_, expected_scaler.var_, rtol=1e-6)
+        chunks = scaler.transform_chunks(iter(np.array_split(x, 3)))
+        self.assertNotIsInstance(chunks, list)
+        np.testing.assert_allclose(np.concatenate(list(chunks)), expected_scaler.transform(x), atol=1e-6)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,54 @@
+import os
+import time
+import shutil
+import unittest
+import numpy as np
+from pipeline.cache import StageCache
+
+
+class TestStageCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = "tests/pipeline/data/output/stage-cache"
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_key_is_deterministic_and_order_sensitive(self):
+        self.assertEqual(StageCache.key("fit", {"C": 1.0, "gamma": "scale"}),
+                         StageCache.key("fit", {"gamma": "scale", "C": 1.0}))
+        self.assertNotEqual(StageCache.key("fit", "a", "b"), StageCache.key("fit", "b", "a"))
+
+    def test_put_and_get(self):
+        cache = StageCache(self.cache_dir)
+        key = cache.key("preprocess", "train-hash")
+        self.assertIsNone(cache.get("preprocess", key))
+        cache.put("preprocess", key, (np.arange(3), "fitted"))
+        x, fitted = cache.get("preprocess", key)
+        np.testing.assert_array_equal(x, np.arange(3))
+        self.assertEqual(fitted, "fitted")
+        self.assertFalse([f for f in os.listdir(self.cache_dir) if f.endswith(".tmp")])
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = StageCache(self.cache_dir, max_size_mb=2.5)
+        block = np.zeros(2 ** 17)  # 1 MB
+        for stage in ("a", "b"):
+            cache.put(stage, "k", block)
+            time.sleep(0.01)
+        cache.get("a", "k")
+        time.sleep(0.01)
+        cache.put("c", "k", block)
+        self.assertIsNotNone(cache.get("a", "k"))
+        self.assertIsNone(cache.get("b", "k"))
+        self.assertIsNotNone(cache.get("c", "k"))
+        self.assertLessEqual(cache.size(), 2.5 * 2 ** 20)
+
+    def test_unreadable_entry_is_a_miss(self):
+        cache = StageCache(self.cache_dir)
+        path = cache.put("load", "k", [1, 2])
+        with open(path, "wb") as entry:
+            entry.write(b"corrupted")
+        self.assertIsNone(cache.get("load", "k"))
+        self.assertFalse(os.path.exists(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import json
+import shutil
+import time
+import unittest
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from pipeline.instrumentation import RunReport, RUN_REPORT_FILE_NAME, PROMETHEUS_FILE_NAME
+
+
+def _busy(seconds):
+    end = time.process_time() + seconds
+    while time.process_time() < end:
+        pass
+
+
+class TestRunReport(unittest.TestCase):
+
+    def setUp(self):
+        self.output_path = "tests/pipeline/data/output/instrumentation"
+        shutil.rmtree(self.output_path, ignore_errors=True)
+
+    def test_stages_are_aggregated_by_name(self):
+        report = RunReport("train")
+        for _ in range(2):
+            with report.stage("load"):
+                sum(range(1000))
+        with report.stage("fit"):
+            pass
+        run = report.to_dict()
+        self.assertEqual([s["stage"] for s in run["stages"]], ["load", "fit"])
+        load = run["stages"][0]
+        self.assertEqual(load["calls"], 2)
+        self.assertGreater(load["wall_seconds"], 0)
+        self.assertGreaterEqual(load["cpu_seconds"], 0)
+        self.assertGreater(load["peak_rss_mb"], 0)
+
+    def test_peak_rss_is_sampled_per_stage(self):
+        report = RunReport("train", sample_interval=0.001)
+        with report.stage("allocate"):
+            block = np.ones(64 * 2 ** 20 // 8)
+            time.sleep(0.05)
+            del block
+        with report.stage("small"):
+            time.sleep(0.05)
+        # the process high-water mark never drops, the per-stage peak does
+        self.assertGreater(report.stages["allocate"]["peak_rss_mb"], report.stages["small"]["peak_rss_mb"] + 32)
+        self.assertGreater(report.to_dict()["max_rss_mb"], report.stages["small"]["peak_rss_mb"] + 32)
+
+    def test_stage_counts_child_processes(self):
+        report = RunReport("train", sample_interval=0.01)
+        with report.stage("pool"):
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                pool.submit(_busy, 0.3).result()
+        pool_stage = report.stages["pool"]
+        self.assertGreater(pool_stage["peak_children_rss_mb"], 0)
+        self.assertGreater(pool_stage["cpu_seconds"], 0.2)
+
+    def test_stage_recorded_when_it_raises(self):
+        report = RunReport("predict")
+        with self.assertRaises(RuntimeError):
+            with report.stage("predict"):
+                raise RuntimeError("boom")
+        self.assertEqual(report.stages["predict"]["calls"], 1)
+
+    def test_save_json_and_prometheus(self):
+        report = RunReport("train")
+        with report.stage("load"):
+            pass
+        paths = report.save(self.output_path, prometheus=True)
+        self.assertEqual(paths, [os.path.join(self.output_path, RUN_REPORT_FILE_NAME),
+                                 os.path.join(self.output_path, PROMETHEUS_FILE_NAME)])
+        with open(paths[0], encoding="utf-8") as report_file:
+            self.assertEqual(json.load(report_file)["stages"][0]["stage"], "load")
+        with open(paths[1], encoding="utf-8") as metrics_file:
+            metrics = metrics_file.read()
+        self.assertIn("# TYPE titanic_pipeline_stage_wall_seconds gauge", metrics)
+        self.assertIn('titanic_pipeline_stage_calls{mode="train",stage="load"} 1', metrics)
+
+    def test_disabled_report_records_nothing(self):
+        report = RunReport("train", enabled=False)
+        with report.stage("load"):
+            pass
+        self.assertEqual(report.stages, {})
+        self.assertEqual(report.save(self.output_path), [])
+        self.assertFalse(os.path.exists(self.output_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,19 @@
 import os
+import json
+import shutil
 import unittest
+from unittest import mock
+import numpy as np
 import pandas as pd
-from pipeline.constants import PASSENGER_ID, NAME, TICKET, CABIN, AGE, EMBARKED, SEX, FARE, SURVIVED
+from pipeline.constants import PASSENGER_ID, NAME, TICKET, CABIN, AGE, EMBARKED, SEX, FARE, SURVIVED, PCLASS, \
+    SIBSP, PARCH, DECISION, PROBABILITY
 from pipeline.pipeline import TitanicKernelSVMPipeline
+from ml.models.svm import SVM
+from ml.models.kernel_approx import KernelApproxSVM
+from ml.models.artifact import ModelArtifact
+from ml.models.numpy_predictor import NumpyPredictor
+from ml.models.sharded import ShardedPredictor
+from ml.models.calibration import ScoreCalibrator
 
 
 class TestTitanicKernelSVMPipeline(unittest.TestCase):
@@ -89,6 +100,439 @@ class TestTitanicKernelSVMPipeline(unittest.TestCase):
         self.assertEqual(set(predictions.columns), {PASSENGER_ID, SURVIVED})
         self.assertEqual(predictions.shape[1], test_df.shape[1])
 
+    def test_predict_reuses_persisted_model(self):
+        self.pipeline.process()
+        self.assertTrue(os.path.exists(os.path.join(self.output_path, "model.joblib")))
+        trained = pd.read_csv(self._predictions_path)
+
+        scoring_pipeline = TitanicKernelSVMPipeline(None, self.test_ds_path, self.output_path)
+        scoring_pipeline.predict()
+
+        predictions = pd.read_csv(self._predictions_path)
+        self.assertEqual(set(predictions.columns), {PASSENGER_ID, SURVIVED})
+        pd.testing.assert_frame_equal(predictions, trained)
+
+    def test_predict_streams_chunks(self):
+        self.pipeline.process()
+        trained = pd.read_csv(self._predictions_path)
+
+        scoring_pipeline = TitanicKernelSVMPipeline(None, self.test_ds_path, self.output_path)
+        scoring_pipeline.predict(chunk_size=100)
+        self.assertEqual(scoring_pipeline.null_summaries["test_df"].to_dict()["rows"], len(trained))
+        self.assertEqual(scoring_pipeline.null_summaries["test_df"].to_dict()["nulls"][AGE], 86)
+
+        predictions = pd.read_csv(self._predictions_path)
+        self.assertEqual(list(predictions.columns), [PASSENGER_ID, SURVIVED])
+        pd.testing.assert_series_equal(predictions[PASSENGER_ID], trained[PASSENGER_ID])
+        self.assertTrue(predictions[SURVIVED].isin([0, 1]).all())
+
+    def test_predict_streams_chunks_into_compressed_outputs(self):
+        self.pipeline.process()
+        trained = pd.read_csv(self._predictions_path)
+        for output, file_name in (({"format": "csv", "compression": "gzip"}, "predictions.csv.gz"),
+                                  ({"format": "parquet", "compression": "snappy"}, "predictions.parquet")):
+            scoring_pipeline = TitanicKernelSVMPipeline(None, self.test_ds_path, self.output_path,
+                                                        output={**output, "buffer_rows": 150})
+            scoring_pipeline.predict(chunk_size=100)
+            path = os.path.join(self.output_path, file_name)
+            predictions = pd.read_parquet(path) if output["format"] == "parquet" else pd.read_csv(path)
+            # parquet keeps the schema dtypes (int8 labels) that the csv round trip widens
+            pd.testing.assert_frame_equal(predictions, trained, check_dtype=False)
+        self.assertFalse([name for name in os.listdir(self.output_path) if name.endswith(".tmp")])
+
+    def test_failed_step_reraises_the_original_error(self):
+        pipeline = TitanicKernelSVMPipeline(self.train_ds_path, self.test_ds_path, self.output_path,
+                                            scores={"calibration": "sigmoid"})
+        # the SVM is not fitted yet
+        with self.assertRaises(ValueError):
+            pipeline.calibrate(np.zeros((4, 7)), np.array([0, 1, 0, 1]))
+
+    def test_process_without_profiler_report(self):
+        output_path = "tests/pipeline/data/output-no-report"
+        pipeline = TitanicKernelSVMPipeline(
+            self.train_ds_path,
+            self.test_ds_path,
+            output_path,
+            profiling={"enabled": False}
+        )
+        pipeline.process()
+        self.assertTrue(os.path.exists(os.path.join(output_path, "predictions.csv")))
+        self.assertFalse(os.path.exists(os.path.join(output_path, "report")))
+
+    def test_process_with_background_profiler_report(self):
+        output_path = "tests/pipeline/data/output-background-report"
+        pipeline = TitanicKernelSVMPipeline(
+            self.train_ds_path,
+            self.test_ds_path,
+            output_path,
+            profiling={"minimal": True, "sample_size": 100, "background": True}
+        )
+        pipeline.process()
+        self.assertTrue(os.path.exists(os.path.join(output_path, "predictions.csv")))
+        for dataset_type in ("train", "test"):
+            self.assertTrue(os.path.exists(os.path.join(output_path, "report", f"{dataset_type}-report.html")))
+
+    def test_process_with_kernel_approximation_engine(self):
+        output_path = "tests/pipeline/data/output-kernel-approximation"
+        pipeline = TitanicKernelSVMPipeline(
+            self.train_ds_path,
+            self.test_ds_path,
+            output_path,
+            profiling={"enabled": False},
+            model={"engine": "kernel-approximation", "n_components": 100}
+        )
+        pipeline.process()
+        predictions = pd.read_csv(os.path.join(output_path, "predictions.csv"))
+        self.assertTrue(predictions[SURVIVED].isin([0, 1]).all())
+
+    def test_unknown_model_engine(self):
+        with self.assertRaises(ValueError):
+            TitanicKernelSVMPipeline(self.train_ds_path, self.test_ds_path, self.output_path, model={"engine": "x"})
+
+    def test_process_with_search_stores_best_params(self):
+        output_path = "tests/pipeline/data/output-search"
+        pipeline = TitanicKernelSVMPipeline(
+            self.train_ds_path,
+            self.test_ds_path,
+            output_path,
+            profiling={"enabled": False},
+            search={"enabled": True, "strategy": "halving", "C": [0.1, 1.0], "gamma": ["scale", 0.1], "n_jobs": 2}
+        )
+        pipeline.process()
+        artifact = ModelArtifact.load(output_path)
+        self.assertEqual(artifact.search["strategy"], "halving")
+        self.assertEqual(artifact.svm.model.C, artifact.search["best_params"]["C"])
+        self.assertEqual(artifact.svm.model.gamma, artifact.search["best_params"]["gamma"])
+
+    def test_process_with_columnar_cache(self):
+        output_path = "tests/pipeline/data/output-columnar"
+        shutil.rmtree(output_path, ignore_errors=True)
+        pipeline = TitanicKernelSVMPipeline(
+            self.train_ds_path,
+            self.test_ds_path,
+            output_path,
+            profiling={"enabled": False},
+            columnar_cache=os.path.join(output_path, "cache")
+        )
+        pipeline.process()
+        self.assertEqual(len([f for f in os.listdir(os.path.join(output_path, "cache"))]), 2)
+        predictions = pd.read_csv(os.path.join(output_path, "predictions.csv"))
+        self.assertEqual(set(predictions.columns), {PASSENGER_ID, SURVIVED})
+        self.assertEqual(len(predictions), 418)
+
+    def test_process_and_predict_write_run_report(self):
+        output_path = "tests/pipeline/data/output-run-report"
+        pipeline = TitanicKernelSVMPipeline(
+            self.train_ds_path,
+            self.test_ds_path,
+            output_path,
+            profiling={"enabled": False},
+            instrumentation={"prometheus": True}
+        )
+        pipeline.process()
+        with open(os.path.join(output_path, "run-report.json"), encoding="utf-8") as report_file:
+            report = json.load(report_file)
+        self.assertEqual(report["mode"], "train")
+        stages = {s["stage"]: s for s in report["stages"]}
+        self.assertEqual(list(stages), ["load", "null_check", "profiling", "preprocess", "fit", "predict", "score",
+                                        "persist"])
+        self.assertEqual(stages["load"]["calls"], 2)
+        self.assertTrue(os.path.exists(os.path.join(output_path, "run-metrics.prom")))
+
+        scoring_pipeline = TitanicKernelSVMPipeline(None, self.test_ds_path, output_path)
+        scoring_pipeline.predict(chunk_size=100)
+        stages = {s["stage"]: s for s in scoring_pipeline.run_report.to_dict()["stages"]}
+        self.assertEqual(stages["predict"]["calls"], 5)
+        self.assertEqual(stages["load"]["calls"], 7)
+
+
+    def test_process_reuses_stage_cache(self):
+        output_path = "tests/pipeline/data/output-stage-cache"
+        shutil.rmtree(output_path, ignore_errors=True)
+        cache = {"enabled": True, "path": os.path.join(output_path, "cache")}
+
+        def run(**kwargs):
+            pipeline = TitanicKernelSVMPipeline(self.train_ds_path, self.test_ds_path, output_path,
+                                                profiling={"enabled": False}, cache=cache, **kwargs)
+            with self.assertLogs("pipeline.pipeline", level="INFO") as logs:
+                pipeline.process()
+            hits = [line.split("'")[1] for line in logs.output if "Stage Cache Hit" in line]
+            return hits, pd.read_csv(os.path.join(output_path, "predictions.csv"))
+
+        hits, first = run()
+        self.assertListEqual(hits, [])
+        hits, second = run()
+        self.assertListEqual(hits, ["load", "load", "preprocess", "fit", "predict"])
+        pd.testing.assert_frame_equal(first, second)
+        hits, _ = run(model={"engine": "kernel-approximation"})
+        self.assertListEqual(hits, ["load", "load", "preprocess"])
+        artifact = ModelArtifact.load(output_path)
+        self.assertEqual(artifact.feature_names, [PCLASS, SEX, AGE, SIBSP, PARCH, FARE, EMBARKED])
+
+    def test_retrain_warm_starts_from_appended_rows(self):
+        output_path = "tests/pipeline/data/output-retrain"
+        shutil.rmtree(output_path, ignore_errors=True)
+        os.makedirs(output_path)
+        train_path = os.path.join(output_path, "train.csv")
+        full_train_df = pd.read_csv(self.train_ds_path)
+        full_train_df.iloc[:600].to_csv(train_path, index=False)
+
+        def retrain(full_refit_every=3):
+            pipeline = TitanicKernelSVMPipeline(train_path, self.test_ds_path, output_path,
+                                                profiling={"enabled": False},
+                                                training={"incremental": True, "full_refit_every": full_refit_every})
+            pipeline.retrain()
+            return ModelArtifact.load(output_path).training
+
+        self.assertEqual(retrain(), {"rows": 600, "incremental_fits": 0})
+        full_train_df.to_csv(train_path, index=False)
+        self.assertEqual(retrain(), {"rows": 891, "incremental_fits": 1})
+        predictions = pd.read_csv(os.path.join(output_path, "predictions.csv"))
+        self.assertEqual(len(predictions), 418)
+        self.assertTrue(predictions[SURVIVED].isin([0, 1]).all())
+        self.assertEqual(retrain(full_refit_every=2), {"rows": 891, "incremental_fits": 0})
+
+    def test_incremental_retrain_refits_the_calibration(self):
+        output_path = "tests/pipeline/data/output-retrain-calibration"
+        shutil.rmtree(output_path, ignore_errors=True)
+        os.makedirs(output_path)
+        train_path = os.path.join(output_path, "train.csv")
+        full_train_df = pd.read_csv(self.train_ds_path)
+        full_train_df.iloc[:600].to_csv(train_path, index=False)
+
+        def retrain(calibration="sigmoid"):
+            TitanicKernelSVMPipeline(train_path, self.test_ds_path, output_path, profiling={"enabled": False},
+                                     training={"incremental": True}, scores={"calibration": calibration}).retrain()
+            return ModelArtifact.load(output_path)
+
+        margins = np.linspace(-2, 2, 9)
+        artifact = retrain()
+        before, n_support = artifact.calibrator.predict_proba(margins), len(artifact.svm.support_set()[1])
+        full_train_df.to_csv(train_path, index=False)
+        artifact = retrain()
+        self.assertEqual(artifact.training, {"rows": 891, "incremental_fits": 1})
+        self.assertFalse(np.allclose(artifact.calibrator.predict_proba(margins), before))
+        # the new rows held out to calibrate on are not fitted on
+        self.assertEqual(artifact.svm.model.shape_fit_[0], n_support + 291 - int(np.ceil(291 * 0.2)))
+
+        # a different calibration method can't be warm-started
+        artifact = retrain(calibration="isotonic")
+        self.assertEqual(artifact.calibrator.method, "isotonic")
+        self.assertEqual(artifact.training, {"rows": 891, "incremental_fits": 0})
+
+    def test_incremental_compression_is_checked_on_held_out_new_rows(self):
+        output_path = "tests/pipeline/data/output-retrain-compression"
+        shutil.rmtree(output_path, ignore_errors=True)
+        os.makedirs(output_path)
+        train_path = os.path.join(output_path, "train.csv")
+        full_train_df = pd.read_csv(self.train_ds_path)
+        full_train_df.iloc[:600].to_csv(train_path, index=False)
+
+        def retrain():
+            pipeline = TitanicKernelSVMPipeline(train_path, self.test_ds_path, output_path,
+                                                profiling={"enabled": False}, training={"incremental": True},
+                                                compression={"enabled": True, "ratios": [0.5], "tolerance": 0.1})
+            pipeline.retrain()
+            with open(os.path.join(output_path, "compression-report.json"), encoding="utf-8") as report_file:
+                return pipeline, json.load(report_file)
+
+        pipeline, report = retrain()
+        self.assertEqual(report["rows"], int(np.ceil(600 * 0.2)))
+        n_support = len(pipeline._svm.support_set()[1])
+        full_train_df.to_csv(train_path, index=False)
+        pipeline, report = retrain()
+        self.assertEqual(report["rows"], int(np.ceil(291 * 0.2)))
+        # warm-started on the previous support vectors and the new rows that are not held out
+        self.assertEqual(pipeline._svm.model.shape_fit_[0], n_support + 291 - report["rows"])
+
+    def test_full_retrain_rebuilds_the_model_from_the_current_config(self):
+        output_path = "tests/pipeline/data/output-retrain-config"
+        shutil.rmtree(output_path, ignore_errors=True)
+        training = {"incremental": True, "full_refit_every": 1}
+        TitanicKernelSVMPipeline(self.train_ds_path, self.test_ds_path, output_path, profiling={"enabled": False},
+                                 training=training, scores={"calibration": "sigmoid"}).retrain()
+        self.assertIsInstance(ModelArtifact.load(output_path).svm, SVM)
+
+        pipeline = TitanicKernelSVMPipeline(self.train_ds_path, self.test_ds_path, output_path,
+                                            profiling={"enabled": False}, training=training,
+                                            model={"engine": "kernel-approximation"})
+        pipeline.retrain()
+        artifact = ModelArtifact.load(output_path)
+        self.assertIsInstance(artifact.svm, KernelApproxSVM)
+        self.assertIsNone(artifact.calibrator)
+        self.assertEqual(artifact.training, {"rows": 891, "incremental_fits": 0})
+        predictions = pd.read_csv(os.path.join(output_path, "predictions.csv"))
+        self.assertListEqual(list(predictions.columns), [PASSENGER_ID, SURVIVED])
+
+    def test_process_streams_the_training_file_in_chunks(self):
+        self.pipeline.process()
+        expected = pd.read_csv(self._predictions_path)
+        output_path = "tests/pipeline/data/output-train-chunks"
+        shutil.rmtree(output_path, ignore_errors=True)
+        pipeline = TitanicKernelSVMPipeline(self.train_ds_path, self.test_ds_path, output_path,
+                                            profiling={"enabled": False}, training={"chunk_size": 100})
+        pipeline.process()
+        pd.testing.assert_frame_equal(pd.read_csv(os.path.join(output_path, "predictions.csv")), expected)
+        self.assertEqual(pipeline.null_summaries["train_df"].to_dict()["rows"], 891)
+        self.assertEqual(ModelArtifact.load(output_path).training, {"rows": 891, "incremental_fits": 0})
+        np.testing.assert_allclose(pipeline._slrs._sc.mean_, self.pipeline._slrs._sc.mean_, rtol=1e-5)
+
+    def test_process_with_model_selection(self):
+        output_path = "tests/pipeline/data/output-selection"
+        pipeline = TitanicKernelSVMPipeline(
+            self.train_ds_path,
+            self.test_ds_path,
+            output_path,
+            profiling={"enabled": False},
+            selection={
+                "enabled": True,
+                "candidates": [{"kernel": "rbf", "C": 1.0}, {"kernel": "linear", "class_weight": "balanced"}],
+                "cv": 3,
+                "n_jobs": 2
+            }
+        )
+        pipeline.process()
+        artifact = ModelArtifact.load(output_path)
+        self.assertEqual(artifact.search["strategy"], "selection-best")
+        self.assertEqual(len(artifact.search["results"]), 2)
+        self.assertIn(artifact.search["best_params"], pipeline.selection["candidates"])
+        self.assertEqual(artifact.svm.model.kernel, artifact.search["best_params"]["kernel"])
+        self.assertEqual(len(pd.read_csv(os.path.join(output_path, "predictions.csv"))), 418)
+
+    def test_process_writes_cached_shap_values(self):
+        output_path = "tests/pipeline/data/output-explain"
+        shutil.rmtree(output_path, ignore_errors=True)
+
+        def run():
+            pipeline = TitanicKernelSVMPipeline(
+                self.train_ds_path,
+                self.test_ds_path,
+                output_path,
+                profiling={"enabled": False},
+                explain={"enabled": True, "background_size": 10, "nsamples": 32, "max_rows": 40, "n_jobs": 1},
+                cache={"enabled": True, "path": os.path.join(output_path, "cache")}
+            )
+            with self.assertLogs("pipeline.pipeline", level="INFO") as logs:
+                pipeline.process()
+            return [line for line in logs.output if "Stage Cache Hit For 'explain'" in line]
+
+        self.assertListEqual(run(), [])
+        values = np.load(os.path.join(output_path, "shap-values.npy"))
+        self.assertEqual(values.shape, (40, 7))
+        shap_df = pd.read_parquet(os.path.join(output_path, "shap-values.parquet"))
+        self.assertListEqual(list(shap_df.columns), [PASSENGER_ID, PCLASS, SEX, AGE, SIBSP, PARCH, FARE, EMBARKED,
+                                                     "base_value"])
+        self.assertTrue(shap_df[PASSENGER_ID].isin(pd.read_csv(self.test_ds_path)[PASSENGER_ID]).all())
+        self.assertEqual(len(run()), 1)
+        np.testing.assert_array_equal(np.load(os.path.join(output_path, "shap-values.npy")), values)
+
+    def test_process_writes_decision_scores_and_calibrated_probabilities(self):
+        output_path = "tests/pipeline/data/output-scores"
+        shutil.rmtree(output_path, ignore_errors=True)
+        scores = {"decision": True, "calibration": "sigmoid", "holdout": 0.2}
+        pipeline = TitanicKernelSVMPipeline(self.train_ds_path, self.test_ds_path, output_path,
+                                            profiling={"enabled": False}, scores=scores)
+        pipeline.process()
+        predictions = pd.read_csv(os.path.join(output_path, "predictions.csv"))
+        self.assertListEqual(list(predictions.columns), [PASSENGER_ID, SURVIVED, DECISION, PROBABILITY])
+        np.testing.assert_array_equal(predictions[SURVIVED], (predictions[DECISION] > 0).astype(int))
+        self.assertTrue(predictions[PROBABILITY].between(0, 1).all())
+        order = np.argsort(predictions[DECISION].to_numpy())
+        self.assertTrue(np.all(np.diff(predictions[PROBABILITY].to_numpy()[order]) >= -1e-12))
+        # the calibration holdout is kept out of the SVM fit
+        self.assertEqual(pipeline._svm.model.shape_fit_[0], 891 - int(np.ceil(891 * 0.2)))
+        self.assertIsNotNone(ModelArtifact.load(output_path).calibrator)
+
+        scoring_pipeline = TitanicKernelSVMPipeline(None, self.test_ds_path, output_path, scores=scores)
+        scoring_pipeline.predict()
+        pd.testing.assert_frame_equal(pd.read_csv(os.path.join(output_path, "predictions.csv")), predictions)
+
+    def test_process_with_sharded_prediction(self):
+        self.pipeline.process()
+        expected = pd.read_csv(self._predictions_path)
+        output_path = "tests/pipeline/data/output-sharded"
+        pipeline = TitanicKernelSVMPipeline(self.train_ds_path, self.test_ds_path, output_path,
+                                            profiling={"enabled": False},
+                                            prediction={"n_jobs": 2, "shard_size": 100},
+                                            scores={"decision": True})
+        pipeline.process()
+        predictions = pd.read_csv(os.path.join(output_path, "predictions.csv"))
+        pd.testing.assert_frame_equal(predictions[[PASSENGER_ID, SURVIVED]], expected)
+        np.testing.assert_allclose(predictions[DECISION], pipeline._svm.decision_function(pipeline._matrix.transform(
+            pd.read_csv(self.test_ds_path))), atol=1e-6)
+
+    def test_streamed_sharded_prediction_starts_the_pool_once(self):
+        self.pipeline.process()
+        trained = pd.read_csv(self._predictions_path)
+        output_path = "tests/pipeline/data/output-sharded"
+        shutil.rmtree(output_path, ignore_errors=True)
+        scoring_pipeline = TitanicKernelSVMPipeline(None, self.test_ds_path, output_path, model_path=self.output_path,
+                                                    prediction={"n_jobs": 2, "shard_size": 50})
+        with mock.patch.object(ShardedPredictor, "_start", autospec=True, side_effect=ShardedPredictor._start) \
+                as start, mock.patch.object(ShardedPredictor, "close", autospec=True,
+                                            side_effect=ShardedPredictor.close) as close:
+            scoring_pipeline.predict(chunk_size=100)
+        self.assertEqual(start.call_count, 1)
+        self.assertTrue(close.called)
+        self.assertIsNone(scoring_pipeline._scoring)
+        pd.testing.assert_frame_equal(pd.read_csv(os.path.join(output_path, "predictions.csv")), trained)
+
+    def test_process_with_numpy_prediction_engine_exports_predictor(self):
+        self.pipeline.process()
+        expected = pd.read_csv(self._predictions_path)
+        output_path = "tests/pipeline/data/output-numpy"
+        shutil.rmtree(output_path, ignore_errors=True)
+        pipeline = TitanicKernelSVMPipeline(self.train_ds_path, self.test_ds_path, output_path,
+                                            profiling={"enabled": False}, prediction={"engine": "numpy"})
+        pipeline.process()
+        pd.testing.assert_frame_equal(pd.read_csv(os.path.join(output_path, "predictions.csv")), expected)
+        predictor = NumpyPredictor.load(os.path.join(output_path, "model-numpy.npz"))
+        x_test = pipeline._matrix.transform(pd.read_csv(self.test_ds_path))
+        np.testing.assert_array_equal(predictor.predict(x_test), pipeline._svm.predict(x_test))
+
+    def test_process_with_support_vector_compression(self):
+        output_path = "tests/pipeline/data/output-compression"
+        shutil.rmtree(output_path, ignore_errors=True)
+        compression = {"enabled": True, "ratios": [0.1, 0.25, 0.5], "tolerance": 0.02}
+        pipeline = TitanicKernelSVMPipeline(self.train_ds_path, self.test_ds_path, output_path,
+                                            profiling={"enabled": False}, compression=compression)
+        pipeline.process()
+        with open(os.path.join(output_path, "compression-report.json"), encoding="utf-8") as report_file:
+            report = json.load(report_file)
+        self.assertTrue(report["accepted"])
+        # evaluated on the held-out rows, which the model is not fitted on
+        holdout = int(np.ceil(891 * 0.2))
+        self.assertEqual(report["rows"], holdout)
+        self.assertEqual(pipeline._svm.model.shape_fit_[0], 891 - holdout)
+        self.assertLess(report["support_vectors"]["after"], report["support_vectors"]["before"])
+        self.assertGreaterEqual(report["accuracy"]["after"], report["accuracy"]["before"] - 0.02)
+
+        artifact = ModelArtifact.load(output_path)
+        self.assertEqual(len(artifact.compressed.support_vectors), report["support_vectors"]["after"])
+        exported = NumpyPredictor.load(os.path.join(output_path, "model-numpy.npz"))
+        self.assertEqual(len(exported.support_vectors), report["support_vectors"]["after"])
+        predictions = pd.read_csv(os.path.join(output_path, "predictions.csv"))
+        x_test = pipeline._matrix.transform(pd.read_csv(self.test_ds_path))
+        np.testing.assert_array_equal(predictions[SURVIVED], artifact.compressed.predict(x_test))
+
+
+    def test_compression_refits_the_calibration_on_the_compressed_margins(self):
+        output_path = "tests/pipeline/data/output-compression-scores"
+        shutil.rmtree(output_path, ignore_errors=True)
+        pipeline = TitanicKernelSVMPipeline(self.train_ds_path, self.test_ds_path, output_path,
+                                            profiling={"enabled": False}, scores={"calibration": "isotonic"},
+                                            compression={"enabled": True, "ratios": [0.25], "tolerance": 0.05})
+        with mock.patch.object(pipeline, "calibrate", wraps=pipeline.calibrate) as calibrate:
+            pipeline.process()
+        artifact = ModelArtifact.load(output_path)
+        self.assertIsNotNone(artifact.compressed)
+        self.assertEqual(calibrate.call_count, 2)
+        x_holdout, y_holdout, model = calibrate.call_args.args
+        self.assertIs(model, pipeline._compressed)
+        np.testing.assert_array_equal(
+            artifact.calibrator.predict_proba(artifact.compressed.decision_function(x_holdout)),
+            ScoreCalibrator("isotonic").fit(artifact.compressed.decision_function(x_holdout), y_holdout)
+            .predict_proba(artifact.compressed.decision_function(x_holdout)))
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,101 @@
+import json
+import threading
+import unittest
+import urllib.error
+import urllib.request
+import pandas as pd
+from concurrent.futures import Future
+from pipeline.constants import PASSENGER_ID, SURVIVED, DECISION, PROBABILITY
+from pipeline.pipeline import TitanicKernelSVMPipeline
+from pipeline.server import TitanicScoringService, make_server
+
+
+class TestTitanicScoringService(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.test_ds_path = "pipeline/data/input/test.csv"
+        cls.output_path = "tests/pipeline/data/output-server"
+        TitanicKernelSVMPipeline(
+            "pipeline/data/input/train.csv",
+            cls.test_ds_path,
+            cls.output_path,
+            profiling={"enabled": False}
+        ).process()
+        cls.expected = pd.read_csv(f"{cls.output_path}/predictions.csv")
+        cls.records = json.loads(pd.read_csv(cls.test_ds_path).to_json(orient="records"))
+
+        cls.service = TitanicScoringService(cls.output_path, max_batch_size=32, max_wait_ms=5).start()
+        cls.server = make_server(cls.service, port=0)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.service.stop()
+
+    def _post(self, payload):
+        request = urllib.request.Request(f"{self.url}/predict", data=json.dumps(payload).encode(), method="POST")
+        with urllib.request.urlopen(request) as response:
+            return json.loads(response.read())
+
+    def test_concurrent_submits_match_batch_predictions(self):
+        futures = [self.service.submit(record) for record in self.records]
+        predictions = pd.DataFrame([p for future in futures for p in future.result(timeout=30)])
+        # missing ages are drawn per PassengerId, so micro-batching doesn't change any prediction
+        pd.testing.assert_frame_equal(predictions, self.expected, check_dtype=False)
+
+    def test_predict_endpoint(self):
+        single = self._post(self.records[0])["predictions"]
+        self.assertEqual(single, [self.expected.iloc[0][[PASSENGER_ID, SURVIVED]].to_dict()])
+        many = self._post(self.records[:5])["predictions"]
+        self.assertListEqual([p[PASSENGER_ID] for p in many], self.expected[PASSENGER_ID][:5].tolist())
+
+    def test_predict_endpoint_rejects_invalid_records(self):
+        with self.assertRaises(urllib.error.HTTPError) as error:
+            self._post({PASSENGER_ID: 1})
+        self.assertEqual(error.exception.code, 400)
+        for field, value in [("Age", "n/a"), ("Pclass", "first"), ("SibSp", 0.5), ("Sex", 1)]:
+            with self.assertRaises(urllib.error.HTTPError) as error:
+                self._post({**self.records[0], field: value})
+            self.assertEqual(error.exception.code, 400)
+
+    def test_validate_casts_fields_to_the_schema_types(self):
+        record = TitanicScoringService.validate({**self.records[0], "Pclass": "3", "Age": "22.5", "Fare": None})[0]
+        self.assertEqual((record["Pclass"], record["Age"], record["Fare"]), (3, 22.5, None))
+
+    def test_failed_batch_only_fails_the_bad_request(self):
+        good, bad = Future(), Future()
+        # a record that bypassed validation, scored in the same micro-batch as a valid one
+        self.service._score([(self.records[:2], good), ([{**self.records[2], "Age": "n/a"}], bad)])
+        self.assertEqual([p[PASSENGER_ID] for p in good.result(timeout=5)], self.expected[PASSENGER_ID][:2].tolist())
+        with self.assertRaises(ValueError):
+            bad.result(timeout=5)
+
+    def test_scores_like_predict_with_compression_engine_and_calibration(self):
+        output_path = "tests/pipeline/data/output-server-scores"
+        options = {
+            "scores": {"decision": True, "calibration": "sigmoid"},
+            "prediction": {"engine": "numpy"},
+            "compression": {"enabled": True, "ratios": [0.5], "tolerance": 0.05},
+        }
+        TitanicKernelSVMPipeline("pipeline/data/input/train.csv", self.test_ds_path, output_path,
+                                 profiling={"enabled": False}, **options).process()
+        expected = pd.read_csv(f"{output_path}/predictions.csv")
+        service = TitanicScoringService(output_path, max_batch_size=len(self.records), **options).start()
+        try:
+            predictions = pd.DataFrame(service.submit(self.records).result(timeout=30))
+        finally:
+            service.stop()
+        self.assertListEqual(list(predictions.columns), [PASSENGER_ID, SURVIVED, DECISION, PROBABILITY])
+        pd.testing.assert_frame_equal(predictions, expected, check_dtype=False)
+
+    def test_health_endpoint(self):
+        with urllib.request.urlopen(f"{self.url}/health") as response:
+            self.assertEqual(json.loads(response.read()), {"status": "ok"})
+
+
+if __name__ == '__main__':
+    unittest.main()
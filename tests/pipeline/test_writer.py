@@ -0,0 +1,64 @@
+import os
+import gzip
+import shutil
+import unittest
+import numpy as np
+import pandas as pd
+from unittest import mock
+from pipeline.writer import PredictionWriter
+
+
+class TestPredictionWriter(unittest.TestCase):
+    def setUp(self):
+        self.output_path = "tests/pipeline/data/output-writer"
+        shutil.rmtree(self.output_path, ignore_errors=True)
+        os.makedirs(self.output_path)
+        self.frame = pd.DataFrame({"PassengerId": np.arange(892, 1310), "Survived": np.arange(418) % 2})
+
+    def _chunks(self, size=100):
+        return [self.frame[start:start + size] for start in range(0, len(self.frame), size)]
+
+    def test_streamed_csv_matches_to_csv(self):
+        for asynchronous in (False, True):
+            with PredictionWriter(self.output_path, buffer_rows=150, asynchronous=asynchronous) as writer:
+                for chunk in self._chunks():
+                    writer.write(chunk)
+            self.assertEqual(writer.path, os.path.join(self.output_path, "predictions.csv"))
+            self.assertEqual(writer.rows, len(self.frame))
+            pd.testing.assert_frame_equal(pd.read_csv(writer.path), self.frame)
+            self.assertListEqual(os.listdir(self.output_path), ["predictions.csv"])
+
+    def test_compressed_csv_and_parquet(self):
+        with PredictionWriter(self.output_path, compression="gzip", buffer_rows=150) as writer:
+            for chunk in self._chunks():
+                writer.write(chunk)
+        self.assertTrue(writer.path.endswith("predictions.csv.gz"))
+        with gzip.open(writer.path, "rt") as predictions:
+            pd.testing.assert_frame_equal(pd.read_csv(predictions), self.frame)
+
+        with PredictionWriter(self.output_path, fmt="parquet", compression="zstd", buffer_rows=150) as writer:
+            for chunk in self._chunks():
+                writer.write(chunk)
+        self.assertTrue(writer.path.endswith("predictions.parquet"))
+        pd.testing.assert_frame_equal(pd.read_parquet(writer.path), self.frame)
+
+    def test_failed_write_keeps_the_previous_file(self):
+        with PredictionWriter(self.output_path) as writer:
+            writer.write(self.frame)
+        with mock.patch.object(pd.DataFrame, "to_csv", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                with PredictionWriter(self.output_path, buffer_rows=100) as failing:
+                    for chunk in self._chunks():
+                        failing.write(chunk)
+        pd.testing.assert_frame_equal(pd.read_csv(writer.path), self.frame)
+        self.assertListEqual(os.listdir(self.output_path), ["predictions.csv"])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            PredictionWriter(self.output_path, fmt="json")
+        with self.assertRaises(ValueError):
+            PredictionWriter(self.output_path, compression="zstd")
+
+
+if __name__ == '__main__':
+    unittest.main()